@@ -1,14 +1,17 @@
 # backend/api/auth.py
 
 import os
-import requests
+import asyncio
+import aiohttp
 from fastapi import APIRouter, HTTPException, status
 from fastapi.responses import JSONResponse
 import json
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from dotenv import load_dotenv
 from pathlib import Path
 
+from backend.services.client_pool import get_client_pool
+from backend.services.oauth_http import request_json
 from backend.models.oauth import (
     OAuthCallbackRequest, 
     SpotifyTokenResponse, 
@@ -22,6 +25,70 @@ router = APIRouter()
 backend_dir = Path(__file__).parent.parent.resolve()
 load_dotenv(backend_dir / ".env")
 
+_google_client_info: Optional[Dict[str, Any]] = None
+
+
+def load_google_client_info() -> Dict[str, Any]:
+    """
+    Returns the Google OAuth client (client_id, client_secret...) from the client secrets file.
+
+    The file is parsed once; call this at startup so a bad configuration shows up in the logs
+    before the first login.
+
+    Raises:
+        HTTPException: 500 if the file is not configured, missing or malformed.
+    """
+    global _google_client_info
+
+    if _google_client_info is not None:
+        return _google_client_info
+
+    # Load Google client secrets (resolve relative paths to backend_dir)
+    google_secrets_env = os.getenv("YOUTUBE_CLIENT_JSON")
+    if not google_secrets_env:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Google client secrets file not configured"
+        )
+
+    client_json_path = Path(google_secrets_env)
+    if not client_json_path.is_absolute():
+        client_json_path = backend_dir / client_json_path
+
+    if not client_json_path.exists():
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Google client secrets file not found: {client_json_path}"
+        )
+
+    with open(client_json_path, 'r', encoding='utf-8') as f:
+        google_secrets = json.load(f)
+
+    client_info = google_secrets.get("web") or google_secrets.get("installed")
+    if not client_info:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Invalid Google client secrets format"
+        )
+
+    _google_client_info = client_info
+    return client_info
+
+
+def _unreachable(provider: str, e: Exception) -> HTTPException:
+    reason = "timed out" if isinstance(e, asyncio.TimeoutError) else str(e)
+    return HTTPException(
+        status_code=status.HTTP_502_BAD_GATEWAY,
+        detail=f"Could not reach {provider}: {reason}"
+    )
+
+
+def _missing_token(provider: str, response_text: str) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_502_BAD_GATEWAY,
+        detail=f"{provider} token exchange returned no access token: {response_text[:200]}"
+    )
+
 @router.post("/spotify/callback", response_model=SpotifyTokenResponse)
 async def spotify_oauth_callback(request: OAuthCallbackRequest):
     """
@@ -50,28 +117,33 @@ async def spotify_oauth_callback(request: OAuthCallbackRequest):
         print(f"[SpotifyOAuth] - Exchanging code for token with Spotify")
         
         # Exchange code for token
-        response = requests.post(token_url, data=token_data)
+        try:
+            status_code, token_response, response_text = await request_json("POST", token_url, data=token_data)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise _unreachable("Spotify", e)
         
-        if not response.ok:
-            error_data = response.json() if response.headers.get('content-type') == 'application/json' else {}
-            print(f"[SpotifyOAuth] - Token exchange failed: {response.status_code}, {error_data}")
+        if status_code >= 400:
+            print(f"[SpotifyOAuth] - Token exchange failed: {status_code}, {token_response}")
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Spotify token exchange failed: {error_data.get('error_description', response.text)}"
+                detail=f"Spotify token exchange failed: {token_response.get('error_description', response_text)}"
             )
         
-        token_response = response.json()
+        if "access_token" not in token_response:
+            print(f"[SpotifyOAuth] - Token exchange returned no access token: {response_text[:200]}")
+            raise _missing_token("Spotify", response_text)
+        
         print(f"[SpotifyOAuth] - Token exchange successful")
         
         # Get user info using the access token
         user_info = None
         try:
-            user_response = requests.get(
+            user_status, user_data, _ = await request_json(
+                "GET",
                 "https://api.spotify.com/v1/me",
                 headers={"Authorization": f"Bearer {token_response['access_token']}"}
             )
-            if user_response.ok:
-                user_data = user_response.json()
+            if user_status < 400:
                 user_info = {
                     "id": user_data["id"],
                     "name": user_data["display_name"],
@@ -113,33 +185,7 @@ async def youtube_oauth_callback(request: OAuthCallbackRequest):
     try:
         print(f"[YouTubeOAuth] - Received callback request: code={request.code[:10]}..., redirect_uri={request.redirect_uri}")
         
-        # Load Google client secrets (resolve relative paths to backend_dir)
-        google_secrets_env = os.getenv("YOUTUBE_CLIENT_JSON")
-        if not google_secrets_env:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Google client secrets file not configured"
-            )
-
-        client_json_path = Path(google_secrets_env)
-        if not client_json_path.is_absolute():
-            client_json_path = backend_dir / client_json_path
-
-        if not client_json_path.exists():
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Google client secrets file not found: {client_json_path}"
-            )
-
-        with open(client_json_path, 'r', encoding='utf-8') as f:
-            google_secrets = json.load(f)
-        
-        client_info = google_secrets.get("web") or google_secrets.get("installed")
-        if not client_info:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Invalid Google client secrets format"
-            )
+        client_info = load_google_client_info()
         
         # Google token exchange endpoint
         token_url = "https://oauth2.googleapis.com/token"
@@ -156,28 +202,33 @@ async def youtube_oauth_callback(request: OAuthCallbackRequest):
         print(f"[YouTubeOAuth] - Exchanging code for token with Google")
         
         # Exchange code for token
-        response = requests.post(token_url, data=token_data)
+        try:
+            status_code, token_response, response_text = await request_json("POST", token_url, data=token_data)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise _unreachable("Google", e)
         
-        if not response.ok:
-            error_data = response.json() if response.headers.get('content-type') == 'application/json' else {}
-            print(f"[YouTubeOAuth] - Token exchange failed: {response.status_code}, {error_data}")
+        if status_code >= 400:
+            print(f"[YouTubeOAuth] - Token exchange failed: {status_code}, {token_response}")
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Google token exchange failed: {error_data.get('error_description', response.text)}"
+                detail=f"Google token exchange failed: {token_response.get('error_description', response_text)}"
             )
         
-        token_response = response.json()
+        if "access_token" not in token_response:
+            print(f"[YouTubeOAuth] - Token exchange returned no access token: {response_text[:200]}")
+            raise _missing_token("Google", response_text)
+        
         print(f"[YouTubeOAuth] - Token exchange successful")
         
         # Get user info using the access token
         user_info = None
         try:
-            user_response = requests.get(
+            user_status, user_data, _ = await request_json(
+                "GET",
                 "https://www.googleapis.com/oauth2/v2/userinfo",
                 headers={"Authorization": f"Bearer {token_response['access_token']}"}
             )
-            if user_response.ok:
-                user_data = user_response.json()
+            if user_status < 400:
                 user_info = {
                     "id": user_data["id"],
                     "name": user_data["name"],
@@ -227,4 +278,15 @@ async def auth_status():
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to check auth status: {str(e)}"
-        )
\ No newline at end of file
+        )
+
+
+@router.get("/clients/stats")
+def client_pool_stats() -> dict:
+    """
+    Returns the number of pooled Spotify/YouTube clients with hit, eviction and token refresh counters.
+
+    Returns:
+        dict: Client pool statistics for this server process.
+    """
+    return get_client_pool().stats()
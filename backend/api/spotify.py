@@ -6,6 +6,11 @@ from backend.services.spotify_api import (
     api_search_track,
     api_add_tracks_from_titles
 )
+from backend.services.search_cache import get_search_cache
+from backend.services.query_planner import get_query_planner
+from backend.services.track_mapping import get_track_mapping_store
+from backend.services.track_index import get_track_index
+from backend.services.playlist_directory import get_playlist_directory
 
 router = APIRouter()
 
@@ -116,3 +121,58 @@ def add_tracks_from_titles(
     sp = get_spotify_client()
     result = api_add_tracks_from_titles(sp, playlist_id, titles)
     return result
+
+
+@router.get("/search-cache/stats")
+def search_cache_stats() -> dict:
+    """
+    Returns hit/miss counters and size of the persistent Spotify search cache.
+
+    Returns:
+        dict: Cache statistics for this server process.
+    """
+    return get_search_cache().stats()
+
+
+@router.get("/planner/stats")
+def query_planner_stats() -> dict:
+    """
+    Returns search strategy statistics, including searches per matched track.
+
+    Returns:
+        dict: Query planner counters for this server process.
+    """
+    return get_query_planner().stats()
+
+
+@router.get("/track-mappings/stats")
+def track_mapping_stats() -> dict:
+    """
+    Returns lookup counters and size of the persistent video -> track mapping store.
+
+    Returns:
+        dict: Mapping store statistics for this server process.
+    """
+    return get_track_mapping_store().stats()
+
+
+@router.get("/track-index/stats")
+def track_index_stats() -> dict:
+    """
+    Returns lookup counters and size of the local index of previously seen Spotify tracks.
+
+    Returns:
+        dict: Track index statistics for this server process.
+    """
+    return get_track_index().stats()
+
+
+@router.get("/playlist-directory/stats")
+def playlist_directory_stats() -> dict:
+    """
+    Returns the number of cached users and playlists with directory load and hit counters.
+
+    Returns:
+        dict: Playlist directory statistics for this server process.
+    """
+    return get_playlist_directory().stats()
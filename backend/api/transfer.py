@@ -1,29 +1,44 @@
 # backend/api/transfer.py (updated)
-from fastapi import APIRouter, HTTPException
-from backend.services.youtube_api import get_authenticated_service
+import base64
+import binascii
+from functools import partial
+from typing import Iterator, List, Optional
+from fastapi import APIRouter, HTTPException, Query, WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse
+from backend.services.youtube_api import get_authenticated_service, extract_playlist_id
 from backend.services.spotify_api import get_spotify_client
 from backend.services.transfer_api import transfer_playlist_api
-from backend.models.transfer import TransferRequest, TransferResponse
+from backend.services.transfer_jobs import TransferQueueFullError, get_transfer_job_manager, job_events
+from backend.models.records import SongRecord
+from backend.models.transfer import SongResultPage, TransferRequest, TransferJobResponse
 
 router = APIRouter(tags=["Transfer"])
 
-@router.post("/", response_model=TransferResponse)
-def transfer_playlist(request: TransferRequest) -> TransferResponse:
+# Song results per page of GET /transfer/{job_id}/songs
+DEFAULT_SONGS_PAGE_SIZE = 100
+MAX_SONGS_PAGE_SIZE = 1000
+# Song results serialized per chunk of the NDJSON stream
+NDJSON_BATCH_SIZE = 100
+
+@router.post("/", response_model=TransferJobResponse, status_code=202)
+def transfer_playlist(request: TransferRequest) -> TransferJobResponse:
     """
-    Transfers a YouTube playlist to Spotify with complete metadata.
+    Starts transferring a YouTube playlist to Spotify in the background.
     
-    This endpoint:
+    The transfer runs as a job:
     - Extracts all videos from the YouTube playlist
     - Searches for each song on Spotify
     - Creates a new Spotify playlist
     - Adds found songs to the playlist
-    - Returns detailed results for each song
+    
+    Stream GET /transfer/{job_id}/events (SSE) for live progress and per-song results,
+    or poll GET /transfer/{job_id} for its progress and, once done, the detailed results.
     
     Args:
         request: Transfer request with playlist URL, name, and settings
         
     Returns:
-        TransferResponse: Complete transfer results with song details, timing, and statistics
+        TransferJobResponse: The queued job (202), or 429 with Retry-After when the server is at capacity
     """
     
     # Get authenticated services
@@ -35,27 +50,200 @@ def transfer_playlist(request: TransferRequest) -> TransferResponse:
     if not sp:
         raise HTTPException(status_code=500, detail="Spotify API client not authenticated")
 
+    # Reject a bad URL now rather than as a failed job
     try:
-        # Perform the transfer with complete metadata
-        result = transfer_playlist_api(
-            youtube=youtube,
-            sp=sp,
-            playlist_url=str(request.playlist_url),
-            playlist_name=request.playlist_name,
-            is_public=request.is_public,
-            description=request.description or "",
-        )
-        
-        return result
-        
+        extract_playlist_id(str(request.playlist_url))
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Transfer failed: {str(e)}")
+
+    transfer = partial(
+        transfer_playlist_api,
+        youtube=youtube,
+        sp=sp,
+        playlist_url=str(request.playlist_url),
+        playlist_name=request.playlist_name,
+        is_public=request.is_public,
+        description=request.description or "",
+        concurrency=request.concurrency,
+        incremental=request.incremental,
+    )
+
+    try:
+        job = get_transfer_job_manager().submit(lambda progress, on_song: transfer(progress=progress, on_song=on_song))
+    except TransferQueueFullError as e:
+        raise HTTPException(status_code=429, detail=str(e), headers={"Retry-After": str(e.retry_after)})
+
+    return job.to_response()
 
 
 # Simple health check endpoint
 @router.get("/health")
 def health_check():
     """Health check endpoint to verify the service is running."""
-    return {"status": "healthy", "service": "playlist-transfer"}
\ No newline at end of file
+    return {"status": "healthy", "service": "playlist-transfer"}
+
+
+@router.get("/jobs/stats")
+def transfer_job_stats() -> dict:
+    """
+    Returns the transfer worker pool size and the number of jobs per status.
+
+    Returns:
+        dict: Job manager statistics for this server process.
+    """
+    return get_transfer_job_manager().stats()
+
+
+# Declared after the fixed paths above, which it would otherwise shadow
+@router.get("/{job_id}", response_model=TransferJobResponse)
+def get_transfer(job_id: str, include_songs: bool = True) -> TransferJobResponse:
+    """
+    Returns the status and progress of a transfer job, with its results once finished.
+
+    Args:
+        job_id: Id returned by POST /transfer/
+        include_songs: False to get the result summary without its songs (page them with
+            GET /transfer/{job_id}/songs instead)
+
+    Returns:
+        TransferJobResponse: Job status, progress counters and, when done, the TransferResponse
+    """
+    job = get_transfer_job_manager().get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Transfer job not found (unknown or expired)")
+    return job.to_response(include_songs=include_songs)
+
+
+def _encode_cursor(offset: int) -> str:
+    return base64.urlsafe_b64encode(f"offset:{offset}".encode()).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> int:
+    try:
+        decoded = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        prefix, offset = decoded.split(":", 1)
+        if prefix != "offset" or int(offset) < 0:
+            raise ValueError(decoded)
+        return int(offset)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def _finished_songs(job_id: str) -> List[SongRecord]:
+    """
+    Returns the song results of a finished job (404 when unknown, 409 while still running).
+    """
+    job = get_transfer_job_manager().get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Transfer job not found (unknown or expired)")
+    if not job.finished:
+        raise HTTPException(
+            status_code=409,
+            detail="Transfer still running, stream GET /transfer/{job_id}/events for live results"
+        )
+    return job.result.songs if job.result else []
+
+
+@router.get("/{job_id}/songs", response_model=SongResultPage)
+def get_transfer_songs(
+    job_id: str,
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_SONGS_PAGE_SIZE, ge=1, le=MAX_SONGS_PAGE_SIZE)
+) -> SongResultPage:
+    """
+    Returns one page of a finished transfer's song results, in playlist order.
+
+    Args:
+        job_id: Id returned by POST /transfer/
+        cursor: next_cursor of the previous page (omit for the first page)
+        limit: Song results per page
+
+    Returns:
+        SongResultPage: The songs of the page and the cursor of the next one
+    """
+    songs = _finished_songs(job_id)
+    offset = _decode_cursor(cursor) if cursor else 0
+    end = offset + limit
+
+    return SongResultPage(
+        job_id=job_id,
+        songs=[song.to_result() for song in songs[offset:end]],
+        total=len(songs),
+        next_cursor=_encode_cursor(end) if end < len(songs) else None,
+    )
+
+
+@router.get("/{job_id}/songs.ndjson")
+def stream_transfer_songs(job_id: str) -> StreamingResponse:
+    """
+    Streams a finished transfer's song results as NDJSON, one SongResult per line.
+
+    Songs are serialized as they are sent, so the response starts right away and never
+    exists as a whole in memory, however long the playlist.
+
+    Args:
+        job_id: Id returned by POST /transfer/
+
+    Returns:
+        StreamingResponse: application/x-ndjson body
+    """
+    songs = _finished_songs(job_id)
+
+    def lines() -> Iterator[str]:
+        for start in range(0, len(songs), NDJSON_BATCH_SIZE):
+            yield "".join(song.to_result().model_dump_json() + "\n" for song in songs[start:start + NDJSON_BATCH_SIZE])
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
+@router.get("/{job_id}/events")
+async def stream_transfer_events(job_id: str) -> StreamingResponse:
+    """
+    Streams a transfer job's events as Server-Sent Events.
+
+    - progress: stage, counters, elapsed seconds and videos per second (every second)
+    - song: a SongResult, as soon as its video is resolved
+    - done: the final TransferJobResponse with the result summary (songs are paged through
+      GET /transfer/{job_id}/songs), after which the stream ends
+
+    Args:
+        job_id: Id returned by POST /transfer/
+
+    Returns:
+        StreamingResponse: text/event-stream of the job's events
+    """
+    job = get_transfer_job_manager().get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Transfer job not found (unknown or expired)")
+
+    async def event_stream():
+        async for event, data in job_events(job):
+            yield f"event: {event}\ndata: {data}\n\n"
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        # Proxies must not buffer the stream, or events arrive in bursts
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.websocket("/{job_id}/ws")
+async def transfer_events_websocket(websocket: WebSocket, job_id: str):
+    """
+    Same events as GET /transfer/{job_id}/events, as {"event": ..., "data": ...} WebSocket messages.
+
+    Closes with code 4404 when the job is unknown or expired.
+    """
+    job = get_transfer_job_manager().get(job_id)
+    await websocket.accept()
+    if job is None:
+        await websocket.close(code=4404, reason="Transfer job not found (unknown or expired)")
+        return
+
+    try:
+        async for event, data in job_events(job):
+            await websocket.send_text(f'{{"event": "{event}", "data": {data}}}')
+        await websocket.close()
+    except WebSocketDisconnect:
+        pass
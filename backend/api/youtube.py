@@ -5,6 +5,7 @@ from backend.services.youtube_api import (
     get_video_titles_from_playlist,
     extract_playlist_id
 )
+from backend.services.youtube_cache import get_youtube_page_cache
 
 
 router = APIRouter()
@@ -42,3 +43,14 @@ def fetch_titles(
         return {"status": "success", "titles": titles}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/page-cache/stats", tags=["YouTube"])
+def page_cache_stats() -> dict:
+    """
+    Returns download and ETag revalidation counters of the YouTube page cache.
+
+    Returns:
+        dict: Page cache statistics for this server process.
+    """
+    return get_youtube_page_cache().stats()
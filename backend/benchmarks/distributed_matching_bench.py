@@ -0,0 +1,215 @@
+"""
+Benchmark and end-to-end check of distributed matching, against an in-process fakeredis.
+
+Match workers run in threads, each with its own fakeredis client on a shared server, and
+the Spotify searches are replaced by a matcher that sleeps like a remote search would.
+Every scenario checks that the coordinator returns one result per playlist entry, in
+playlist order, duplicates included:
+- throughput with 1, 2 and 4 workers;
+- a worker failing on a chunk (its error result makes the coordinator requeue it at once);
+- a worker stuck on a chunk (requeued once `chunk_timeout` expires, its late result ignored);
+- a chunk failing on every attempt (DistributedMatchError after `chunk_attempts`).
+
+Needs fakeredis (pip install fakeredis). The mapping store is written to a temporary cache
+directory.
+
+Run with:
+    python -m backend.benchmarks.distributed_matching_bench [video_count]
+"""
+
+import os
+import sys
+import time
+import asyncio
+import tempfile
+import threading
+
+# Matches are recorded in the mapping store: keep them out of the real cache
+os.environ["SYNCWAVE_CACHE_DIR"] = tempfile.mkdtemp(prefix="syncwave-bench-")
+
+from typing import List, Optional, Set
+from backend.models.records import SpotifyTrack, YouTubeVideo
+from backend.services import distributed_matching
+from backend.services.distributed_matching import DistributedMatchError, RedisMatchQueue
+
+VIDEO_COUNT = 2_000
+# Playlist of the failure scenarios: its chunks all finish well within CHUNK_TIMEOUT
+FAILURE_VIDEO_COUNT = 200
+# Every tenth playlist entry repeats an earlier video
+DUPLICATE_EVERY = 10
+CHUNK_SIZE = 25
+# Seconds per (simulated) search, and searches in flight per worker
+SEARCH_LATENCY = 0.01
+WORKER_CONCURRENCY = 8
+# The timeout counts from dispatch, queueing included: long for the throughput runs, short
+# enough for the stuck chunk scenario to finish quickly
+THROUGHPUT_CHUNK_TIMEOUT = 60.0
+CHUNK_TIMEOUT = 1.0
+CHUNK_ATTEMPTS = 3
+
+
+def make_playlist(prefix: str, video_count: int) -> List[YouTubeVideo]:
+    videos = []
+    for index in range(video_count):
+        if index and index % DUPLICATE_EVERY == 0:
+            videos.append(videos[index // 2])
+        else:
+            videos.append(YouTubeVideo(video_id=f"{prefix}{index}", title=f"Artist {index} - Song {index}"))
+    return videos
+
+
+def expected_track_id(youtube_video: YouTubeVideo) -> Optional[str]:
+    # Every seventh video has no match on Spotify
+    index = int(youtube_video.title.rsplit(" ", 1)[1])
+    return None if index % 7 == 0 else f"track_{youtube_video.video_id}"
+
+
+class FakeMatcher:
+    """
+    Stands in for api_match_videos_async: sleeps like `concurrency` parallel searches, then
+    matches each video to a track derived from its id. Chunks containing a video of
+    `failing` raise, `failures` times in all (every time when None); the first chunk
+    containing a video of `stalling` takes longer than the chunk timeout.
+    """
+
+    def __init__(
+        self,
+        failing: Set[str] = frozenset(),
+        failures: Optional[int] = 1,
+        stalling: Set[str] = frozenset()
+    ):
+        self.failing = failing
+        self.failures = failures
+        self.stalling = stalling
+        self.failed = 0
+        self.stalled = 0
+        self.chunks = 0
+        self._lock = threading.Lock()
+
+    async def __call__(self, sp, youtube_videos: List[YouTubeVideo], concurrency: int) -> List[Optional[SpotifyTrack]]:
+        with self._lock:
+            self.chunks += 1
+            if any(video.video_id in self.failing for video in youtube_videos):
+                if self.failures is None or self.failed < self.failures:
+                    self.failed += 1
+                    raise RuntimeError("simulated worker failure")
+            stall = not self.stalled and any(video.video_id in self.stalling for video in youtube_videos)
+            if stall:
+                self.stalled += 1
+
+        if stall:
+            await asyncio.sleep(CHUNK_TIMEOUT * 1.5)
+        await asyncio.sleep(SEARCH_LATENCY * len(youtube_videos) / concurrency)
+        tracks = []
+        for video in youtube_videos:
+            track_id = expected_track_id(video)
+            tracks.append(SpotifyTrack(track_id, video.title, "Artist", f"https://open.spotify.com/track/{track_id}") if track_id else None)
+        return tracks
+
+
+def run(
+    server,
+    playlist: List[YouTubeVideo],
+    workers: int,
+    matcher: FakeMatcher,
+    chunk_timeout: float = CHUNK_TIMEOUT
+) -> float:
+    """
+    Matches the playlist with `workers` worker threads and checks the results.
+
+    Returns:
+        float: Seconds taken by the coordinator.
+    """
+
+    import fakeredis
+
+    distributed_matching.api_match_videos_async = matcher
+    coordinator = RedisMatchQueue(
+        fakeredis.FakeRedis(server=server),
+        chunk_size=CHUNK_SIZE,
+        chunk_timeout=chunk_timeout,
+        chunk_attempts=CHUNK_ATTEMPTS,
+    )
+
+    stop = threading.Event()
+    threads = []
+    for _ in range(workers):
+        queue = RedisMatchQueue(fakeredis.FakeRedis(server=server))
+        thread = threading.Thread(
+            target=queue.run_worker, args=(None, WORKER_CONCURRENCY, stop, 0.1), daemon=True
+        )
+        thread.start()
+        threads.append(thread)
+
+    try:
+        # Two pages, so chunks are dispatched while the playlist is still streaming in
+        middle = len(playlist) // 2
+        resolved = []
+        start = time.perf_counter()
+        youtube_videos, tracks = coordinator.match_pages(
+            [playlist[:middle], playlist[middle:]],
+            on_resolved=lambda position, video, track: resolved.append(position),
+        )
+        seconds = time.perf_counter() - start
+    finally:
+        stop.set()
+        for thread in threads:
+            thread.join()
+
+    assert youtube_videos == playlist
+    assert [track.track_id if track else None for track in tracks] == [expected_track_id(video) for video in playlist]
+    assert sorted(resolved) == list(range(len(playlist)))
+    assert coordinator.live_workers() == 0
+    return seconds
+
+
+def main() -> None:
+    try:
+        import fakeredis
+    except ImportError:
+        raise SystemExit("This benchmark needs fakeredis: pip install fakeredis")
+
+    video_count = int(sys.argv[1]) if len(sys.argv) > 1 else VIDEO_COUNT
+    chunks = -(-len({video.video_id for video in make_playlist("x", video_count)}) // CHUNK_SIZE)
+    print(f"Videos: {video_count} ({chunks} chunks of {CHUNK_SIZE}), {SEARCH_LATENCY * 1000:.0f} ms per search, "
+          f"{WORKER_CONCURRENCY} searches in flight per worker")
+
+    # Throughput
+    baseline = None
+    for workers in (1, 2, 4):
+        server = fakeredis.FakeServer()
+        seconds = run(
+            server, make_playlist(f"w{workers}-", video_count), workers, FakeMatcher(), THROUGHPUT_CHUNK_TIMEOUT
+        )
+        baseline = baseline or seconds
+        print(f"{workers} worker(s): {seconds:6.2f}s  {video_count / seconds:8.0f} videos/s  ({baseline / seconds:.2f}x)")
+
+    # A worker fails on one chunk: its error result gets the chunk requeued without waiting
+    playlist = make_playlist("error-", FAILURE_VIDEO_COUNT)
+    matcher = FakeMatcher(failing={playlist[0].video_id})
+    seconds = run(fakeredis.FakeServer(), playlist, 2, matcher)
+    assert matcher.failed == 1 and seconds < CHUNK_TIMEOUT
+    print(f"Worker error, chunk requeued:        {seconds:6.2f}s")
+
+    # A worker is stuck on a chunk: it is requeued once the chunk timeout expires, and the
+    # stuck worker's late result is dropped as a duplicate
+    playlist = make_playlist("stuck-", FAILURE_VIDEO_COUNT)
+    matcher = FakeMatcher(stalling={playlist[0].video_id})
+    seconds = run(fakeredis.FakeServer(), playlist, 2, matcher)
+    assert matcher.stalled == 1 and seconds >= CHUNK_TIMEOUT
+    print(f"Stuck chunk, requeued after timeout: {seconds:6.2f}s")
+
+    # A chunk fails on every attempt: the transfer gets an error instead of waiting forever
+    playlist = make_playlist("fatal-", FAILURE_VIDEO_COUNT)
+    matcher = FakeMatcher(failing={playlist[0].video_id}, failures=None)
+    try:
+        run(fakeredis.FakeServer(), playlist, 2, matcher)
+    except DistributedMatchError as e:
+        assert matcher.failed == CHUNK_ATTEMPTS
+        print(f"Failing chunk: {e}")
+    else:
+        raise AssertionError("a chunk failing on every attempt did not fail the run")
+
+
+if __name__ == "__main__":
+    main()
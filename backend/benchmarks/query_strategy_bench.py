@@ -0,0 +1,220 @@
+"""
+Benchmark for fielded (track:/artist:) Spotify queries.
+
+Matches synthetic YouTube titles against a simulated Spotify search over a synthetic
+catalog (each song has covers, live versions, remixes and karaoke versions under the
+same name) with the search plan with and without the "fielded" strategy, and reports
+searches per matched track, response bytes and how many matches are the right track.
+
+Free-text searches return the tracks sharing the most query words; fielded searches only
+return tracks whose name and artist contain the quoted phrases, like Spotify does.
+Responses are padded to the size of real track objects (available_markets, images).
+
+Run with:
+    python -m backend.benchmarks.query_strategy_bench [song_count]
+"""
+
+import re
+import sys
+import json
+import random
+import time
+from collections import Counter, defaultdict
+from typing import Any, Dict, List, Optional, Tuple
+from backend.services.match_scoring import CandidateScorer
+from backend.services.query_planner import DEFAULT_LIMITS
+from backend.services.spotify_api import (
+    HIGH_CONFIDENCE,
+    MINIMUM_CONFIDENCE,
+    PRECISE_MATCH_CONFIDENCE,
+    PRECISE_STRATEGIES,
+    generate_search_plan,
+)
+from backend.services.title_parser import parse_title
+
+SYLLABLES = "ka lo mi ra ne so tu vi da re lu ma zo fi ya be no ti sa ke".split()
+# A few thousand made-up words, so posting lists are as selective as real catalog terms
+WORDS = sorted({a + b + c for a in SYLLABLES for b in SYLLABLES for c in ("", "n", "s", "la")})
+
+TITLE_FORMATS = (
+    "{artist} - {song} [Official Video]",
+    "{artist} - {song} (Official Audio)",
+    "{artist} - {song} (Lyrics)",
+    "{artist} – {song}",
+    "{song} - {artist}",
+    "{artist}: {song}",
+    "{song} (Official Music Video)",
+)
+
+MARKETS = [f"{chr(65 + i // 26)}{chr(65 + i % 26)}" for i in range(185)]
+_WORD = re.compile(r"[a-z0-9]+")
+_FIELDED = re.compile(r'track:"([^"]*)" artist:"([^"]*)"')
+
+
+def words(text: str) -> List[str]:
+    return _WORD.findall(text.lower())
+
+
+class SimulatedSpotify:
+    """
+    In-memory stand-in for the Spotify search endpoint.
+    """
+
+    def __init__(self, tracks: List[Dict[str, Any]]):
+        self.tracks = tracks
+        self.postings = defaultdict(list)
+        for position, track in enumerate(tracks):
+            terms = set(words(track["name"])) | {term for artist in track["artists"] for term in words(artist["name"])}
+            for term in terms:
+                self.postings[term].append(position)
+
+    @staticmethod
+    def _contains(track: Dict[str, Any], name_terms: List[str], artist_terms: List[str]) -> bool:
+        name = words(track["name"])
+        return all(term in name for term in name_terms) and any(
+            all(term in words(artist["name"]) for term in artist_terms) for artist in track["artists"]
+        )
+
+    def _ranked(self, positions, limit: int) -> List[Dict[str, Any]]:
+        ranked = sorted(positions, key=lambda position: -self.tracks[position]["popularity"])
+        return [self.tracks[position] for position in ranked[:limit]]
+
+    def search(self, q: str, limit: int) -> Dict[str, Any]:
+        fielded = _FIELDED.fullmatch(q)
+        if fielded:
+            name_terms, artist_terms = words(fielded.group(1)), words(fielded.group(2))
+            matches = [
+                position for position in self.postings.get(name_terms[0] if name_terms else "", ())
+                if self._contains(self.tracks[position], name_terms, artist_terms)
+            ]
+            items = self._ranked(matches, limit)
+        else:
+            terms = words(q)
+            counts = Counter(position for term in set(terms) for position in self.postings.get(term, ()))
+            needed = max(1, len(set(terms)) // 2)
+            best = sorted(
+                (position for position, count in counts.items() if count >= needed),
+                key=lambda position: (-counts[position], -self.tracks[position]["popularity"])
+            )
+            items = [self.tracks[position] for position in best[:limit]]
+        return {"tracks": {"items": items, "limit": limit, "total": len(items)}}
+
+
+def make_track(track_id: int, name: str, artist: str, rng: random.Random) -> Dict[str, Any]:
+    return {
+        "id": f"track{track_id}",
+        "name": name,
+        "artists": [{"name": artist, "id": f"artist-{artist.lower().replace(' ', '-')}", "type": "artist"}],
+        "album": {
+            "name": f"{rng.choice(WORDS).title()} Album",
+            "images": [{"url": f"https://i.scdn.co/image/{track_id}{size}", "height": size, "width": size} for size in (640, 300, 64)],
+            "available_markets": MARKETS,
+        },
+        "available_markets": MARKETS,
+        "external_urls": {"spotify": f"https://open.spotify.com/track/track{track_id}"},
+        "preview_url": None,
+        "duration_ms": rng.randint(150_000, 280_000),
+        "popularity": rng.randint(0, 100),
+    }
+
+
+def make_catalog(song_count: int, rng: random.Random) -> Tuple[List[Dict[str, Any]], List[Tuple[str, str]]]:
+    """
+    Builds the catalog and the (title, expected track id) pairs to match.
+    """
+
+    tracks = []
+    titles = []
+    for song in range(song_count):
+        artist = f"{rng.choice(WORDS).title()} {rng.choice(WORDS).title()}"
+        name = " ".join(rng.choice(WORDS) for _ in range(rng.randint(1, 3))).title()
+
+        original = make_track(len(tracks), name, artist, rng)
+        tracks.append(original)
+        for version, version_artist in (
+            (name, f"{rng.choice(WORDS).title()} Covers"),
+            (name, f"{rng.choice(WORDS).title()} {rng.choice(WORDS).title()}"),
+            (f"{name} - Live", artist),
+            (f"{name} - Remix", artist),
+            (f"{name} (Karaoke Version)", "Karaoke Hits"),
+            (f"{name} (Piano Version)", "Piano Tribute Players"),
+        ):
+            tracks.append(make_track(len(tracks), version, version_artist, rng))
+        for _ in range(3):
+            other = " ".join(rng.choice(WORDS) for _ in range(rng.randint(1, 3))).title()
+            tracks.append(make_track(len(tracks), other, artist, rng))
+
+        title = rng.choice(TITLE_FORMATS).format(artist=artist, song=name)
+        titles.append((title, original["id"]))
+
+    return tracks, titles
+
+
+def run(spotify: SimulatedSpotify, titles: List[Tuple[str, str]], fielded: bool) -> Dict[str, float]:
+    searches = 0
+    response_bytes = 0
+    matches = 0
+    correct = 0
+
+    for title, expected_id in titles:
+        parsed = parse_title(title)
+        scorer = CandidateScorer(parsed)
+        best: Optional[Dict[str, Any]] = None
+        best_confidence = 0.0
+        winner = None
+
+        for strategy, query in generate_search_plan(parsed):
+            if strategy == "fielded" and not fielded:
+                continue
+
+            results = spotify.search(query, DEFAULT_LIMITS.get(strategy, 10))
+            searches += 1
+            response_bytes += len(json.dumps(results, separators=(",", ":")))
+
+            tracks = results["tracks"]["items"]
+            for track, confidence in zip(tracks, scorer.score_batch(tracks)):
+                if confidence > best_confidence and confidence >= MINIMUM_CONFIDENCE:
+                    best, best_confidence, winner = track, confidence, strategy
+                    if confidence >= HIGH_CONFIDENCE:
+                        break
+            # Same stopping rule as _SearchOutcome.is_final
+            if best_confidence >= HIGH_CONFIDENCE or (winner in PRECISE_STRATEGIES and best_confidence >= PRECISE_MATCH_CONFIDENCE):
+                break
+
+        if best:
+            matches += 1
+            correct += best["id"] == expected_id
+
+    return {
+        "searches": searches,
+        "matches": matches,
+        "correct": correct,
+        "searches_per_match": searches / matches if matches else 0.0,
+        "bytes_per_search": response_bytes / searches if searches else 0.0,
+        "bytes_per_match": response_bytes / matches if matches else 0.0,
+    }
+
+
+def main() -> None:
+    song_count = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000
+    rng = random.Random(11)
+
+    tracks, titles = make_catalog(song_count, rng)
+    spotify = SimulatedSpotify(tracks)
+    print(f"Catalog: {len(tracks)} tracks, {len(titles)} titles")
+
+    for label, fielded in (("Free-text only", False), ("With fielded", True)):
+        start = time.perf_counter()
+        stats = run(spotify, titles, fielded)
+        seconds = time.perf_counter() - start
+        print(
+            f"{label:15s} searches/match {stats['searches_per_match']:5.2f}  "
+            f"KB/search {stats['bytes_per_search'] / 1024:6.1f}  "
+            f"KB/match {stats['bytes_per_match'] / 1024:6.1f}  "
+            f"matched {stats['matches']}/{len(titles)} (correct {stats['correct']})  "
+            f"{seconds:5.2f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
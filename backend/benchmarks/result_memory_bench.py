@@ -0,0 +1,327 @@
+"""
+Memory benchmark for the representation of transfer results.
+
+Runs a synthetic playlist through the allocation pattern of the matching pipeline twice:
+- former representation: Pydantic YouTubeVideo, SpotifyTrack and SongResult models per
+  video, full Spotify track objects (album, artist objects, market lists) kept while the
+  video's searches are in flight;
+- compact records: slotted YouTubeVideo, SpotifyTrack and SongRecord dataclasses, search
+  responses compacted on arrival, SongResults only built per response page.
+
+Reports the memory a transfer retains (tracemalloc), its allocated blocks and time, the
+memory of the search responses alive while a wave of videos is searched, then the cost of
+answering one page and of streaming every result as NDJSON.
+
+Run with:
+    python -m backend.benchmarks.result_memory_bench [video_count]
+"""
+
+import gc
+import sys
+import json
+import random
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from pydantic import BaseModel
+from backend.benchmarks.query_strategy_bench import MARKETS, WORDS
+from backend.models.records import SongRecord, YouTubeVideo
+from backend.models.transfer import SongResult
+from backend.services.spotify_api import _build_spotify_track, _compact_search_results
+
+VIDEO_COUNT = 10_000
+# Videos searched at the same time (their search responses are alive together)
+CONCURRENCY = 10
+# Searches per video and tracks per search: up to 60 candidates per video
+SEARCHES_PER_VIDEO = 3
+TRACKS_PER_SEARCH = 20
+MATCH_RATE = 0.8
+PAGE_SIZE = 100
+# Distinct search responses; each one is parsed again for every search, like a fresh response
+RESPONSE_TEMPLATES = 40
+
+
+class LegacyYouTubeVideo(BaseModel):
+    video_id: str
+    title: str
+    youtube_url: str
+    thumbnail_url: Optional[str] = None
+    channel_title: Optional[str] = None
+    video_owner_channel: Optional[str] = None
+    playlist_item_id: Optional[str] = None
+    duration_ms: Optional[int] = None
+    skip_reason: Optional[str] = None
+
+
+class LegacySpotifyTrack(BaseModel):
+    track_id: str
+    name: str
+    artist: str
+    album: Optional[str] = None
+    spotify_url: str
+    thumbnail_url: Optional[str] = None
+    preview_url: Optional[str] = None
+    confidence: Optional[float] = None
+
+
+def make_raw_track(track_id: int, rng: random.Random) -> Dict[str, Any]:
+    """
+    Builds a track object shaped like the ones in Spotify search responses.
+    """
+
+    artist_name = f"{rng.choice(WORDS).title()} {rng.choice(WORDS).title()}"
+    artist = {
+        "id": f"artist{track_id}",
+        "name": artist_name,
+        "type": "artist",
+        "uri": f"spotify:artist:artist{track_id}",
+        "href": f"https://api.spotify.com/v1/artists/artist{track_id}",
+        "external_urls": {"spotify": f"https://open.spotify.com/artist/artist{track_id}"},
+    }
+    return {
+        "id": f"track{track_id}",
+        "name": " ".join(rng.choice(WORDS) for _ in range(rng.randint(1, 3))).title(),
+        "artists": [artist],
+        "album": {
+            "id": f"album{track_id}",
+            "name": f"{rng.choice(WORDS).title()} Album",
+            "album_type": "album",
+            "artists": [artist],
+            "images": [{"url": f"https://i.scdn.co/image/{track_id}{size}", "height": size, "width": size} for size in (640, 300, 64)],
+            "available_markets": MARKETS,
+            "release_date": "2019-05-17",
+            "release_date_precision": "day",
+            "total_tracks": 12,
+            "uri": f"spotify:album:album{track_id}",
+            "href": f"https://api.spotify.com/v1/albums/album{track_id}",
+            "external_urls": {"spotify": f"https://open.spotify.com/album/album{track_id}"},
+        },
+        "available_markets": MARKETS,
+        "disc_number": 1,
+        "track_number": rng.randint(1, 12),
+        "duration_ms": rng.randint(150_000, 280_000),
+        "explicit": False,
+        "external_ids": {"isrc": f"USRC1{track_id:07d}"},
+        "external_urls": {"spotify": f"https://open.spotify.com/track/track{track_id}"},
+        "href": f"https://api.spotify.com/v1/tracks/track{track_id}",
+        "uri": f"spotify:track:track{track_id}",
+        "is_local": False,
+        "popularity": rng.randint(0, 100),
+        "preview_url": None,
+        "type": "track",
+    }
+
+
+def make_responses(rng: random.Random) -> List[str]:
+    """
+    Builds the raw JSON bodies of the search responses.
+    """
+
+    responses = []
+    for template in range(RESPONSE_TEMPLATES):
+        items = [make_raw_track(template * TRACKS_PER_SEARCH + rank, rng) for rank in range(TRACKS_PER_SEARCH)]
+        responses.append(json.dumps({"tracks": {"items": items, "limit": TRACKS_PER_SEARCH, "total": 1000}}))
+    return responses
+
+
+def make_playlist(video_count: int, rng: random.Random) -> List[Dict[str, Any]]:
+    """
+    Builds playlistItems-like video data: id, title, thumbnail, channel and whether it matches.
+    """
+
+    return [
+        {
+            "video_id": f"vid{index:07d}",
+            "title": f"{rng.choice(WORDS).title()} - {rng.choice(WORDS).title()} {rng.choice(WORDS)} (Official Video)",
+            "thumbnail_url": f"https://i.ytimg.com/vi/vid{index:07d}/maxresdefault.jpg",
+            "channel": f"{rng.choice(WORDS).title()}VEVO",
+            "playlist_item_id": f"item{index:07d}",
+            "matched": rng.random() < MATCH_RATE,
+        }
+        for index in range(video_count)
+    ]
+
+
+def legacy_video(data: Dict[str, Any]) -> LegacyYouTubeVideo:
+    return LegacyYouTubeVideo(
+        video_id=data["video_id"],
+        title=data["title"],
+        youtube_url=f"https://www.youtube.com/watch?v={data['video_id']}",
+        thumbnail_url=data["thumbnail_url"],
+        channel_title=data["channel"],
+        video_owner_channel=data["channel"],
+        playlist_item_id=data["playlist_item_id"],
+        duration_ms=215_000,
+    )
+
+
+def legacy_song(index: int, video: LegacyYouTubeVideo, best: Optional[Dict[str, Any]]) -> SongResult:
+    track = None
+    if best:
+        track = LegacySpotifyTrack(
+            track_id=best["id"],
+            name=best["name"],
+            artist=best["artists"][0]["name"],
+            album=best["album"]["name"],
+            spotify_url=best["external_urls"]["spotify"],
+            thumbnail_url=best["album"]["images"][0]["url"],
+            preview_url=best.get("preview_url"),
+            confidence=0.92,
+        )
+    return SongResult(
+        id=f"song_{index}",
+        title=track.name if track else video.title,
+        artist=track.artist if track else "Unknown Artist",
+        album=track.album if track else None,
+        thumbnail=track.thumbnail_url if track else video.thumbnail_url,
+        status="success" if track else "failed",
+        spotify_url=track.spotify_url if track else None,
+        spotify_track_id=track.track_id if track else None,
+        youtube_url=video.youtube_url,
+        error=None if track else "Song not found on Spotify or confidence too low",
+        original_youtube_title=video.title,
+        spotify_match_confidence=track.confidence if track else None,
+    )
+
+
+def compact_video(data: Dict[str, Any]) -> YouTubeVideo:
+    return YouTubeVideo(
+        video_id=data["video_id"],
+        title=data["title"],
+        thumbnail_url=data["thumbnail_url"],
+        video_owner_channel=data["channel"],
+        playlist_item_id=data["playlist_item_id"],
+        duration_ms=215_000,
+    )
+
+
+def best_candidate(index: int, searches: List[Dict[str, Any]], matched: bool) -> Optional[Dict[str, Any]]:
+    return searches[-1]["tracks"]["items"][index % TRACKS_PER_SEARCH] if matched else None
+
+
+def run_legacy(playlist: List[Dict[str, Any]], responses: List[Dict[str, Any]]) -> Tuple[List[Any], List[Any]]:
+    """
+    Former pipeline: a model per video, its match and its result, all kept to the end
+    (the videos are returned along with the results, as by api_process_video_pages_to_songs).
+    """
+
+    videos = []
+    songs = []
+    for index, data in enumerate(playlist):
+        video = legacy_video(data)
+        videos.append(video)
+        searches = [responses[(index + search) % len(responses)] for search in range(SEARCHES_PER_VIDEO)]
+        songs.append(legacy_song(index, video, best_candidate(index, searches, data["matched"])))
+    return videos, songs
+
+
+def run_compact(playlist: List[Dict[str, Any]], responses: List[Dict[str, Any]]) -> Tuple[List[Any], List[Any]]:
+    """
+    Current pipeline: compact responses (as fetched or read from the search cache), records
+    referencing each other.
+    """
+
+    videos = []
+    songs = []
+    for index, data in enumerate(playlist):
+        video = compact_video(data)
+        videos.append(video)
+        searches = [responses[(index + search) % len(responses)] for search in range(SEARCHES_PER_VIDEO)]
+        best = best_candidate(index, searches, data["matched"])
+        songs.append(SongRecord(index, video, _build_spotify_track(best, 0.92) if best else None))
+    return videos, songs
+
+
+def in_flight_legacy(bodies: List[str]) -> List[Any]:
+    """
+    Search responses alive while CONCURRENCY videos are searched, kept as parsed.
+    """
+
+    return [
+        [json.loads(bodies[(index + search) % len(bodies)]) for search in range(SEARCHES_PER_VIDEO)]
+        for index in range(CONCURRENCY)
+    ]
+
+
+def in_flight_compact(bodies: List[str]) -> List[Any]:
+    """
+    The same responses, compacted as soon as they are parsed.
+    """
+
+    return [
+        [_compact_search_results(json.loads(bodies[(index + search) % len(bodies)])) for search in range(SEARCHES_PER_VIDEO)]
+        for index in range(CONCURRENCY)
+    ]
+
+
+def measure(run: Callable[..., Any], *args: Any) -> Tuple[Dict[str, float], Any]:
+    gc.collect()
+    blocks = sys.getallocatedblocks()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = run(*args)
+    seconds = time.perf_counter() - start
+    gc.collect()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "seconds": seconds,
+        "peak_mb": peak / 1024 / 1024,
+        "retained_mb": retained / 1024 / 1024,
+        "blocks": sys.getallocatedblocks() - blocks,
+    }, result
+
+
+def main() -> None:
+    video_count = int(sys.argv[1]) if len(sys.argv) > 1 else VIDEO_COUNT
+    rng = random.Random(7)
+    playlist = make_playlist(video_count, rng)
+    bodies = make_responses(rng)
+    responses = [json.loads(body) for body in bodies]
+
+    legacy, legacy_result = measure(run_legacy, playlist, responses)
+    del legacy_result
+    compact, (_, songs) = measure(run_compact, playlist, [_compact_search_results(response) for response in responses])
+    assert len(songs) == video_count
+    legacy_wave, _ = measure(in_flight_legacy, bodies)
+    compact_wave, _ = measure(in_flight_compact, bodies)
+
+    print(f"Videos: {video_count}, {SEARCHES_PER_VIDEO * TRACKS_PER_SEARCH} candidates each, {CONCURRENCY} searched at once")
+    print(f"{'':24}{'retained MB':>13}{'blocks':>12}{'time':>9}{'in flight MB':>15}{'time':>9}")
+    for label, stats, wave in (("Pydantic + raw tracks", legacy, legacy_wave), ("Compact records", compact, compact_wave)):
+        print(
+            f"{label:24}{stats['retained_mb']:13.1f}{stats['blocks']:12,}{stats['seconds']:8.2f}s"
+            f"{wave['retained_mb']:15.1f}{wave['seconds'] * 1000:7.0f}ms"
+        )
+    print(
+        f"Retained per video: {legacy['retained_mb'] * 1024 * 1024 / video_count:,.0f} B -> "
+        f"{compact['retained_mb'] * 1024 * 1024 / video_count:,.0f} B; "
+        f"peak (retained + in flight): {legacy['retained_mb'] + legacy_wave['retained_mb']:.1f} MB -> "
+        f"{compact['retained_mb'] + compact_wave['retained_mb']:.1f} MB"
+    )
+
+    # Response boundary: SongResults are only built for what is sent
+    start = time.perf_counter()
+    page = [song.to_result() for song in songs[:PAGE_SIZE]]
+    page_ms = (time.perf_counter() - start) * 1000
+    assert len(page) == min(PAGE_SIZE, video_count)
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    streamed = 0
+    for batch in range(0, len(songs), PAGE_SIZE):
+        streamed += len("".join(song.to_result().model_dump_json() + "\n" for song in songs[batch:batch + PAGE_SIZE]))
+    stream_seconds = time.perf_counter() - start
+    _, stream_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"One page of {PAGE_SIZE} SongResults: {page_ms:.2f} ms")
+    print(
+        f"NDJSON of every result: {streamed / 1024 / 1024:.1f} MB in {stream_seconds:.2f}s, "
+        f"peak {stream_peak / 1024 / 1024:.2f} MB"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+Benchmark for bulk candidate scoring.
+
+Scores 100k synthetic (YouTube title, Spotify track) pairs with the original per-call
+function and with the batch API, and checks that both agree exactly.
+
+Run with:
+    python -m backend.benchmarks.scoring_bench
+"""
+
+import random
+import time
+from backend.benchmarks.title_parser_bench import SAMPLE_TITLES, legacy_calculate_match_confidence, make_candidates
+from backend.services.match_scoring import score_pairs
+
+PAIR_COUNT = 100_000
+
+
+def main() -> None:
+    rng = random.Random(7)
+    titles = []
+    tracks = []
+    while len(titles) < PAIR_COUNT:
+        title = f"{rng.choice(SAMPLE_TITLES)} {rng.randint(0, 5000)}"
+        for track in make_candidates(title, 10, rng):
+            titles.append(title)
+            tracks.append(track)
+
+    start = time.perf_counter()
+    expected = [legacy_calculate_match_confidence(title, track) for title, track in zip(titles, tracks)]
+    legacy_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batched = score_pairs(titles, tracks)
+    batched_seconds = time.perf_counter() - start
+    assert batched == expected
+
+    print(f"Pairs: {len(titles)}")
+    print(f"Per-call (original):  {legacy_seconds:6.2f}s")
+    print(f"Batched:              {batched_seconds:6.2f}s")
+
+
+if __name__ == "__main__":
+    main()
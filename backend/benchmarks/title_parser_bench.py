@@ -0,0 +1,202 @@
+"""
+Micro-benchmark for the compiled title parser.
+
+Compares the per-title cost of query generation plus candidate scoring before
+(ten re.sub passes per title fragment, indicator scan per candidate) and after
+(one parse shared by both stages), and checks both produce identical output.
+
+Run with:
+    python -m backend.benchmarks.title_parser_bench
+"""
+
+import re
+import random
+import timeit
+from typing import Any, Dict, List
+from backend.services.spotify_api import generate_smart_search_queries, calculate_match_confidence
+from backend.services.title_parser import _parse_title
+
+SAMPLE_TITLES = [
+    "Tasha Cobbs - You Still Love Me [Official Video] (Bass Boosted)",
+    "Tasha Cobbs Leonard - Gracefully Broken ft. Matt Redman (Official Music Video)",
+    "You Still Love Me (Piano Cover)",
+    "CeCe Winans – Goodness of God (Live) | Official Video",
+    "Nathaniel Bassey: Olowogbogboro feat. Dunsin Oyekan",
+    "Alan Walker - Faded (Nightcore) [8D Audio]",
+    "Hillsong UNITED - Oceans (Where Feet May Fail) - Lyric Video",
+    "【MV】 Some Song Title 【Official】",
+    "Maverick City Music • Jireh (feat. Naomi Raine) [Acoustic]",
+    "Lofi beats to study to - slowed + reverb",
+    "Sinach - Way Maker (Official Audio)",
+    "Karaoke - Amazing Grace (Instrumental)",
+]
+
+CANDIDATES_PER_TITLE = 60  # Up to 6 queries x 10 results per video
+
+
+def legacy_generate_smart_search_queries(youtube_title: str) -> List[str]:
+    queries = []
+    title = youtube_title.strip()
+    queries.append(title)
+
+    noise_patterns = [
+        r'\[.*?\]',
+        r'\(.*?\)',
+        r'【.*?】',
+        r'\s*-\s*official.*',
+        r'\s*-\s*lyrics?.*',
+        r'\s*(bass\s*boosted|nightcore|remix|cover|acoustic|live).*',
+        r'\s*\|\s*.*',
+        r'\s*ft\.?\s*.*',
+        r'\s*feat\.?\s*.*',
+        r'\s*featuring\s*.*',
+    ]
+
+    clean_title = title
+    for pattern in noise_patterns:
+        clean_title = re.sub(pattern, '', clean_title, flags=re.IGNORECASE)
+
+    clean_title = clean_title.strip()
+    if clean_title and clean_title != title:
+        queries.append(clean_title)
+
+    separators = [' - ', ' – ', ' — ', ' | ', ' • ', ': ']
+
+    for sep in separators:
+        if sep in title:
+            parts = title.split(sep, 1)
+            if len(parts) >= 2:
+                artist_part = parts[0].strip()
+                song_part = parts[1].strip()
+
+                for pattern in noise_patterns:
+                    song_part = re.sub(pattern, '', song_part, flags=re.IGNORECASE)
+                song_part = song_part.strip()
+
+                if artist_part and song_part:
+                    queries.append(f"{artist_part} {song_part}")
+                    queries.append(song_part)
+                    queries.append(artist_part)
+            break
+
+    seen = set()
+    unique_queries = []
+    for query in queries:
+        if query.lower() not in seen and len(query.strip()) > 2:
+            seen.add(query.lower())
+            unique_queries.append(query)
+
+    return unique_queries
+
+
+def legacy_calculate_match_confidence(youtube_title: str, spotify_track: Dict[str, Any]) -> float:
+    confidence = 0.0
+    youtube_lower = youtube_title.lower()
+
+    spotify_name = spotify_track["name"].lower()
+    spotify_artists = [artist["name"].lower() for artist in spotify_track["artists"]]
+    spotify_album = spotify_track["album"]["name"].lower()
+
+    if spotify_name in youtube_lower:
+        confidence += 0.4
+    else:
+        spotify_words = set(spotify_name.split())
+        youtube_words = set(youtube_lower.split())
+        common_words = spotify_words.intersection(youtube_words)
+        if common_words and len(common_words) >= len(spotify_words) * 0.6:
+            confidence += 0.3
+
+    artist_match_score = 0.0
+    for artist in spotify_artists:
+        if artist in youtube_lower:
+            artist_match_score = 0.35
+            break
+        else:
+            artist_words = set(artist.split())
+            youtube_words = set(youtube_lower.split())
+            if artist_words.intersection(youtube_words):
+                artist_match_score = max(artist_match_score, 0.15)
+
+    confidence += artist_match_score
+
+    if spotify_album in youtube_lower:
+        confidence += 0.1
+
+    negative_indicators = [
+        ('cover', -0.2), ('remix', -0.2), ('acoustic', -0.15), ('live', -0.15),
+        ('instrumental', -0.25), ('karaoke', -0.3), ('bass boosted', -0.2),
+        ('nightcore', -0.25), ('slowed', -0.2), ('8d audio', -0.2), ('piano', -0.1),
+    ]
+    for indicator, penalty in negative_indicators:
+        if indicator in youtube_lower:
+            confidence += penalty
+
+    positive_indicators = [('official', 0.1), ('audio', 0.05), ('music video', 0.05)]
+    for indicator, bonus in positive_indicators:
+        if indicator in youtube_lower:
+            confidence += bonus
+
+    expected_length = len(spotify_artists[0]) + len(spotify_name) + 3
+    actual_length = len(youtube_title)
+    if 0.7 <= actual_length / expected_length <= 1.5:
+        confidence += 0.05
+
+    return max(0.0, min(1.0, confidence))
+
+
+def make_candidates(title: str, count: int, rng: random.Random) -> List[Dict[str, Any]]:
+    """
+    Builds synthetic Spotify track objects that partially overlap the title's words.
+    """
+
+    words = title.split()
+    candidates = []
+    for index in range(count):
+        name = " ".join(rng.sample(words, k=min(len(words), rng.randint(1, 4))))
+        artist = " ".join(rng.sample(words, k=min(len(words), rng.randint(1, 2))))
+        candidates.append({
+            "id": f"track_{index}",
+            "name": name,
+            "artists": [{"name": artist}, {"name": f"Featured {index}"}],
+            "album": {"name": rng.choice(words)},
+        })
+    return candidates
+
+
+def main() -> None:
+    rng = random.Random(42)
+    workload = [(title, make_candidates(title, CANDIDATES_PER_TITLE, rng)) for title in SAMPLE_TITLES]
+
+    # Both implementations must agree before their timings mean anything
+    for title, candidates in workload:
+        assert legacy_generate_smart_search_queries(title) == generate_smart_search_queries(_parse_title(title)), title
+        parsed = _parse_title(title)
+        for track in candidates:
+            assert legacy_calculate_match_confidence(title, track) == calculate_match_confidence(parsed, track), title
+
+    def before() -> None:
+        for title, candidates in workload:
+            legacy_generate_smart_search_queries(title)
+            for track in candidates:
+                legacy_calculate_match_confidence(title, track)
+
+    def after() -> None:
+        for title, candidates in workload:
+            parsed = _parse_title(title)  # Uncached parse, so the comparison is per title
+            generate_smart_search_queries(parsed)
+            for track in candidates:
+                calculate_match_confidence(parsed, track)
+
+    rounds = 200
+    titles_processed = rounds * len(workload)
+    before_seconds = min(timeit.repeat(before, number=rounds, repeat=5))
+    after_seconds = min(timeit.repeat(after, number=rounds, repeat=5))
+
+    print(f"Titles per round: {len(workload)}, candidates per title: {CANDIDATES_PER_TITLE}")
+    print(f"Before: {before_seconds / titles_processed * 1e6:8.1f} µs per title")
+    print(f"After:  {after_seconds / titles_processed * 1e6:8.1f} µs per title")
+    print(f"Speedup: {before_seconds / after_seconds:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
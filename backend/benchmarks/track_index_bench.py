@@ -0,0 +1,83 @@
+"""
+Benchmark for candidate retrieval from the local track index.
+
+Indexes a synthetic catalog (1M tracks by default) and times candidate lookups for
+titles whose track is in the catalog (exact key path), titles that only match through
+the FTS phrase fallback, and titles whose track is not indexed.
+
+Run with:
+    python -m backend.benchmarks.track_index_bench [track_count]
+"""
+
+import os
+import sys
+import random
+import tempfile
+import time
+from pathlib import Path
+from backend.services.title_parser import parse_title
+from backend.services.track_index import LocalTrackIndex
+
+WORDS = (
+    "love night heart fire dream light rain summer blue gold river home wild city dance "
+    "star shadow forever ocean moon sky road soul storm echo angel midnight paradise "
+    "memory thunder silver golden broken sweet lonely crazy young free"
+).split()
+
+LOOKUPS = 2_000
+
+
+def make_track(index: int, rng: random.Random) -> dict:
+    name = " ".join(rng.choice(WORDS) for _ in range(rng.randint(1, 4))).title()
+    artist = f"{rng.choice(WORDS).title()} {rng.choice(WORDS).title()} {index % 50_000}"
+    return {
+        "id": f"track{index}",
+        "name": name,
+        "artists": [{"name": artist}],
+        "album": {"name": f"{rng.choice(WORDS).title()} Album", "images": []},
+        "external_urls": {"spotify": f"https://open.spotify.com/track/track{index}"},
+    }
+
+
+def main() -> None:
+    track_count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    rng = random.Random(3)
+
+    with tempfile.TemporaryDirectory() as directory:
+        index = LocalTrackIndex(Path(directory) / "track_index.sqlite3")
+
+        start = time.perf_counter()
+        sample = []
+        batch = []
+        for i in range(track_count):
+            track = make_track(i, rng)
+            batch.append(track)
+            if i % (track_count // LOOKUPS or 1) == 0:
+                sample.append(track)
+            if len(batch) == 10_000:
+                index.add_tracks(batch)
+                batch = []
+        index.add_tracks(batch)
+        index.optimize()
+        build_seconds = time.perf_counter() - start
+
+        known_titles = [f"{t['artists'][0]['name']} - {t['name']} (Official Video)" for t in sample[:LOOKUPS]]
+        # The artist's first name only: no exact key, found by the phrase search
+        fallback_titles = [f"{t['artists'][0]['name'].split()[-1]} - {t['name']}" for t in sample[:LOOKUPS]]
+        unknown_titles = [f"Unknown Artist {i} - {rng.choice(WORDS)} {rng.choice(WORDS)}" for i in range(LOOKUPS)]
+
+        for label, titles in (("known", known_titles), ("fallback", fallback_titles), ("unknown", unknown_titles)):
+            parsed = [parse_title(title) for title in titles]
+            found = 0
+            start = time.perf_counter()
+            for title in parsed:
+                found += bool(index.candidates(title))
+            per_lookup_ms = (time.perf_counter() - start) / len(parsed) * 1000
+            print(f"{label:>8} titles: {per_lookup_ms:.3f} ms per lookup ({found}/{len(parsed)} with candidates)")
+
+        size_mb = os.path.getsize(index.path) / 1e6
+        print(f"Tracks: {track_count}, build: {build_seconds:.1f}s, database: {size_mb:.0f} MB")
+
+
+if __name__ == "__main__":
+    main()
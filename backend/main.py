@@ -1,6 +1,8 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from backend.api import youtube, spotify, transfer, auth
+from backend.services.oauth_http import close_oauth_session
 
 
 tags_metadata = [
@@ -22,12 +24,24 @@ tags_metadata = [
     },
 ]
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Parse the OAuth client configuration once, before the first login
+    try:
+        auth.load_google_client_info()
+    except HTTPException as e:
+        print(f"[Startup] - YouTube login unavailable: {e.detail}")
+    yield
+    await close_oauth_session()
+
+
 app = FastAPI(
     title="Syncwave API",
     description="Transfer playlists from YouTube to Spotify",
     version="1.0.0",
     tags_metadata=tags_metadata,
     openapi_tags=tags_metadata,
+    lifespan=lifespan,
 )
 
 app.add_middleware(
@@ -0,0 +1,156 @@
+"""
+Compact records passed through the transfer pipeline.
+
+A transfer holds a YouTubeVideo and a SongRecord per playlist entry and a SpotifyTrack per
+matched video, so these are slotted dataclasses keeping only the fields the pipeline uses.
+The Pydantic models of backend.models.transfer are built from them when a response is sent.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+from backend.models.transfer import SongResult, TransferResponse
+
+
+def _to_dict(record: Any) -> Dict[str, Any]:
+    return {name: getattr(record, name) for name in record.__slots__}
+
+
+@dataclass(slots=True)
+class YouTubeVideo:
+    """A YouTube playlist entry with the metadata used for matching"""
+    video_id: str
+    title: str
+    thumbnail_url: Optional[str] = None
+    video_owner_channel: Optional[str] = None
+    playlist_item_id: Optional[str] = None  # Id of the entry in the playlist (stable across syncs)
+    duration_ms: Optional[int] = None  # From videos.list enrichment
+    skip_reason: Optional[str] = None  # Set by enrichment for unavailable or non-music videos
+
+    @property
+    def youtube_url(self) -> str:
+        return f"https://www.youtube.com/watch?v={self.video_id}"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return _to_dict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "YouTubeVideo":
+        # Unknown keys are ignored, so payloads written by older versions still load
+        return cls(**{name: data[name] for name in cls.__slots__ if name in data})
+
+
+@dataclass(slots=True)
+class SpotifyTrack:
+    """The Spotify track a video was matched to"""
+    track_id: str
+    name: str
+    artist: str
+    spotify_url: str
+    album: Optional[str] = None
+    thumbnail_url: Optional[str] = None
+    confidence: Optional[float] = None  # Match confidence the track was accepted with
+
+    def to_dict(self) -> Dict[str, Any]:
+        return _to_dict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SpotifyTrack":
+        # Unknown keys are ignored, so mappings stored by older versions (preview_url) still load
+        return cls(**{name: data[name] for name in cls.__slots__ if name in data})
+
+
+@dataclass(slots=True)
+class SongRecord:
+    """
+    Outcome of one playlist entry.
+
+    References the video and track records instead of copying their fields, so repeated
+    videos share one track record.
+    """
+    index: int  # Position of the video in the YouTube playlist
+    video: YouTubeVideo
+    track: Optional[SpotifyTrack] = None  # None when the video was not matched
+    error: Optional[str] = None  # Why the video was not matched, when it was not a plain miss
+
+    @property
+    def status(self) -> str:
+        return "success" if self.track else "failed"
+
+    @property
+    def title(self) -> str:
+        return self.track.name if self.track else self.video.title
+
+    @property
+    def spotify_track_id(self) -> Optional[str]:
+        return self.track.track_id if self.track else None
+
+    def to_result(self) -> SongResult:
+        """
+        Creates the SongResult returned to the frontend for this entry.
+        """
+
+        video, track = self.video, self.track
+        if track:
+            # ✅ SUCCESS - Found matching song on Spotify
+            return SongResult(
+                id=f"song_{self.index}",
+                title=track.name,                    # Clean Spotify title
+                artist=track.artist,                 # Formatted artist string
+                album=track.album,                   # Album name
+                thumbnail=track.thumbnail_url,       # Album artwork
+                status="success",
+                spotify_url=track.spotify_url,       # Individual track URL
+                spotify_track_id=track.track_id,
+                youtube_url=video.youtube_url,       # Original YouTube URL
+                original_youtube_title=video.title,  # Original messy title
+                spotify_match_confidence=track.confidence
+            )
+
+        # ❌ FAILED - Not found on Spotify
+        return SongResult(
+            id=f"song_{self.index}",
+            title=video.title,                   # Keep original YouTube title
+            artist="Unknown Artist",             # No Spotify data available
+            thumbnail=video.thumbnail_url,       # Use YouTube thumbnail
+            status="failed",
+            youtube_url=video.youtube_url,       # Original YouTube URL
+            error=self.error or "Song not found on Spotify or confidence too low",
+            original_youtube_title=video.title
+        )
+
+
+@dataclass(slots=True)
+class TransferRecord:
+    """Outcome of a transfer, kept by its job until the response is sent"""
+    success: bool
+    playlist_id: str
+    playlist_url: str
+    total_songs: int
+    transferred_songs: int
+    failed_songs: int
+    songs: List[SongRecord]
+    transfer_duration: float  # in seconds
+    created_at: str
+    message: str
+    match_rate: float  # percentage of successful matches
+    processing_time_per_song: float  # average time per song
+
+    def to_response(self, include_songs: bool = True) -> TransferResponse:
+        """
+        Builds the TransferResponse, with a SongResult per song unless `include_songs` is False.
+        """
+
+        return TransferResponse(
+            success=self.success,
+            playlist_id=self.playlist_id,
+            playlist_url=self.playlist_url,
+            total_songs=self.total_songs,
+            transferred_songs=self.transferred_songs,
+            failed_songs=self.failed_songs,
+            songs=[song.to_result() for song in self.songs] if include_songs else [],
+            transfer_duration=self.transfer_duration,
+            created_at=self.created_at,
+            message=self.message,
+            match_rate=self.match_rate,
+            processing_time_per_song=self.processing_time_per_song
+        )
@@ -7,25 +7,8 @@ class TransferRequest(BaseModel):
     playlist_name: str
     is_public: bool = True
     description: Optional[str] = ""
-
-class YouTubeVideo(BaseModel):
-    """Represents a YouTube video with metadata"""
-    video_id: str
-    title: str
-    youtube_url: str
-    thumbnail_url: Optional[str] = None
-    channel_title: Optional[str] = None
-    video_owner_channel: Optional[str] = None
-
-class SpotifyTrack(BaseModel):
-    """Represents a Spotify track with metadata"""
-    track_id: str
-    name: str
-    artist: str
-    album: Optional[str] = None
-    spotify_url: str
-    thumbnail_url: Optional[str] = None
-    preview_url: Optional[str] = None
+    concurrency: Optional[int] = None  # Videos matched in parallel, server default when omitted
+    incremental: bool = False  # Only process videos added since the last sync of this playlist
 
 class SongResult(BaseModel):
     """Final result for each song in the transfer"""
@@ -36,6 +19,7 @@ class SongResult(BaseModel):
     thumbnail: Optional[str] = None
     status: str  # "success" | "failed"
     spotify_url: Optional[str] = None
+    spotify_track_id: Optional[str] = None
     youtube_url: Optional[str] = None
     error: Optional[str] = None
     
@@ -58,4 +42,30 @@ class TransferResponse(BaseModel):
     
     # Transfer statistics
     match_rate: float  # percentage of successful matches
-    processing_time_per_song: float  # average time per song
\ No newline at end of file
+    processing_time_per_song: float  # average time per song
+
+class TransferProgress(BaseModel):
+    """Live counters of a running transfer (videos are counted once even if repeated)"""
+    stage: str = "queued"  # "queued" | "fetching" | "matching" | "adding" | "done"
+    total_videos: int = 0  # Playlist entries received from YouTube so far
+    unique_videos: int = 0  # Distinct videos among them
+    processed_videos: int = 0  # Distinct videos resolved (matched, not found or skipped)
+    matched_videos: int = 0  # Distinct videos matched to a Spotify track
+
+class SongResultPage(BaseModel):
+    """One page of the song results of a finished transfer"""
+    job_id: str
+    songs: List[SongResult]
+    total: int  # Song results of the whole transfer
+    next_cursor: Optional[str] = None  # Pass as ?cursor= to get the next page (None on the last page)
+
+class TransferJobResponse(BaseModel):
+    """Status of a background transfer job"""
+    job_id: str
+    status: str  # "queued" | "running" | "completed" | "failed"
+    progress: TransferProgress
+    result: Optional[TransferResponse] = None  # Set once the job is completed or failed
+    error: Optional[str] = None
+    created_at: str
+    started_at: Optional[str] = None
+    finished_at: Optional[str] = None
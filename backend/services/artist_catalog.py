@@ -0,0 +1,181 @@
+import os
+import asyncio
+from rich import print
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional, Set
+from backend.services.rate_limiter import SpotifyRateLimitError
+from backend.services.spotify_async import AsyncSpotifyClient
+from backend.services.title_parser import ParsedTitle, has_confident_split
+from backend.services.track_index import get_track_index
+from backend.services.utils import normalize_query
+
+# Artists with at least this many videos left to search in a playlist get their catalog prefetched
+ARTIST_PREFETCH_MIN_VIDEOS = int(os.getenv("ARTIST_PREFETCH_MIN_VIDEOS", 4))
+
+# Spotify page sizes: 50 albums per artist albums page, 20 albums per bulk album request
+ALBUM_PAGE_SIZE = 50
+ALBUMS_PER_REQUEST = 20
+# Caps the cost of prolific artists (live albums, reissues...)
+MAX_CATALOG_ALBUMS = 200
+
+
+def detected_artist(parsed_title: ParsedTitle, owner_artist: Optional[str]) -> Optional[str]:
+    """
+    Returns the artist a video can be clustered by: its artist-owned channel, else a
+    confident "Artist - Song" title split.
+    """
+
+    if owner_artist:
+        return owner_artist
+    if has_confident_split(parsed_title):
+        return parsed_title.artist
+    return None
+
+
+async def _find_artist_id(client: AsyncSpotifyClient, artist: str) -> Optional[str]:
+    """
+    Looks up the Spotify id of the artist whose name equals `artist` (after normalization).
+    """
+
+    # Quotes would end the phrase early, as in fielded_query
+    name = artist.replace('"', '')
+    results = await client.get("search", {"q": f'artist:"{name}"', "type": "artist", "limit": 5})
+    wanted = normalize_query(artist)
+    for item in (results.get("artists") or {}).get("items") or []:
+        if normalize_query(item["name"]) == wanted:
+            return item["id"]
+    return None
+
+
+async def _fetch_album_ids(client: AsyncSpotifyClient, artist_id: str) -> List[str]:
+    album_ids: List[str] = []
+    offset = 0
+    while len(album_ids) < MAX_CATALOG_ALBUMS:
+        page = await client.get(
+            f"artists/{artist_id}/albums",
+            {"include_groups": "album,single", "limit": ALBUM_PAGE_SIZE, "offset": offset}
+        )
+        album_ids.extend(album["id"] for album in page.get("items") or [])
+        if not page.get("next"):
+            break
+        offset += ALBUM_PAGE_SIZE
+    return album_ids[:MAX_CATALOG_ALBUMS]
+
+
+async def _fetch_album_tracks(client: AsyncSpotifyClient, album_ids: List[str]) -> List[Dict[str, Any]]:
+    """
+    Fetches the tracks of many albums, 20 albums per request.
+
+    Album tracks come without their album, so it is attached for the index and scoring.
+    """
+
+    tracks = []
+    for start in range(0, len(album_ids), ALBUMS_PER_REQUEST):
+        response = await client.get("albums", {"ids": ",".join(album_ids[start:start + ALBUMS_PER_REQUEST])})
+        for album in response.get("albums") or []:
+            if not album:
+                continue
+            album_info = {"name": album["name"], "images": album.get("images", [])}
+            for track in (album.get("tracks") or {}).get("items") or []:
+                if track and track.get("id"):
+                    tracks.append({**track, "album": album_info})
+    return tracks
+
+
+async def prefetch_artist_catalog(client: AsyncSpotifyClient, artist: str) -> int:
+    """
+    Pulls an artist's albums and singles with their tracks into the local track index.
+
+    A catalog of N albums costs 1 artist search, N/50 album pages and N/20 bulk album
+    requests, however many of the artist's videos the playlist has.
+
+    Args:
+        client (AsyncSpotifyClient): Async Spotify client.
+        artist (str): Artist name as found in the YouTube titles.
+
+    Returns:
+        int: Number of catalog tracks (0 when the artist is not on Spotify).
+    """
+
+    artist_id = await _find_artist_id(client, artist)
+    if not artist_id:
+        return 0
+
+    tracks = await _fetch_album_tracks(client, await _fetch_album_ids(client, artist_id))
+
+    def store() -> None:
+        index = get_track_index()
+        index.add_tracks(tracks)
+        index.mark_catalog(artist, artist_id, len(tracks))
+
+    # A catalog can hold thousands of tracks: written off the event loop, so searches keep running
+    await asyncio.to_thread(store)
+    return len(tracks)
+
+
+class ArtistPrefetcher:
+    """
+    Counts the artists of the videos a transfer still has to search and prefetches the
+    catalog of every artist that reaches `min_videos`.
+
+    The counts run across playlist pages, so an artist spread over several pages is
+    prefetched as soon as enough of their videos have been seen.
+    """
+
+    def __init__(self, client: AsyncSpotifyClient, min_videos: int = ARTIST_PREFETCH_MIN_VIDEOS):
+        self.client = client
+        self.min_videos = min_videos
+        self.counts: Counter = Counter()
+        self.names: Dict[str, str] = {}
+        self.done: Set[str] = set()
+        self.prefetched = 0
+
+    def due(self, artists: Iterable[Optional[str]]) -> Set[str]:
+        """
+        Counts a batch of videos' artists and returns the keys of the catalogs to prefetch now.
+
+        Args:
+            artists (Iterable[Optional[str]]): Detected artist of each video (None when unknown).
+
+        Returns:
+            Set[str]: Normalized artist keys that reached `min_videos` and have no fresh catalog.
+        """
+
+        for artist in artists:
+            if artist:
+                key = normalize_query(artist)
+                self.counts[key] += 1
+                self.names.setdefault(key, artist)
+
+        due = set()
+        index = get_track_index()
+        for key, count in self.counts.items():
+            if count >= self.min_videos and key not in self.done:
+                self.done.add(key)
+                if not index.has_catalog(self.names[key]):
+                    due.add(key)
+        return due
+
+    async def fetch(self, keys: Set[str]) -> None:
+        """
+        Prefetches the catalogs of the given artists concurrently.
+
+        Failures only cost the optimization: those videos are searched as usual.
+        """
+
+        async def fetch_one(key: str) -> None:
+            artist = self.names[key]
+            try:
+                track_count = await prefetch_artist_catalog(self.client, artist)
+            except SpotifyRateLimitError as e:
+                print(f"[yellow]Skipped prefetching {artist}'s catalog: {e}[/yellow]")
+                return
+            except Exception as e:
+                print(f"[red]Prefetching {artist}'s catalog failed: {e}[/red]")
+                return
+
+            if track_count:
+                self.prefetched += 1
+                print(f"[dim]Prefetched {track_count} tracks by {artist} ({self.counts[key]} videos)[/dim]")
+
+        await asyncio.gather(*(fetch_one(key) for key in keys))
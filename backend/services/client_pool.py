@@ -0,0 +1,219 @@
+import os
+import time
+import threading
+from rich import print
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+
+# Authenticated clients kept at most, and seconds an unused client stays in the pool
+DEFAULT_CLIENT_POOL_SIZE = 32
+DEFAULT_CLIENT_IDLE_TTL = 30 * 60
+# Tokens expiring within this many seconds are refreshed by the background refresher
+DEFAULT_TOKEN_REFRESH_MARGIN = 5 * 60
+# Seconds between two passes of the background refresher
+TOKEN_REFRESH_INTERVAL = 60
+
+
+class PooledClient:
+    """
+    An authenticated client and the hooks the pool needs to keep its token fresh.
+
+    `expires_at` returns the epoch second the current access token expires (None when
+    unknown) and `refresh` renews the token in place, so holders of the client keep using it.
+    """
+
+    __slots__ = ("client", "expires_at", "refresh", "last_used")
+
+    def __init__(
+        self,
+        client: Any,
+        expires_at: Callable[[], Optional[float]],
+        refresh: Callable[[], None]
+    ):
+        self.client = client
+        self.expires_at = expires_at
+        self.refresh = refresh
+        self.last_used = time.monotonic()
+
+
+class ClientPool:
+    """
+    Process-wide pool of authenticated API clients, keyed by account (OAuth client, scopes, token).
+
+    Building a client means reading credentials from disk, possibly refreshing the token
+    and setting up the HTTP client; the pool does that once per account instead of on
+    every request. Least recently used clients are dropped beyond `max_size`, idle ones
+    after `idle_ttl` seconds. A daemon thread refreshes tokens `refresh_margin` seconds
+    before they expire, so requests never wait for a token refresh.
+    """
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_CLIENT_POOL_SIZE,
+        idle_ttl: float = DEFAULT_CLIENT_IDLE_TTL,
+        refresh_margin: float = DEFAULT_TOKEN_REFRESH_MARGIN,
+        refresh_interval: float = TOKEN_REFRESH_INTERVAL
+    ):
+        self.max_size = max_size
+        self.idle_ttl = idle_ttl
+        self.refresh_margin = refresh_margin
+        self.refresh_interval = refresh_interval
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.refreshes = 0
+        self.refresh_failures = 0
+
+        self._lock = threading.Lock()
+        self._clients: "OrderedDict[str, PooledClient]" = OrderedDict()
+        self._building: Dict[str, threading.Lock] = {}
+        self._refresher: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    def get(self, key: str, build: Callable[[], PooledClient]) -> Any:
+        """
+        Returns the pooled client of an account, building it on first use.
+
+        Args:
+            key (str): Identifies the account the client is authenticated as.
+            build (Callable[[], PooledClient]): Creates the client when it is not pooled.
+
+        Returns:
+            Any: The authenticated client.
+        """
+
+        with self._lock:
+            pooled = self._checkout(key)
+            if pooled:
+                self.hits += 1
+                return pooled.client
+            building = self._building.setdefault(key, threading.Lock())
+
+        # One build per account at a time; other accounts are not blocked meanwhile
+        with building:
+            with self._lock:
+                pooled = self._checkout(key)
+                if pooled:
+                    self.hits += 1
+                    return pooled.client
+                self.misses += 1
+
+            pooled = build()
+
+            with self._lock:
+                self._clients[key] = pooled
+                self._building.pop(key, None)
+                while len(self._clients) > self.max_size:
+                    self._clients.popitem(last=False)
+                    self.evictions += 1
+                self._start_refresher()
+
+        return pooled.client
+
+    def _checkout(self, key: str) -> Optional[PooledClient]:
+        pooled = self._clients.get(key)
+        if pooled is None:
+            return None
+        if time.monotonic() - pooled.last_used > self.idle_ttl:
+            del self._clients[key]
+            self.evictions += 1
+            return None
+
+        pooled.last_used = time.monotonic()
+        self._clients.move_to_end(key)
+        return pooled
+
+    def invalidate(self, key: str) -> None:
+        """
+        Drops an account's client, e.g. after its credentials were revoked or replaced.
+        """
+
+        with self._lock:
+            self._clients.pop(key, None)
+
+    def _start_refresher(self) -> None:
+        if self._refresher is None or not self._refresher.is_alive():
+            self._refresher = threading.Thread(target=self._refresh_loop, name="client-pool-refresher", daemon=True)
+            self._refresher.start()
+
+    def _refresh_loop(self) -> None:
+        while not self._stop.wait(self.refresh_interval):
+            self.refresh_due()
+
+    def refresh_due(self) -> int:
+        """
+        Drops idle clients and refreshes the tokens that expire within `refresh_margin`.
+
+        Returns:
+            int: Number of refreshed tokens.
+        """
+
+        now = time.monotonic()
+        with self._lock:
+            idle = [key for key, pooled in self._clients.items() if now - pooled.last_used > self.idle_ttl]
+            for key in idle:
+                del self._clients[key]
+            self.evictions += len(idle)
+            clients = list(self._clients.items())
+
+        refreshed = 0
+        for key, pooled in clients:
+            try:
+                expires_at = pooled.expires_at()
+                if expires_at is None or expires_at - time.time() > self.refresh_margin:
+                    continue
+                pooled.refresh()
+                refreshed += 1
+            except Exception as e:
+                # The client stays usable; its library refreshes inline on the next call
+                self.refresh_failures += 1
+                print(f"[yellow]Background token refresh failed for {key}: {e}[/yellow]")
+
+        self.refreshes += refreshed
+        return refreshed
+
+    def close(self) -> None:
+        self._stop.set()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Returns the number of pooled clients with hit, eviction and refresh counters.
+        """
+
+        with self._lock:
+            size = len(self._clients)
+
+        lookups = self.hits + self.misses
+        return {
+            "clients": size,
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": (self.hits / lookups) if lookups else 0.0,
+            "evictions": self.evictions,
+            "refreshes": self.refreshes,
+            "refresh_failures": self.refresh_failures,
+        }
+
+
+_client_pool: Optional[ClientPool] = None
+_client_pool_lock = threading.Lock()
+
+
+def get_client_pool() -> ClientPool:
+    """
+    Returns the process-wide client pool, creating it on first use.
+
+    Configured through CLIENT_POOL_SIZE, CLIENT_IDLE_TTL and TOKEN_REFRESH_MARGIN.
+    """
+
+    global _client_pool
+
+    with _client_pool_lock:
+        if _client_pool is None:
+            _client_pool = ClientPool(
+                max_size=int(os.getenv("CLIENT_POOL_SIZE", DEFAULT_CLIENT_POOL_SIZE)),
+                idle_ttl=float(os.getenv("CLIENT_IDLE_TTL", DEFAULT_CLIENT_IDLE_TTL)),
+                refresh_margin=float(os.getenv("TOKEN_REFRESH_MARGIN", DEFAULT_TOKEN_REFRESH_MARGIN)),
+            )
+        return _client_pool
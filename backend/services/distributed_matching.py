@@ -0,0 +1,416 @@
+"""
+Distributed matching: spreads the Spotify searches of a transfer over worker processes.
+
+The coordinator (the process running the transfer) deduplicates the videos, resolves the
+known ones from its mapping store and pushes the rest to a Redis list in chunks. Workers on
+any node pop chunks, match them with the regular async pipeline and push the results back;
+the coordinator merges them in playlist order and does the playlist writes itself.
+
+Enabled with DISTRIBUTED_MATCHING=true and REDIS_URL. Start workers with:
+    python -m backend.services.distributed_matching
+"""
+
+import os
+import json
+import time
+import uuid
+import asyncio
+import threading
+from rich import print
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from backend.models.records import SpotifyTrack, YouTubeVideo
+from backend.models.transfer import TransferProgress
+from backend.services.rate_limiter import SpotifyRateLimitError
+from backend.services.spotify_api import MatchResult, VideoDeduper, api_match_videos_async, get_spotify_client
+from backend.services.spotify_async import DEFAULT_SEARCH_CONCURRENCY, clamp_concurrency
+from backend.services.track_mapping import get_track_mapping_store
+
+DISTRIBUTED_MATCHING = os.getenv("DISTRIBUTED_MATCHING", "false").lower() == "true"
+
+# Videos per task: large enough to amortize the round-trip, small enough to spread a playlist
+DEFAULT_CHUNK_SIZE = 25
+# Seconds a chunk may take before it is handed to another worker, and how many times
+DEFAULT_CHUNK_TIMEOUT = 300
+DEFAULT_CHUNK_ATTEMPTS = 3
+# Workers announce themselves with a key that expires unless refreshed, every third of its TTL
+WORKER_HEARTBEAT_TTL = 30
+WORKER_HEARTBEAT_INTERVAL = WORKER_HEARTBEAT_TTL / 3
+# Results of abandoned runs disappear after an hour
+RESULTS_TTL = 60 * 60
+
+KEY_PREFIX = "syncwave:match"
+
+
+class DistributedMatchError(Exception):
+    """
+    Raised when a chunk was not matched by any worker after every attempt.
+    """
+
+
+def encode_match(spotify_track: MatchResult) -> Dict[str, Any]:
+    if isinstance(spotify_track, SpotifyRateLimitError):
+        return {"rate_limited": str(spotify_track)}
+    if spotify_track is None:
+        return {}
+    return {"track": spotify_track.to_dict()}
+
+
+def decode_match(data: Dict[str, Any]) -> MatchResult:
+    if "rate_limited" in data:
+        return SpotifyRateLimitError(data["rate_limited"])
+    if "track" in data:
+        return SpotifyTrack.from_dict(data["track"])
+    return None
+
+
+class _PendingChunk:
+    __slots__ = ("chunk_id", "slots", "payload", "dispatched_at", "attempts")
+
+    def __init__(self, chunk_id: int, slots: List[int], payload: str):
+        self.chunk_id = chunk_id
+        self.slots = slots
+        self.payload = payload
+        self.dispatched_at = 0.0
+        self.attempts = 0
+
+
+class RedisMatchQueue:
+    """
+    Redis work queue of match tasks, used by both the coordinator and the workers.
+
+    - `{prefix}:tasks`: list of pending chunks (JSON), shared by every transfer
+    - `{prefix}:results:{run_id}`: list of finished chunks of one transfer
+    - `{prefix}:workers:{worker_id}`: heartbeat of a live worker
+
+    Delivery is at-least-once: a chunk whose results do not come back within
+    `chunk_timeout` seconds, or that a worker failed to match, is pushed again, and
+    duplicate results are ignored.
+    """
+
+    def __init__(
+        self,
+        client,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        chunk_timeout: float = DEFAULT_CHUNK_TIMEOUT,
+        chunk_attempts: int = DEFAULT_CHUNK_ATTEMPTS,
+        prefix: str = KEY_PREFIX
+    ):
+        self.client = client
+        self.chunk_size = chunk_size
+        self.chunk_timeout = chunk_timeout
+        self.chunk_attempts = chunk_attempts
+        self.tasks_key = f"{prefix}:tasks"
+        self.results_prefix = f"{prefix}:results"
+        self.workers_prefix = f"{prefix}:workers"
+
+    def live_workers(self) -> int:
+        return sum(1 for _ in self.client.scan_iter(match=f"{self.workers_prefix}:*", count=100))
+
+    # Coordinator side
+
+    def _dispatch(self, chunk: _PendingChunk) -> None:
+        chunk.dispatched_at = time.monotonic()
+        chunk.attempts += 1
+        self.client.lpush(self.tasks_key, chunk.payload)
+
+    def match_pages(
+        self,
+        video_pages: Iterable[List[YouTubeVideo]],
+        progress: Optional[TransferProgress] = None,
+        on_resolved: Optional[Callable[[int, YouTubeVideo, MatchResult], None]] = None
+    ) -> Tuple[List[YouTubeVideo], List[MatchResult]]:
+        """
+        Matches a stream of playlist pages on the workers.
+
+        Same contract as api_match_video_pages_async: duplicates are matched once, known
+        videos come from the mapping store, skipped videos are never searched, and
+        `on_resolved` fires for every playlist position as soon as its result is known.
+
+        Args:
+            video_pages (Iterable[List[YouTubeVideo]]): Playlist pages, in order.
+            progress (Optional[TransferProgress]): Counters updated as results come back.
+            on_resolved (Optional[Callable[[int, YouTubeVideo, MatchResult], None]]): Called with
+                (playlist position, video, match result) for every playlist entry.
+
+        Returns:
+            Tuple[List[YouTubeVideo], List[MatchResult]]: Every video received, in playlist
+            order, and the match result for each of them.
+
+        Raises:
+            DistributedMatchError: If a chunk timed out or failed `chunk_attempts` times.
+        """
+
+        run_id = uuid.uuid4().hex
+        results_key = f"{self.results_prefix}:{run_id}"
+        deduper = VideoDeduper()
+        mappings = get_track_mapping_store()
+        progress = progress or TransferProgress()
+
+        youtube_videos: List[YouTubeVideo] = []
+        positions: List[int] = []
+        unique_tracks: List[MatchResult] = []
+        slot_positions: List[List[int]] = []
+        resolved: List[bool] = []
+        pending: Dict[int, _PendingChunk] = {}
+        batch: List[int] = []
+        chunk_count = 0
+        dispatched_count = 0
+
+        def resolve(slot: int, spotify_track: MatchResult) -> None:
+            unique_tracks[slot] = spotify_track
+            resolved[slot] = True
+            if on_resolved:
+                for position in slot_positions[slot]:
+                    on_resolved(position, youtube_videos[position], spotify_track)
+
+        def flush() -> None:
+            nonlocal chunk_count
+
+            if not batch:
+                return
+            chunk_id = chunk_count
+            chunk_count += 1
+            payload = json.dumps({
+                "run_id": run_id,
+                "chunk_id": chunk_id,
+                "results_key": results_key,
+                "deadline": time.time() + self.chunk_timeout * self.chunk_attempts,
+                "videos": [deduper.unique_videos[slot].to_dict() for slot in batch],
+            })
+            chunk = _PendingChunk(chunk_id, list(batch), payload)
+            pending[chunk_id] = chunk
+            self._dispatch(chunk)
+            batch.clear()
+
+        def collect(timeout: float) -> None:
+            """
+            Merges finished chunks; waits up to `timeout` seconds for the first one.
+            """
+
+            item = self.client.brpop([results_key], timeout=timeout) if timeout else None
+            raw_results = [item[1]] if item else []
+            raw_results += self.client.rpop(results_key, 100) or []
+
+            for raw in raw_results:
+                result = json.loads(raw)
+                chunk = pending.get(result["chunk_id"])
+                if chunk is None:
+                    # Late duplicate of a chunk that was dispatched twice
+                    continue
+                if "error" in result:
+                    redispatch(chunk, f"failed on a worker: {result['error']}")
+                    continue
+
+                del pending[chunk.chunk_id]
+                for slot, data in zip(chunk.slots, result["matches"]):
+                    spotify_track = decode_match(data)
+                    if isinstance(spotify_track, SpotifyTrack):
+                        mappings.put(deduper.unique_videos[slot].video_id, spotify_track)
+                        progress.matched_videos += 1
+                    progress.processed_videos += 1
+                    resolve(slot, spotify_track)
+
+        def redispatch(chunk: _PendingChunk, reason: str) -> None:
+            if chunk.attempts >= self.chunk_attempts:
+                raise DistributedMatchError(
+                    f"No worker matched chunk {chunk.chunk_id} of run {run_id} after {chunk.attempts} attempts"
+                )
+            print(f"[yellow]Chunk {chunk.chunk_id} {reason}, dispatching it again[/yellow]")
+            self._dispatch(chunk)
+
+        def redispatch_expired() -> None:
+            now = time.monotonic()
+            for chunk in list(pending.values()):
+                if now - chunk.dispatched_at >= self.chunk_timeout:
+                    redispatch(chunk, "timed out")
+
+        try:
+            for page in video_pages:
+                new_videos = []
+                for youtube_video in page:
+                    slot, is_new = deduper.slot_for(youtube_video)
+                    position = len(youtube_videos)
+                    youtube_videos.append(youtube_video)
+                    positions.append(slot)
+                    if is_new:
+                        unique_tracks.append(None)
+                        slot_positions.append([])
+                        resolved.append(False)
+                        new_videos.append((slot, youtube_video))
+                    slot_positions[slot].append(position)
+                    if resolved[slot] and on_resolved:
+                        on_resolved(position, youtube_video, unique_tracks[slot])
+
+                known_tracks = mappings.get_many(youtube_video.video_id for _, youtube_video in new_videos)
+                searched = 0
+                for slot, youtube_video in new_videos:
+                    if youtube_video.video_id in known_tracks:
+                        resolve(slot, known_tracks[youtube_video.video_id])
+                    elif youtube_video.skip_reason:
+                        resolve(slot, None)
+                    else:
+                        searched += 1
+                        batch.append(slot)
+                        if len(batch) >= self.chunk_size:
+                            flush()
+
+                progress.total_videos += len(page)
+                progress.unique_videos += len(new_videos)
+                dispatched_count += searched
+                progress.processed_videos += len(new_videos) - searched
+                progress.matched_videos += len(known_tracks)
+
+                # Merge whatever is already done while the next page is fetched
+                collect(timeout=0)
+
+            flush()
+            while pending:
+                collect(timeout=1)
+                redispatch_expired()
+        finally:
+            self.client.delete(results_key)
+
+        print(f"[dim]Searched {dispatched_count} videos in {chunk_count} distributed chunks[/dim]")
+        return youtube_videos, [unique_tracks[slot] for slot in positions]
+
+    # Worker side
+
+    def _heartbeat(self, worker_key: str, stop: threading.Event) -> None:
+        """
+        Keeps a worker's heartbeat key alive until `stop` is set, including while a chunk
+        is being matched (which may take far longer than the key's TTL).
+        """
+
+        while True:
+            try:
+                self.client.set(worker_key, int(time.time()), ex=WORKER_HEARTBEAT_TTL)
+            except Exception as e:
+                print(f"[yellow]Could not refresh worker heartbeat: {e}[/yellow]")
+            if stop.wait(WORKER_HEARTBEAT_INTERVAL):
+                return
+
+    def run_worker(
+        self,
+        sp,
+        concurrency: int = DEFAULT_SEARCH_CONCURRENCY,
+        stop: Optional[threading.Event] = None,
+        poll_timeout: float = 1.0
+    ) -> int:
+        """
+        Pops and matches chunks until `stop` is set.
+
+        A chunk that fails to match is reported back to its coordinator, which dispatches
+        it again, and the worker moves on to the next one.
+
+        Args:
+            sp (spotipy.Spotify): Authenticated Spotify client of this worker.
+            concurrency (int): Videos of a chunk searched at the same time.
+            stop (Optional[threading.Event]): Ends the loop once set (runs forever when None).
+            poll_timeout (float): Seconds to block waiting for a task before checking `stop`.
+
+        Returns:
+            int: Number of chunks matched.
+        """
+
+        worker_key = f"{self.workers_prefix}:{uuid.uuid4().hex}"
+        stop = stop or threading.Event()
+        matched_chunks = 0
+
+        heartbeat_stop = threading.Event()
+        heartbeat = threading.Thread(
+            target=self._heartbeat, args=(worker_key, heartbeat_stop), name="match-heartbeat", daemon=True
+        )
+        heartbeat.start()
+
+        try:
+            while not stop.is_set():
+                item = self.client.brpop([self.tasks_key], timeout=poll_timeout)
+                if not item:
+                    continue
+
+                task = json.loads(item[1])
+                if time.time() > task["deadline"]:
+                    # Its coordinator gave up on it
+                    continue
+
+                try:
+                    youtube_videos = [YouTubeVideo.from_dict(video) for video in task["videos"]]
+                    spotify_tracks = asyncio.run(api_match_videos_async(sp, youtube_videos, concurrency))
+                    result = {
+                        "chunk_id": task["chunk_id"],
+                        "matches": [encode_match(spotify_track) for spotify_track in spotify_tracks],
+                    }
+                    matched_chunks += 1
+                except Exception as e:
+                    print(f"[red]Matching chunk {task['chunk_id']} of run {task['run_id']} failed: {e}[/red]")
+                    result = {"chunk_id": task["chunk_id"], "error": str(e)}
+
+                pipe = self.client.pipeline()
+                pipe.lpush(task["results_key"], json.dumps(result))
+                pipe.expire(task["results_key"], RESULTS_TTL)
+                pipe.execute()
+        finally:
+            heartbeat_stop.set()
+            heartbeat.join()
+            self.client.delete(worker_key)
+
+        return matched_chunks
+
+
+_match_queue: Optional[RedisMatchQueue] = None
+_match_queue_checked = False
+_match_queue_lock = threading.Lock()
+
+
+def get_match_queue() -> Optional[RedisMatchQueue]:
+    """
+    Returns the process-wide match queue, or None when distributed matching is off.
+
+    Needs DISTRIBUTED_MATCHING=true and a reachable REDIS_URL; configured through
+    MATCH_CHUNK_SIZE, MATCH_CHUNK_TIMEOUT and MATCH_CHUNK_ATTEMPTS.
+    """
+
+    global _match_queue, _match_queue_checked
+
+    with _match_queue_lock:
+        if _match_queue_checked:
+            return _match_queue
+        _match_queue_checked = True
+
+        redis_url = os.getenv("REDIS_URL")
+        if not (DISTRIBUTED_MATCHING and redis_url):
+            return None
+
+        try:
+            import redis
+
+            client = redis.Redis.from_url(redis_url, socket_timeout=10)
+            client.ping()
+        except Exception as e:
+            print(f"[yellow]Redis unavailable ({e}), matching locally[/yellow]")
+            return None
+
+        _match_queue = RedisMatchQueue(
+            client,
+            chunk_size=int(os.getenv("MATCH_CHUNK_SIZE", DEFAULT_CHUNK_SIZE)),
+            chunk_timeout=float(os.getenv("MATCH_CHUNK_TIMEOUT", DEFAULT_CHUNK_TIMEOUT)),
+            chunk_attempts=int(os.getenv("MATCH_CHUNK_ATTEMPTS", DEFAULT_CHUNK_ATTEMPTS)),
+        )
+        return _match_queue
+
+
+def main() -> None:
+    queue = get_match_queue()
+    if queue is None:
+        raise SystemExit("Distributed matching needs DISTRIBUTED_MATCHING=true and a reachable REDIS_URL")
+
+    concurrency = clamp_concurrency(int(os.getenv("MATCH_WORKER_CONCURRENCY", DEFAULT_SEARCH_CONCURRENCY)))
+    print(f"[bold blue]Match worker started (concurrency: {concurrency})[/bold blue]")
+    try:
+        queue.run_worker(get_spotify_client(), concurrency)
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
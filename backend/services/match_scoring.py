@@ -0,0 +1,240 @@
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+from backend.services.title_parser import ParsedTitle, TitleTokens, parse_title, tokenize_title
+
+# Anything exposing raw, lower, tokens and adjustments can be scored
+ScoringTitle = Union[ParsedTitle, TitleTokens]
+
+
+# Lowercased (name, artists, album) of a Spotify track object plus its duration in ms, as used by
+# the scoring function. A plain tuple: it is built for every candidate, and NamedTuple construction
+# is measurably slower.
+TrackFeatures = Tuple[str, Tuple[str, ...], str, Optional[int]]
+
+
+def track_features(spotify_track: Dict[str, Any]) -> TrackFeatures:
+    """
+    Extracts the scoring features of a raw Spotify track object.
+
+    Args:
+        spotify_track (Dict[str, Any]): Spotify track object from API.
+
+    Returns:
+        TrackFeatures: Lowercased name, artists and album, and the duration.
+    """
+
+    return (
+        spotify_track["name"].lower(),
+        tuple([artist["name"].lower() for artist in spotify_track["artists"]]),
+        spotify_track["album"]["name"].lower(),
+        spotify_track.get("duration_ms"),
+    )
+
+
+def _name_score(parsed: ScoringTitle, name: str) -> float:
+    if name in parsed.lower:
+        # Exact match gets full points
+        return 0.4
+
+    # Partial matching - check if significant words match
+    spotify_words = set(name.split())
+    common_words = spotify_words.intersection(parsed.tokens)
+    if common_words and len(common_words) >= len(spotify_words) * 0.6:
+        # If 60%+ of song title words match
+        return 0.3
+
+    return 0.0
+
+
+def _artist_score(parsed: ScoringTitle, artists: Tuple[str, ...]) -> float:
+    artist_match_score = 0.0
+    for artist in artists:
+        if artist in parsed.lower:
+            return 0.35
+        # Check partial artist name matching
+        if not parsed.tokens.isdisjoint(artist.split()):
+            artist_match_score = 0.15
+    return artist_match_score
+
+
+def _duration_score(video_duration_ms: int, track_duration_ms: int) -> float:
+    difference = abs(video_duration_ms - track_duration_ms)
+    if difference <= 3000:
+        return 0.1
+    if difference <= 10000:
+        return 0.05
+    if difference > 60000:
+        # Extended cuts, live sets, compilations...
+        return -0.05
+    return 0.0
+
+
+def score_features(
+    parsed: ScoringTitle,
+    features: TrackFeatures,
+    video_duration_ms: Optional[int] = None,
+    owner_artist: Optional[str] = None
+) -> float:
+    """
+    Scores pre-extracted track features against a parsed YouTube title.
+
+    See calculate_match_confidence for the scoring rules.
+    """
+
+    name, artists, album, track_duration_ms = features
+    youtube_lower = parsed.lower
+    confidence = 0.0
+
+    # 1. Song name matching (40% weight)
+    confidence += _name_score(parsed, name)
+
+    # 2. Artist matching (35% weight)
+    confidence += _artist_score(parsed, artists)
+
+    # 3. Album name bonus (10% weight)
+    if album in youtube_lower:
+        confidence += 0.1
+
+    # 4/5. Negative (cover, remix...) and positive (official, audio...) indicators,
+    # found once when the title was parsed
+    for adjustment in parsed.adjustments:
+        confidence += adjustment
+
+    # 6. Length similarity bonus (5% weight)
+    # If the YouTube title is roughly the same length as "Artist - Song", it's probably cleaner
+    expected_length = len(artists[0]) + len(name) + 3  # +3 for " - "
+    actual_length = len(parsed.raw)
+
+    if 0.7 <= actual_length / expected_length <= 1.5:  # Within reasonable range
+        confidence += 0.05
+
+    # 7. Duration agreement (10% weight), when the video duration is known
+    if video_duration_ms and track_duration_ms:
+        confidence += _duration_score(video_duration_ms, track_duration_ms)
+
+    # 8. Uploaded by the track artist's own "Topic"/VEVO channel (10% weight)
+    if owner_artist and owner_artist in artists:
+        confidence += 0.1
+
+    # Ensure confidence is between 0.0 and 1.0
+    return max(0.0, min(1.0, confidence))
+
+
+def calculate_match_confidence(
+    youtube_title: Union[str, ParsedTitle],
+    spotify_track: Dict[str, Any],
+    video_duration_ms: Optional[int] = None,
+    owner_artist: Optional[str] = None
+) -> float:
+    """
+    Calculate confidence score (0.0 to 1.0) for how well a Spotify track matches a YouTube title.
+
+    This function analyzes multiple factors:
+    - Does the song name appear in the YouTube title?
+    - Does any artist name appear in the YouTube title?
+    - Are there negative indicators (remix, cover, etc.)?
+    - Does the track last as long as the video (when the video duration is known)?
+    - Was the video uploaded by the track artist's own channel?
+
+    Example:
+    YouTube: "Tasha Cobbs - You Still Love Me [Official Video]"
+    Spotify: {"name": "You Still Love Me", "artists": [{"name": "Tasha Cobbs"}]}
+    Result: ~0.9 confidence (high match)
+
+    YouTube: "You Still Love Me (Piano Cover)"
+    Spotify: {"name": "You Still Love Me", "artists": [{"name": "Tasha Cobbs"}]}
+    Result: ~0.3 confidence (low match - it's a cover)
+
+    Args:
+        youtube_title (Union[str, ParsedTitle]): Original YouTube video title, or its parsed record
+        spotify_track (Dict[str, Any]): Spotify track object from API
+        video_duration_ms (Optional[int]): Duration of the YouTube video, from videos.list
+        owner_artist (Optional[str]): Artist of the uploader's "Topic"/VEVO channel
+
+    Returns:
+        float: Confidence score between 0.0 and 1.0
+    """
+
+    parsed = youtube_title if isinstance(youtube_title, ParsedTitle) else parse_title(youtube_title)
+    return score_features(parsed, track_features(spotify_track), video_duration_ms, owner_artist and owner_artist.lower())
+
+
+class CandidateScorer:
+    """
+    Scores Spotify candidates for a single YouTube video.
+
+    The title is parsed and tokenized once, and scores are memoized per Spotify track id,
+    so a track returned by several search queries for the same video is only scored once.
+    """
+
+    def __init__(
+        self,
+        youtube_title: Union[str, ParsedTitle],
+        video_duration_ms: Optional[int] = None,
+        owner_artist: Optional[str] = None
+    ):
+        self.parsed = youtube_title if isinstance(youtube_title, ParsedTitle) else parse_title(youtube_title)
+        self.video_duration_ms = video_duration_ms
+        self.owner_artist = owner_artist.lower() if owner_artist else None
+        self._scores: Dict[str, float] = {}
+
+    def score(self, spotify_track: Dict[str, Any]) -> float:
+        track_id = spotify_track.get("id")
+        score = self._scores.get(track_id) if track_id else None
+        if score is None:
+            score = score_features(self.parsed, track_features(spotify_track), self.video_duration_ms, self.owner_artist)
+            if track_id:
+                self._scores[track_id] = score
+        return score
+
+    def score_batch(self, spotify_tracks: Iterable[Dict[str, Any]]) -> List[float]:
+        """
+        Scores a whole candidate list in one call.
+
+        Args:
+            spotify_tracks (Iterable[Dict[str, Any]]): Spotify track objects from one search.
+
+        Returns:
+            List[float]: Confidence for each track, in the same order.
+        """
+
+        return [self.score(track) for track in spotify_tracks]
+
+    def __contains__(self, track_id: str) -> bool:
+        return track_id in self._scores
+
+
+def score_pairs(
+    youtube_titles: Sequence[Union[str, ScoringTitle]],
+    spotify_tracks: Sequence[Dict[str, Any]]
+) -> List[float]:
+    """
+    Scores many (YouTube title, Spotify track) pairs at once, e.g. for offline re-scoring jobs.
+
+    Gives exactly the same values as calling calculate_match_confidence on every pair, but
+    each distinct title is tokenized only once and the query cleaning a full parse runs is skipped.
+
+    Args:
+        youtube_titles (Sequence[Union[str, ScoringTitle]]): Titles, one per pair.
+        spotify_tracks (Sequence[Dict[str, Any]]): Spotify track objects, one per pair.
+
+    Returns:
+        List[float]: Confidence score of every pair.
+
+    Raises:
+        ValueError: If the two sequences have different lengths.
+    """
+
+    if len(youtube_titles) != len(spotify_tracks):
+        raise ValueError("youtube_titles and spotify_tracks must have the same length")
+
+    tokens_by_title: Dict[str, TitleTokens] = {}
+    scores = []
+    for title, track in zip(youtube_titles, spotify_tracks):
+        if isinstance(title, str):
+            tokens = tokens_by_title.get(title)
+            if tokens is None:
+                tokens = tokens_by_title[title] = tokenize_title(title)
+            title = tokens
+        scores.append(score_features(title, track_features(track)))
+
+    return scores
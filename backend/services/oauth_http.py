@@ -0,0 +1,77 @@
+import os
+import json
+import asyncio
+import aiohttp
+from typing import Any, Dict, Optional, Tuple
+
+# Connections kept open to the OAuth providers (token and userinfo endpoints)
+OAUTH_HTTP_POOL_SIZE = int(os.getenv("OAUTH_HTTP_POOL_SIZE", 20))
+# Seconds before a token exchange or user info request is abandoned
+OAUTH_HTTP_TIMEOUT = float(os.getenv("OAUTH_HTTP_TIMEOUT", 10))
+# Seconds an idle keep-alive connection stays open
+OAUTH_HTTP_KEEPALIVE = 30
+
+_session: Optional[aiohttp.ClientSession] = None
+_session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_oauth_session() -> aiohttp.ClientSession:
+    """
+    Returns the aiohttp session shared by the OAuth endpoints, creating it on first use.
+
+    Must be called from the server's event loop: the session (and its keep-alive
+    connections) belongs to that loop, so a new one is created if the loop changed.
+    """
+
+    global _session, _session_loop
+
+    loop = asyncio.get_running_loop()
+    if _session is None or _session.closed or _session_loop is not loop:
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=OAUTH_HTTP_POOL_SIZE, keepalive_timeout=OAUTH_HTTP_KEEPALIVE),
+            timeout=aiohttp.ClientTimeout(total=OAUTH_HTTP_TIMEOUT),
+        )
+        _session_loop = loop
+    return _session
+
+
+async def close_oauth_session() -> None:
+    """
+    Closes the shared session (at server shutdown).
+    """
+
+    global _session, _session_loop
+
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
+    _session_loop = None
+
+
+async def request_json(method: str, url: str, **kwargs: Any) -> Tuple[int, Dict[str, Any], str]:
+    """
+    Sends a request through the shared session without blocking the event loop.
+
+    Args:
+        method (str): HTTP method.
+        url (str): Absolute URL.
+        **kwargs: Passed to aiohttp (data, headers...).
+
+    Returns:
+        Tuple[int, Dict[str, Any], str]: Status code, the decoded JSON body ({} when the body
+        is not a JSON object) and the raw body text.
+
+    Raises:
+        aiohttp.ClientError: If the provider could not be reached.
+        asyncio.TimeoutError: If it did not answer within OAUTH_HTTP_TIMEOUT seconds.
+    """
+
+    async with get_oauth_session().request(method, url, **kwargs) as response:
+        text = await response.text()
+
+    # Providers do not always label JSON as application/json (text/plain, text/javascript...)
+    try:
+        data = json.loads(text)
+    except ValueError:
+        data = None
+    return response.status, data if isinstance(data, dict) else {}, text
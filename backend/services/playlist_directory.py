@@ -0,0 +1,206 @@
+import os
+import time
+import weakref
+import threading
+import spotipy
+from rich import print
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+from backend.services.rate_limiter import call_spotify
+
+# Playlists per GET /me/playlists page (Spotify's maximum)
+PLAYLIST_PAGE_SIZE = 50
+# Seconds a user's directory is trusted, so playlists renamed or deleted elsewhere are picked up
+DEFAULT_PLAYLIST_DIRECTORY_TTL = 10 * 60
+
+
+@dataclass(slots=True)
+class PlaylistEntry:
+    """A playlist owned by the user, as listed by GET /me/playlists"""
+    playlist_id: str
+    name: str
+    url: str
+    snapshot_id: Optional[str] = None  # Version of the playlist's tracks, changed by every edit
+
+    @classmethod
+    def from_playlist(cls, playlist: Dict[str, Any]) -> "PlaylistEntry":
+        return cls(
+            playlist_id=playlist["id"],
+            name=playlist["name"],
+            url=playlist["external_urls"]["spotify"],
+            snapshot_id=playlist.get("snapshot_id"),
+        )
+
+    def to_playlist(self) -> Dict[str, Any]:
+        """
+        Returns the entry as a (simplified) Spotify playlist object.
+        """
+
+        return {
+            "id": self.playlist_id,
+            "name": self.name,
+            "snapshot_id": self.snapshot_id,
+            "external_urls": {"spotify": self.url},
+        }
+
+
+class _UserPlaylists:
+    __slots__ = ("by_name", "loaded_at", "lock")
+
+    def __init__(self):
+        self.by_name: Dict[str, PlaylistEntry] = {}
+        self.loaded_at: Optional[float] = None
+        self.lock = threading.RLock()
+
+
+class PlaylistDirectory:
+    """
+    Per-user directory of the Spotify playlists each user owns (name -> id, URL, snapshot id).
+
+    A user's directory is loaded with 50-playlist pages the first time one of their
+    playlists is looked up, kept up to date in place as playlists are created, and
+    reloaded once it is `ttl` seconds old. The user id of each client is cached for as
+    long, so finding or creating a playlist costs no call but the creation itself in
+    steady state. Names are matched case-insensitively.
+    """
+
+    def __init__(self, ttl: float = DEFAULT_PLAYLIST_DIRECTORY_TTL):
+        self.ttl = ttl
+        self.hits = 0
+        self.loads = 0
+        self.pages = 0
+
+        self._lock = threading.Lock()
+        self._users: Dict[str, _UserPlaylists] = {}
+        # Pooled clients are long-lived; an entry goes away with its client
+        self._user_ids: "weakref.WeakKeyDictionary[spotipy.Spotify, Tuple[str, float]]" = weakref.WeakKeyDictionary()
+
+    def user_id(self, sp: spotipy.Spotify) -> str:
+        """
+        Returns the id of the user the client is authenticated as (sp.me, cached for `ttl` seconds).
+        """
+
+        with self._lock:
+            cached = self._user_ids.get(sp)
+        if cached and time.monotonic() - cached[1] < self.ttl:
+            return cached[0]
+
+        user_id = call_spotify(sp.me)["id"]
+        with self._lock:
+            self._user_ids[sp] = (user_id, time.monotonic())
+        return user_id
+
+    def _user(self, user_id: str) -> _UserPlaylists:
+        with self._lock:
+            return self._users.setdefault(user_id, _UserPlaylists())
+
+    def _load(self, sp: spotipy.Spotify, user_id: str, user: _UserPlaylists) -> None:
+        by_name: Dict[str, PlaylistEntry] = {}
+        offset = 0
+        while True:
+            page = call_spotify(sp.current_user_playlists, limit=PLAYLIST_PAGE_SIZE, offset=offset)
+            self.pages += 1
+            for playlist in page["items"]:
+                # Followed playlists are listed too, but only the user's own can be added to
+                if playlist and playlist["owner"]["id"] == user_id:
+                    by_name.setdefault(playlist["name"].lower(), PlaylistEntry.from_playlist(playlist))
+
+            if not page["next"]:
+                break
+            offset += PLAYLIST_PAGE_SIZE
+
+        user.by_name = by_name
+        user.loaded_at = time.monotonic()
+        self.loads += 1
+        print(f"[dim]Loaded {len(by_name)} playlists of Spotify user {user_id} ({self.pages} pages so far)[/dim]")
+
+    def find(self, sp: spotipy.Spotify, name: str, user_id: Optional[str] = None) -> Optional[PlaylistEntry]:
+        """
+        Looks up a playlist the user owns by name.
+
+        Args:
+            sp (spotipy.Spotify): Client authenticated as the user.
+            name (str): Playlist name (case-insensitive).
+            user_id (Optional[str]): The user's id, when already known.
+
+        Returns:
+            Optional[PlaylistEntry]: The playlist, or None if the user has none by that name.
+        """
+
+        user_id = user_id or self.user_id(sp)
+        user = self._user(user_id)
+        with user.lock:
+            if user.loaded_at is None or time.monotonic() - user.loaded_at > self.ttl:
+                self._load(sp, user_id, user)
+            else:
+                self.hits += 1
+            return user.by_name.get(name.lower())
+
+    def add(self, user_id: str, playlist: Dict[str, Any]) -> PlaylistEntry:
+        """
+        Records a playlist the user just created (a Spotify playlist object).
+        """
+
+        entry = PlaylistEntry.from_playlist(playlist)
+        user = self._user(user_id)
+        with user.lock:
+            user.by_name[entry.name.lower()] = entry
+        return entry
+
+    def locked(self, user_id: str) -> threading.RLock:
+        """
+        Returns the lock of a user's directory, to hold while finding then creating a
+        playlist so concurrent transfers do not create the same playlist twice.
+        """
+
+        return self._user(user_id).lock
+
+    def invalidate(self, user_id: Optional[str] = None) -> None:
+        """
+        Forgets a user's playlists (every user's when None), so they are listed again on next use.
+        """
+
+        with self._lock:
+            if user_id is None:
+                self._users.clear()
+                self._user_ids.clear()
+            else:
+                self._users.pop(user_id, None)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Returns the number of cached users and playlists with load and hit counters.
+        """
+
+        with self._lock:
+            users = list(self._users.values())
+
+        return {
+            "users": len(users),
+            "playlists": sum(len(user.by_name) for user in users),
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "loads": self.loads,
+            "pages": self.pages,
+        }
+
+
+_playlist_directory: Optional[PlaylistDirectory] = None
+_playlist_directory_lock = threading.Lock()
+
+
+def get_playlist_directory() -> PlaylistDirectory:
+    """
+    Returns the process-wide playlist directory, creating it on first use.
+
+    Configured through PLAYLIST_DIRECTORY_TTL.
+    """
+
+    global _playlist_directory
+
+    with _playlist_directory_lock:
+        if _playlist_directory is None:
+            _playlist_directory = PlaylistDirectory(
+                ttl=float(os.getenv("PLAYLIST_DIRECTORY_TTL", DEFAULT_PLAYLIST_DIRECTORY_TTL)),
+            )
+        return _playlist_directory
@@ -0,0 +1,187 @@
+import time
+import sqlite3
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Set, Tuple
+from backend.models.records import YouTubeVideo
+from backend.services.utils import get_cache_dir, normalize_query
+
+
+@dataclass(frozen=True, slots=True)
+class PlaylistSyncState:
+    """
+    What the previous sync of a YouTube playlist into a Spotify playlist left behind.
+    """
+
+    sync_key: str
+    youtube_playlist_id: str
+    spotify_playlist_id: str
+    spotify_playlist_url: str
+    playlist_etag: Optional[str]
+    synced_at: float
+
+
+class PlaylistSyncStore:
+    """
+    Persistent per-playlist sync state stored in SQLite.
+
+    For every (YouTube playlist, Spotify playlist name) pair it keeps the target Spotify
+    playlist, the YouTube playlist etag seen last time, and every playlistItem id that was
+    already processed with the track it resolved to. The next sync only processes the
+    playlist items that have not been matched to a track yet.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS playlist_sync (
+                sync_key TEXT PRIMARY KEY,
+                youtube_playlist_id TEXT NOT NULL,
+                spotify_playlist_id TEXT NOT NULL,
+                spotify_playlist_url TEXT NOT NULL,
+                playlist_etag TEXT,
+                synced_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS synced_items (
+                sync_key TEXT NOT NULL,
+                playlist_item_id TEXT NOT NULL,
+                video_id TEXT NOT NULL,
+                track_id TEXT,
+                PRIMARY KEY (sync_key, playlist_item_id)
+            ) WITHOUT ROWID
+            """
+        )
+
+    @staticmethod
+    def make_key(youtube_playlist_id: str, playlist_name: str) -> str:
+        return f"{youtube_playlist_id}:{normalize_query(playlist_name)}"
+
+    def get(self, youtube_playlist_id: str, playlist_name: str) -> Optional[PlaylistSyncState]:
+        sync_key = self.make_key(youtube_playlist_id, playlist_name)
+        with self._lock:
+            row = self._conn.execute(
+                """
+                SELECT sync_key, youtube_playlist_id, spotify_playlist_id, spotify_playlist_url, playlist_etag, synced_at
+                FROM playlist_sync WHERE sync_key = ?
+                """,
+                (sync_key,)
+            ).fetchone()
+        return PlaylistSyncState(*row) if row else None
+
+    def synced_item_ids(self, sync_key: str) -> Set[str]:
+        """
+        Returns the playlistItem ids already added to the Spotify playlist. Items recorded
+        without a track (not found, skipped, rate limited) are left out so they are retried.
+        """
+
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT playlist_item_id FROM synced_items WHERE sync_key = ? AND track_id IS NOT NULL", (sync_key,)
+            ).fetchall()
+        return {playlist_item_id for (playlist_item_id,) in rows}
+
+    def record(
+        self,
+        youtube_playlist_id: str,
+        playlist_name: str,
+        spotify_playlist_id: str,
+        spotify_playlist_url: str,
+        playlist_etag: Optional[str],
+        synced_items: Iterable[Tuple[YouTubeVideo, Optional[str]]]
+    ) -> None:
+        """
+        Saves the outcome of a sync run.
+
+        Args:
+            youtube_playlist_id (str): The YouTube playlist ID.
+            playlist_name (str): Name of the Spotify playlist.
+            spotify_playlist_id (str): The Spotify playlist the videos were added to.
+            spotify_playlist_url (str): Its URL.
+            playlist_etag (Optional[str]): YouTube playlist etag read before paging.
+            synced_items (Iterable[Tuple[YouTubeVideo, Optional[str]]]): Processed videos and
+                the track each one was added as (None when not found on Spotify).
+        """
+
+        sync_key = self.make_key(youtube_playlist_id, playlist_name)
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.execute(
+                    """
+                    INSERT OR REPLACE INTO playlist_sync
+                    (sync_key, youtube_playlist_id, spotify_playlist_id, spotify_playlist_url, playlist_etag, synced_at)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                    """,
+                    (sync_key, youtube_playlist_id, spotify_playlist_id, spotify_playlist_url, playlist_etag, time.time())
+                )
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO synced_items (sync_key, playlist_item_id, video_id, track_id) VALUES (?, ?, ?, ?)",
+                    [
+                        (sync_key, youtube_video.playlist_item_id, youtube_video.video_id, track_id)
+                        for youtube_video, track_id in synced_items
+                        if youtube_video.playlist_item_id
+                    ]
+                )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def forget(self, youtube_playlist_id: str, playlist_name: str) -> None:
+        """
+        Drops the sync state so the next run is a full transfer.
+        """
+
+        sync_key = self.make_key(youtube_playlist_id, playlist_name)
+        with self._lock:
+            self._conn.execute("DELETE FROM synced_items WHERE sync_key = ?", (sync_key,))
+            self._conn.execute("DELETE FROM playlist_sync WHERE sync_key = ?", (sync_key,))
+
+
+def filter_new_videos(
+    video_pages: Iterable[List[YouTubeVideo]],
+    synced_item_ids: Set[str]
+) -> Iterator[List[YouTubeVideo]]:
+    """
+    Drops the already synced playlist items from a stream of playlist pages.
+
+    Args:
+        video_pages (Iterable[List[YouTubeVideo]]): Playlist pages, in order.
+        synced_item_ids (Set[str]): playlistItem ids matched by earlier syncs.
+
+    Yields:
+        List[YouTubeVideo]: The new videos of each page (pages without any are skipped).
+    """
+
+    for page in video_pages:
+        new_videos = [video for video in page if video.playlist_item_id not in synced_item_ids]
+        if new_videos:
+            yield new_videos
+
+
+_playlist_sync_store: Optional[PlaylistSyncStore] = None
+_playlist_sync_store_lock = threading.Lock()
+
+
+def get_playlist_sync_store() -> PlaylistSyncStore:
+    """
+    Returns the process-wide playlist sync state store, creating it on first use.
+    """
+
+    global _playlist_sync_store
+
+    with _playlist_sync_store_lock:
+        if _playlist_sync_store is None:
+            _playlist_sync_store = PlaylistSyncStore(get_cache_dir() / "playlist_sync.sqlite3")
+        return _playlist_sync_store
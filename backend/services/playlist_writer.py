@@ -0,0 +1,318 @@
+import json
+import time
+import hashlib
+import sqlite3
+import threading
+import requests
+import spotipy
+from rich import print
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from backend.services.rate_limiter import call_spotify
+from backend.services.utils import get_cache_dir
+
+# Tracks per add request and per playlist items page (Spotify's maximum for both)
+PLAYLIST_BATCH_SIZE = 100
+# Attempts per batch before the write is abandoned (committed batches are kept for the next run)
+DEFAULT_WRITE_ATTEMPTS = 3
+# Seconds before the first retry of a failed batch, doubled on each retry
+RETRY_BACKOFF = 1.0
+# Unfinished writes are forgotten after a week
+WRITE_JOURNAL_MAX_AGE = 7 * 24 * 60 * 60
+
+
+class PlaylistWriteError(Exception):
+    """
+    Raised when a batch could not be added after every attempt.
+
+    The batches committed before it are recorded, so writing the same tracks to the same
+    playlist again resumes from the failed batch.
+    """
+
+
+@dataclass(slots=True)
+class PlaylistWrite:
+    """A write of tracks into a playlist, as recorded in the journal"""
+    write_key: str
+    playlist_id: str
+    track_ids: List[str]  # Tracks to add, in source order, without the ones already in the playlist
+    committed: Dict[int, str]  # Snapshot id of the playlist after each committed batch, by batch index
+
+    def batches(self) -> Iterable[Tuple[int, List[str]]]:
+        for index, start in enumerate(range(0, len(self.track_ids), PLAYLIST_BATCH_SIZE)):
+            yield index, self.track_ids[start:start + PLAYLIST_BATCH_SIZE]
+
+
+@dataclass(slots=True)
+class PlaylistWriteResult:
+    """Outcome of writing tracks into a playlist"""
+    added: int  # Tracks added by this run
+    already_present: int  # Tracks skipped because the playlist already had them
+    resumed_batches: int  # Batches committed by an earlier, interrupted run
+    snapshot_id: Optional[str]  # Playlist version after the write
+
+
+class PlaylistWriteJournal:
+    """
+    Persistent record of the playlist writes in progress, stored in SQLite.
+
+    A write is keyed by the playlist and the ordered tracks it should end up containing.
+    Its plan (the tracks missing from the playlist when the write started) is stored
+    once, then each batch is recorded with the snapshot id Spotify returned for it as
+    soon as it is committed. Finished writes are deleted.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS playlist_writes (
+                write_key TEXT PRIMARY KEY,
+                playlist_id TEXT NOT NULL,
+                track_ids TEXT NOT NULL,
+                started_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS committed_batches (
+                write_key TEXT NOT NULL,
+                batch_index INTEGER NOT NULL,
+                snapshot_id TEXT NOT NULL,
+                PRIMARY KEY (write_key, batch_index)
+            ) WITHOUT ROWID
+            """
+        )
+        self._expire()
+
+    @staticmethod
+    def make_key(playlist_id: str, track_ids: List[str]) -> str:
+        digest = hashlib.sha1("\n".join(track_ids).encode("utf-8")).hexdigest()
+        return f"{playlist_id}:{digest}"
+
+    def _expire(self) -> None:
+        with self._lock:
+            expired = "SELECT write_key FROM playlist_writes WHERE started_at < ?"
+            cutoff = (time.time() - WRITE_JOURNAL_MAX_AGE,)
+            self._conn.execute(f"DELETE FROM committed_batches WHERE write_key IN ({expired})", cutoff)
+            self._conn.execute("DELETE FROM playlist_writes WHERE started_at < ?", cutoff)
+
+    def get(self, write_key: str) -> Optional[PlaylistWrite]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT playlist_id, track_ids FROM playlist_writes WHERE write_key = ?", (write_key,)
+            ).fetchone()
+            if row is None:
+                return None
+            batches = self._conn.execute(
+                "SELECT batch_index, snapshot_id FROM committed_batches WHERE write_key = ?", (write_key,)
+            ).fetchall()
+        return PlaylistWrite(write_key, row[0], json.loads(row[1]), dict(batches))
+
+    def start(self, write_key: str, playlist_id: str, track_ids: List[str]) -> PlaylistWrite:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO playlist_writes (write_key, playlist_id, track_ids, started_at) VALUES (?, ?, ?, ?)",
+                (write_key, playlist_id, json.dumps(track_ids), time.time())
+            )
+            self._conn.execute("DELETE FROM committed_batches WHERE write_key = ?", (write_key,))
+        return PlaylistWrite(write_key, playlist_id, track_ids, {})
+
+    def commit(self, write: PlaylistWrite, batch_index: int, snapshot_id: str) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO committed_batches (write_key, batch_index, snapshot_id) VALUES (?, ?, ?)",
+                (write.write_key, batch_index, snapshot_id)
+            )
+        write.committed[batch_index] = snapshot_id
+
+    def finish(self, write: PlaylistWrite) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM committed_batches WHERE write_key = ?", (write.write_key,))
+            self._conn.execute("DELETE FROM playlist_writes WHERE write_key = ?", (write.write_key,))
+
+
+def fetch_playlist_track_ids(sp: spotipy.Spotify, playlist_id: str) -> Tuple[Set[str], Optional[str]]:
+    """
+    Fetches the ids of every track in a playlist, 100 per call, with its snapshot id.
+
+    Returns:
+        Tuple[Set[str], Optional[str]]: Track ids (local and removed tracks have none) and
+        the playlist's snapshot id.
+    """
+
+    playlist = call_spotify(sp.playlist, playlist_id, fields="snapshot_id,tracks(total)")
+    total = playlist["tracks"]["total"]
+
+    track_ids: Set[str] = set()
+    for offset in range(0, total, PLAYLIST_BATCH_SIZE):
+        page = call_spotify(
+            sp.playlist_items, playlist_id, fields="items(track(id))", limit=PLAYLIST_BATCH_SIZE, offset=offset
+        )
+        track_ids.update(item["track"]["id"] for item in page["items"] if item.get("track") and item["track"].get("id"))
+    return track_ids, playlist["snapshot_id"]
+
+
+def _is_transient(error: Exception) -> bool:
+    if isinstance(error, spotipy.SpotifyException):
+        return error.http_status >= 500
+    return isinstance(error, requests.exceptions.RequestException)
+
+
+def _batch_landed(sp: spotipy.Spotify, playlist_id: str, batch: List[str], snapshot_before: Optional[str]) -> Optional[str]:
+    """
+    Tells whether a batch whose add request failed was applied anyway (e.g. the response
+    was lost), so retrying it would add duplicates.
+
+    Returns:
+        Optional[str]: The playlist's snapshot id if the batch is at the end of the playlist, else None.
+    """
+
+    playlist = call_spotify(sp.playlist, playlist_id, fields="snapshot_id,tracks(total)")
+    if playlist["snapshot_id"] == snapshot_before:
+        # Nothing changed since the last committed batch
+        return None
+
+    total = playlist["tracks"]["total"]
+    if total < len(batch):
+        return None
+    page = call_spotify(
+        sp.playlist_items, playlist_id, fields="items(track(id))", limit=len(batch), offset=total - len(batch)
+    )
+    tail = [(item.get("track") or {}).get("id") for item in page["items"]]
+    return playlist["snapshot_id"] if tail == batch else None
+
+
+def _add_batch(
+    sp: spotipy.Spotify,
+    playlist_id: str,
+    batch: List[str],
+    snapshot_before: Optional[str],
+    attempts: int
+) -> str:
+    """
+    Appends a batch, retrying transient failures without ever adding it twice.
+
+    The client must not resend POSTs itself (see spotify_api._build_spotify_session),
+    otherwise a batch could be added twice before the snapshot check runs.
+
+    Returns:
+        str: The playlist's snapshot id once the batch is in.
+
+    Raises:
+        PlaylistWriteError: If the batch was still not added after `attempts` attempts.
+    """
+
+    delay = RETRY_BACKOFF
+    for attempt in range(1, attempts + 1):
+        try:
+            return call_spotify(sp.playlist_add_items, playlist_id, batch)["snapshot_id"]
+        except Exception as e:
+            if not _is_transient(e):
+                raise
+            print(f"[yellow]Adding {len(batch)} tracks to playlist {playlist_id} failed (attempt {attempt}/{attempts}): {e}[/yellow]")
+            error = e
+
+        # The request may have been applied before it failed
+        try:
+            landed = _batch_landed(sp, playlist_id, batch, snapshot_before)
+        except Exception as e:
+            if not _is_transient(e):
+                raise
+            landed = None
+        if landed:
+            return landed
+
+        if attempt < attempts:
+            time.sleep(delay)
+            delay *= 2
+
+    raise PlaylistWriteError(f"Could not add {len(batch)} tracks to playlist {playlist_id}: {error}")
+
+
+def write_playlist_tracks(
+    sp: spotipy.Spotify,
+    playlist_id: str,
+    track_ids: Iterable[Optional[str]],
+    attempts: int = DEFAULT_WRITE_ATTEMPTS
+) -> PlaylistWriteResult:
+    """
+    Appends tracks to a playlist in source order, skipping the ones it already contains.
+
+    The playlist's contents are fetched once (100 tracks per call) and the missing tracks
+    are added 100 per call. Each committed batch is journaled with its snapshot id: if the
+    write is interrupted, writing the same tracks to the same playlist again resumes after
+    the last committed batch, skipping the tracks of the remaining batches the playlist
+    already has (the batch in flight may have landed before it was committed). A batch
+    whose request failed is only sent again once the playlist's snapshot id shows it did
+    not land.
+
+    Args:
+        sp (spotipy.Spotify): The authenticated Spotify client.
+        playlist_id (str): The target playlist.
+        track_ids (Iterable[Optional[str]]): Tracks in source order (duplicates and None are skipped).
+        attempts (int): Attempts per batch on transient errors (5xx, connection errors).
+
+    Returns:
+        PlaylistWriteResult: Added, skipped and resumed counts with the final snapshot id.
+
+    Raises:
+        PlaylistWriteError: If a batch could not be added (committed batches stay journaled).
+        SpotifyRateLimitError: If Spotify kept rate limiting the requests.
+    """
+
+    source = list(dict.fromkeys(filter(None, track_ids)))
+    journal = get_playlist_write_journal()
+    write_key = journal.make_key(playlist_id, source)
+
+    existing, snapshot_id = fetch_playlist_track_ids(sp, playlist_id)
+    write = journal.get(write_key)
+    if write:
+        print(f"[yellow]Resuming the write into playlist {playlist_id}: {len(write.committed)} batches already committed[/yellow]")
+        already_present = len(source) - len(write.track_ids)
+    else:
+        missing = [track_id for track_id in source if track_id not in existing]
+        already_present = len(source) - len(missing)
+        if not missing:
+            return PlaylistWriteResult(0, already_present, 0, snapshot_id)
+        write = journal.start(write_key, playlist_id, missing)
+
+    resumed_batches = len(write.committed)
+    added = 0
+    for batch_index, batch in write.batches():
+        if batch_index in write.committed:
+            continue
+        # Only filters anything when resuming: the plan already left out the existing tracks
+        pending = [track_id for track_id in batch if track_id not in existing]
+        already_present += len(batch) - len(pending)
+        if pending:
+            snapshot_id = _add_batch(sp, playlist_id, pending, snapshot_id, attempts)
+        journal.commit(write, batch_index, snapshot_id)
+        added += len(pending)
+
+    journal.finish(write)
+    return PlaylistWriteResult(added, already_present, resumed_batches, snapshot_id)
+
+
+_playlist_write_journal: Optional[PlaylistWriteJournal] = None
+_playlist_write_journal_lock = threading.Lock()
+
+
+def get_playlist_write_journal() -> PlaylistWriteJournal:
+    """
+    Returns the process-wide playlist write journal, creating it on first use.
+    """
+
+    global _playlist_write_journal
+
+    with _playlist_write_journal_lock:
+        if _playlist_write_journal is None:
+            _playlist_write_journal = PlaylistWriteJournal(get_cache_dir() / "playlist_writes.sqlite3")
+        return _playlist_write_journal
@@ -0,0 +1,262 @@
+import os
+import json
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from backend.services.utils import get_cache_dir
+
+# Search strategies produced by generate_search_plan, in their default order
+STRATEGIES = ("channel", "fielded", "original", "cleaned", "artist_song", "song", "artist")
+
+# Starting result limits: precise queries rarely need more than a few results,
+# broad fallbacks (song or artist alone) need the full page
+DEFAULT_LIMITS = {"channel": 3, "fielded": 3, "original": 5, "cleaned": 5, "artist_song": 5, "song": 10, "artist": 10}
+MIN_LIMIT = 3
+MAX_LIMIT = 10
+
+# Evidence needed before the planner starts overriding the defaults
+MIN_SAMPLES = 50
+# Strategies that improve an existing match less often than this are skipped once a match exists
+PRUNE_IMPROVEMENT_RATE = 0.03
+# Weight of the default ordering when ranking strategies (pseudo-observations)
+PRIOR_WEIGHT = 20
+
+
+class StrategyStats:
+    """
+    Outcome counters for one search strategy.
+    """
+
+    __slots__ = ("attempts", "wins", "attempts_with_match", "improvements", "candidates", "win_ranks")
+
+    def __init__(self):
+        self.attempts = 0
+        self.wins = 0
+        self.attempts_with_match = 0
+        self.improvements = 0
+        self.candidates = 0  # Tracks returned, the bulk of a search response
+        self.win_ranks = [0] * MAX_LIMIT  # How often the accepted track was at each result position
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "StrategyStats":
+        stats = cls()
+        for name in cls.__slots__:
+            if name in data:
+                setattr(stats, name, data[name])
+        return stats
+
+
+class QueryPlanner:
+    """
+    Orders, prunes and sizes search strategies based on which ones produced accepted matches.
+
+    Every matched video reports which strategy found the accepted track, at which result
+    position, and which strategies were tried after a match already existed. From that:
+    - strategies are tried in order of (smoothed) win rate,
+    - strategies that almost never improve an existing match are skipped once one exists,
+    - each strategy's result `limit` shrinks to the positions its wins actually come from.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = path
+        self._lock = threading.Lock()
+        self.strategies: Dict[str, StrategyStats] = {name: StrategyStats() for name in STRATEGIES}
+        self.videos = 0
+        self.matches = 0
+        self.searches = 0
+        # Network traffic of searches that reached Spotify (cache hits cost nothing)
+        self.remote_searches = 0
+        self.response_bytes = 0
+
+        if path and path.exists():
+            self._load()
+
+    def _load(self) -> None:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+
+        self.videos = data.get("videos", 0)
+        self.matches = data.get("matches", 0)
+        self.searches = data.get("searches", 0)
+        self.remote_searches = data.get("remote_searches", 0)
+        self.response_bytes = data.get("response_bytes", 0)
+        for name, stats in data.get("strategies", {}).items():
+            self.strategies[name] = StrategyStats.from_dict(stats)
+
+    def save(self) -> None:
+        if not self.path:
+            return
+
+        with self._lock:
+            data = {
+                "videos": self.videos,
+                "matches": self.matches,
+                "searches": self.searches,
+                "remote_searches": self.remote_searches,
+                "response_bytes": self.response_bytes,
+                "strategies": {name: stats.to_dict() for name, stats in self.strategies.items()},
+            }
+
+        # Write then rename, so concurrent transfers never leave a half-written file
+        temp_path = self.path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        temp_path.write_text(json.dumps(data, separators=(",", ":")), encoding="utf-8")
+        os.replace(temp_path, self.path)
+
+    def _stats(self, strategy: str) -> StrategyStats:
+        if strategy not in self.strategies:
+            self.strategies[strategy] = StrategyStats()
+        return self.strategies[strategy]
+
+    def _priority(self, strategy: str) -> float:
+        stats = self._stats(strategy)
+        default_index = STRATEGIES.index(strategy) if strategy in STRATEGIES else len(STRATEGIES)
+        prior = 1.0 / (default_index + 2)  # Keeps the default order until there is evidence
+        return (stats.wins + PRIOR_WEIGHT * prior) / (stats.attempts + PRIOR_WEIGHT)
+
+    def limit_for(self, strategy: str) -> int:
+        """
+        Returns the result limit to request for a strategy.
+
+        Uses the result position that covers 95% of the strategy's wins, plus headroom
+        so the limit can grow again if wins start appearing near the cut-off.
+        """
+
+        stats = self._stats(strategy)
+        if stats.wins < MIN_SAMPLES:
+            return DEFAULT_LIMITS.get(strategy, MAX_LIMIT)
+
+        covered = 0
+        for rank, count in enumerate(stats.win_ranks):
+            covered += count
+            if covered >= 0.95 * stats.wins:
+                return max(MIN_LIMIT, min(MAX_LIMIT, rank + 3))
+        return MAX_LIMIT
+
+    def plan(self, queries: List[Tuple[str, str]]) -> List[Tuple[str, str, int]]:
+        """
+        Orders the generated queries and attaches a result limit to each.
+
+        Args:
+            queries (List[Tuple[str, str]]): (strategy, query) pairs from generate_search_plan.
+
+        Returns:
+            List[Tuple[str, str, int]]: (strategy, query, limit) in the order to try them.
+        """
+
+        with self._lock:
+            # sorted() is stable, so ties keep the generated order
+            ranked = sorted(queries, key=lambda item: -self._priority(item[0]))
+            return [(strategy, query, self.limit_for(strategy)) for strategy, query in ranked]
+
+    def should_try(self, strategy: str, have_match: bool) -> bool:
+        """
+        Tells whether a strategy is still worth a search call.
+
+        Without a match every strategy is tried. With one, strategies that historically
+        almost never improved an existing match are skipped.
+        """
+
+        if not have_match:
+            return True
+
+        with self._lock:
+            stats = self._stats(strategy)
+            if stats.attempts_with_match < MIN_SAMPLES:
+                return True
+            return stats.improvements / stats.attempts_with_match >= PRUNE_IMPROVEMENT_RATE
+
+    def record(
+        self,
+        tried: List[Tuple[str, bool, bool, int]],
+        winner: Optional[str],
+        winner_rank: int = 0
+    ) -> None:
+        """
+        Records the outcome of matching one video.
+
+        Args:
+            tried (List[Tuple[str, bool, bool, int]]): For every search made, in order:
+                (strategy, a match already existed before it, it improved the match, tracks returned).
+            winner (Optional[str]): Strategy whose results contained the accepted track, None if unmatched.
+            winner_rank (int): Position of the accepted track within that strategy's results.
+        """
+
+        with self._lock:
+            self.videos += 1
+            self.searches += len(tried)
+
+            for strategy, had_match, improved, candidates in tried:
+                stats = self._stats(strategy)
+                stats.attempts += 1
+                stats.candidates += candidates
+                if had_match:
+                    stats.attempts_with_match += 1
+                    if improved:
+                        stats.improvements += 1
+
+            if winner:
+                self.matches += 1
+                stats = self._stats(winner)
+                stats.wins += 1
+                stats.win_ranks[min(winner_rank, MAX_LIMIT - 1)] += 1
+
+    def record_traffic(self, remote_searches: int, response_bytes: int) -> None:
+        """
+        Adds the Spotify search traffic of one transfer.
+
+        Args:
+            remote_searches (int): Searches that were sent to Spotify.
+            response_bytes (int): Bytes of their response bodies.
+        """
+
+        with self._lock:
+            self.remote_searches += remote_searches
+            self.response_bytes += response_bytes
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Returns searches per matched track, response sizes and the per-strategy counters.
+        """
+
+        with self._lock:
+            return {
+                "videos": self.videos,
+                "matches": self.matches,
+                "searches": self.searches,
+                "searches_per_video": (self.searches / self.videos) if self.videos else 0.0,
+                "searches_per_match": (self.searches / self.matches) if self.matches else 0.0,
+                "remote_searches": self.remote_searches,
+                "response_bytes": self.response_bytes,
+                "bytes_per_search": (self.response_bytes / self.remote_searches) if self.remote_searches else 0.0,
+                "strategies": {
+                    name: {
+                        **stats.to_dict(),
+                        "win_rate": (stats.wins / stats.attempts) if stats.attempts else 0.0,
+                        "candidates_per_search": (stats.candidates / stats.attempts) if stats.attempts else 0.0,
+                        "limit": self.limit_for(name),
+                    }
+                    for name, stats in self.strategies.items()
+                },
+            }
+
+
+_query_planner: Optional[QueryPlanner] = None
+_query_planner_lock = threading.Lock()
+
+
+def get_query_planner() -> QueryPlanner:
+    """
+    Returns the process-wide query planner, loading its history from the cache directory.
+    """
+
+    global _query_planner
+
+    with _query_planner_lock:
+        if _query_planner is None:
+            _query_planner = QueryPlanner(get_cache_dir() / "query_planner.json")
+        return _query_planner
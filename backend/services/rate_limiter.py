@@ -0,0 +1,267 @@
+import os
+import re
+import time
+import asyncio
+import threading
+import spotipy
+from rich import print
+from typing import Any, Callable, Mapping, Optional, TypeVar
+
+T = TypeVar("T")
+
+# Spotify does not publish its limit (it is a rolling 30 second window per app),
+# so these defaults stay comfortably below what a single app is usually granted
+DEFAULT_RATE_PER_SECOND = 10.0
+DEFAULT_BURST = 20
+MAX_RATE_LIMIT_RETRIES = 5
+DEFAULT_RETRY_AFTER = 1.0
+# Status reported for server errors spotipy disguises as 429s when urllib3 does not name one
+DEFAULT_SERVER_ERROR_STATUS = 500
+
+
+class SpotifyRateLimitError(Exception):
+    """
+    Raised when a Spotify call is still rate limited after every retry.
+    """
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket shared by every thread and event loop of the process.
+
+    Besides the steady refill, the bucket can be paused entirely for a Retry-After
+    window, so one 429 slows down every caller instead of each discovering it alone.
+    """
+
+    blocking_io = False  # _try_acquire never touches the network
+
+    def __init__(self, rate_per_second: float = DEFAULT_RATE_PER_SECOND, burst: int = DEFAULT_BURST):
+        self.rate_per_second = rate_per_second
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated_at = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def _try_acquire(self) -> float:
+        """
+        Takes a token if one is available.
+
+        Returns:
+            float: 0 when a token was taken, otherwise the seconds to wait before retrying.
+        """
+
+        with self._lock:
+            now = time.monotonic()
+            if now < self._blocked_until:
+                return self._blocked_until - now
+
+            self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate_per_second)
+            self._updated_at = now
+
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            return (1 - self._tokens) / self.rate_per_second
+
+    def pause(self, seconds: float) -> None:
+        """
+        Blocks every caller for `seconds` (used with Spotify's Retry-After header).
+        """
+
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+
+    async def pause_async(self, seconds: float) -> None:
+        if self.blocking_io:
+            await asyncio.to_thread(self.pause, seconds)
+        else:
+            self.pause(seconds)
+
+    def acquire(self) -> None:
+        while True:
+            wait = self._try_acquire()
+            if wait <= 0:
+                return
+            time.sleep(wait)
+
+    async def acquire_async(self) -> None:
+        while True:
+            if self.blocking_io:
+                wait = await asyncio.to_thread(self._try_acquire)
+            else:
+                wait = self._try_acquire()
+            if wait <= 0:
+                return
+            await asyncio.sleep(wait)
+
+
+class RedisTokenBucket(TokenBucket):
+    """
+    Token bucket whose state lives in Redis, shared by every uvicorn worker and node.
+
+    The refill, the token take and the Retry-After pause run as Lua scripts, so they are
+    atomic across processes and use the Redis server clock rather than each worker's.
+    """
+
+    blocking_io = True
+
+    _ACQUIRE_SCRIPT = """
+    local now_parts = redis.call('TIME')
+    local now = tonumber(now_parts[1]) + tonumber(now_parts[2]) / 1000000
+    local rate = tonumber(ARGV[1])
+    local burst = tonumber(ARGV[2])
+    local state = redis.call('HMGET', KEYS[1], 'tokens', 'updated_at', 'blocked_until')
+    local blocked_until = tonumber(state[3]) or 0
+    if now < blocked_until then
+        return tostring(blocked_until - now)
+    end
+    local tokens = tonumber(state[1]) or burst
+    local updated_at = tonumber(state[2]) or now
+    tokens = math.min(burst, tokens + (now - updated_at) * rate)
+    local wait = 0
+    if tokens >= 1 then
+        tokens = tokens - 1
+    else
+        wait = (1 - tokens) / rate
+    end
+    redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'updated_at', tostring(now))
+    redis.call('EXPIRE', KEYS[1], 3600)
+    return tostring(wait)
+    """
+
+    _PAUSE_SCRIPT = """
+    local now_parts = redis.call('TIME')
+    local now = tonumber(now_parts[1]) + tonumber(now_parts[2]) / 1000000
+    local blocked_until = tonumber(redis.call('HGET', KEYS[1], 'blocked_until')) or 0
+    local requested = now + tonumber(ARGV[1])
+    if requested > blocked_until then
+        redis.call('HSET', KEYS[1], 'blocked_until', tostring(requested))
+    end
+    redis.call('EXPIRE', KEYS[1], 3600)
+    return 1
+    """
+
+    def __init__(self, client, key: str, rate_per_second: float = DEFAULT_RATE_PER_SECOND, burst: int = DEFAULT_BURST):
+        super().__init__(rate_per_second, burst)
+        self.client = client
+        self.key = key
+        self._acquire_script = client.register_script(self._ACQUIRE_SCRIPT)
+        self._pause_script = client.register_script(self._PAUSE_SCRIPT)
+
+    def _try_acquire(self) -> float:
+        return float(self._acquire_script(keys=[self.key], args=[self.rate_per_second, self.burst]))
+
+    def pause(self, seconds: float) -> None:
+        self._pause_script(keys=[self.key], args=[seconds])
+
+
+def retry_after_seconds(headers: Optional[Mapping[str, str]]) -> float:
+    """
+    Reads Spotify's Retry-After header (seconds) from a 429 response.
+    """
+
+    headers = headers or {}
+    try:
+        return float(headers.get("Retry-After", DEFAULT_RETRY_AFTER))
+    except (TypeError, ValueError):
+        return DEFAULT_RETRY_AFTER
+
+
+def _server_error_from_retries(error: spotipy.SpotifyException) -> Optional[spotipy.SpotifyException]:
+    """
+    Recognizes the 429 spotipy raises once urllib3 runs out of 5xx retries.
+
+    Spotipy maps requests' RetryError to SpotifyException(429, ..., "Max Retries") with empty
+    headers, so it cannot be told apart from a real rate limit by its status alone. A real
+    429 always carries the response's headers.
+
+    Returns:
+        Optional[spotipy.SpotifyException]: The error re-raised as the server error it was, or
+        None for a genuine rate limit.
+    """
+
+    if error.http_status != 429 or error.headers:
+        return None
+
+    # urllib3's reason reads "too many 503 error responses"
+    match = re.search(r"too many (\d{3}) error responses", str(error.reason or ""))
+    status = int(match.group(1)) if match else DEFAULT_SERVER_ERROR_STATUS
+    return spotipy.SpotifyException(status, error.code, error.msg, reason=error.reason)
+
+
+def call_spotify(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    Calls a spotipy method through the shared rate limiter.
+
+    A 429 pauses the whole bucket for the Retry-After window and the call is retried,
+    instead of surfacing as a failed search. Exhausted 5xx retries, which spotipy also
+    reports as 429, are raised as server errors without pausing anyone.
+
+    Args:
+        fn (Callable[..., T]): Bound spotipy method, e.g. sp.search.
+        *args, **kwargs: Arguments for the call.
+
+    Returns:
+        T: The call's result.
+
+    Raises:
+        SpotifyRateLimitError: If still rate limited after MAX_RATE_LIMIT_RETRIES retries.
+        spotipy.SpotifyException: On any other error.
+    """
+
+    limiter = get_spotify_rate_limiter()
+
+    for _ in range(MAX_RATE_LIMIT_RETRIES + 1):
+        limiter.acquire()
+        try:
+            return fn(*args, **kwargs)
+        except spotipy.SpotifyException as error:
+            if error.http_status != 429:
+                raise
+            server_error = _server_error_from_retries(error)
+            if server_error is not None:
+                raise server_error from error
+            retry_after = retry_after_seconds(error.headers)
+            print(f"[yellow]Rate limited by Spotify, pausing all calls for {retry_after}s[/yellow]")
+            limiter.pause(retry_after)
+
+    raise SpotifyRateLimitError(f"Spotify is still rate limiting after {MAX_RATE_LIMIT_RETRIES} retries")
+
+
+_rate_limiter: Optional[TokenBucket] = None
+_rate_limiter_lock = threading.Lock()
+
+
+def get_spotify_rate_limiter() -> TokenBucket:
+    """
+    Returns the process-wide Spotify rate limiter.
+
+    Configured through SPOTIFY_RATE_LIMIT_PER_SECOND and SPOTIFY_RATE_LIMIT_BURST. When
+    REDIS_URL is set the bucket is kept in Redis and shared across workers; if Redis is
+    unreachable the limiter falls back to a per-process bucket.
+    """
+
+    global _rate_limiter
+
+    with _rate_limiter_lock:
+        if _rate_limiter is not None:
+            return _rate_limiter
+
+        rate_per_second = float(os.getenv("SPOTIFY_RATE_LIMIT_PER_SECOND", DEFAULT_RATE_PER_SECOND))
+        burst = int(os.getenv("SPOTIFY_RATE_LIMIT_BURST", DEFAULT_BURST))
+        redis_url = os.getenv("REDIS_URL")
+
+        if redis_url:
+            try:
+                import redis
+
+                client = redis.Redis.from_url(redis_url, socket_timeout=2)
+                client.ping()
+                _rate_limiter = RedisTokenBucket(client, "syncwave:spotify:rate_limit", rate_per_second, burst)
+                return _rate_limiter
+            except Exception as e:
+                print(f"[yellow]Redis rate limiter unavailable ({e}), using a per-process limiter[/yellow]")
+
+        _rate_limiter = TokenBucket(rate_per_second, burst)
+        return _rate_limiter
@@ -0,0 +1,178 @@
+import os
+import json
+import time
+import zlib
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Optional, Dict, Any
+from backend.services.utils import get_cache_dir, normalize_query
+
+# One week: catalog search results change slowly, but new releases should show up eventually
+DEFAULT_TTL_SECONDS = 7 * 24 * 3600
+DEFAULT_MAX_ENTRIES = 100_000
+
+
+class SpotifySearchCache:
+    """
+    Persistent, size-bounded cache of Spotify search responses stored in SQLite.
+
+    Entries are keyed by the normalized query and search type, expire after `ttl_seconds`
+    and are evicted least-recently-used first once more than `max_entries` are stored.
+    A response fetched with a larger `limit` also answers later requests with a smaller one.
+    The database runs in WAL mode so several server workers can share the same file.
+    """
+
+    def __init__(self, path: Path, ttl_seconds: int = DEFAULT_TTL_SECONDS, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS search_cache (
+                key TEXT PRIMARY KEY,
+                search_limit INTEGER NOT NULL,
+                payload BLOB NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_search_cache_accessed ON search_cache (accessed_at)")
+        self._size = self._conn.execute("SELECT COUNT(*) FROM search_cache").fetchone()[0]
+
+    @staticmethod
+    def make_key(query: str, search_type: str = "track") -> str:
+        return f"{search_type}:{normalize_query(query)}"
+
+    def get(self, query: str, limit: int, search_type: str = "track") -> Optional[Dict[str, Any]]:
+        """
+        Returns the cached search response for the query, or None on a miss.
+
+        Args:
+            query (str): The search query as sent to Spotify.
+            limit (int): Number of items the caller asked for.
+            search_type (str): Spotify item type ("track", "artist", ...).
+
+        Returns:
+            Optional[Dict[str, Any]]: Response shaped like sp.search, trimmed to `limit` items.
+        """
+
+        key = self.make_key(query, search_type)
+        now = time.time()
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT search_limit, payload, created_at FROM search_cache WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is None or row[0] < limit or now - row[2] > self.ttl_seconds:
+                self.misses += 1
+                return None
+
+            self._conn.execute("UPDATE search_cache SET accessed_at = ? WHERE key = ?", (now, key))
+            self.hits += 1
+
+        response = json.loads(zlib.decompress(row[1]))
+        items_key = f"{search_type}s"
+        if items_key in response:
+            response[items_key]["items"] = response[items_key]["items"][:limit]
+        return response
+
+    def set(self, query: str, limit: int, search_type: str, response: Dict[str, Any]) -> None:
+        """
+        Stores a search response, evicting the least recently used entries when full.
+
+        Args:
+            query (str): The search query as sent to Spotify.
+            limit (int): The limit the response was fetched with.
+            search_type (str): Spotify item type.
+            response (Dict[str, Any]): Raw sp.search response.
+        """
+
+        key = self.make_key(query, search_type)
+        payload = zlib.compress(json.dumps(response, separators=(",", ":")).encode("utf-8"))
+        now = time.time()
+
+        with self._lock:
+            inserted = self._conn.execute(
+                "SELECT 1 FROM search_cache WHERE key = ?", (key,)
+            ).fetchone() is None
+
+            self._conn.execute(
+                "INSERT OR REPLACE INTO search_cache (key, search_limit, payload, created_at, accessed_at) VALUES (?, ?, ?, ?, ?)",
+                (key, limit, payload, now, now)
+            )
+
+            if inserted:
+                self._size += 1
+            if self._size > self.max_entries:
+                self._evict(now)
+
+    def _evict(self, now: float) -> None:
+        """
+        Drops expired entries, then the least recently used ones down to 90% of capacity.
+
+        Evicting in chunks keeps the DELETE off the hot path for most inserts.
+        """
+
+        self._conn.execute("DELETE FROM search_cache WHERE created_at < ?", (now - self.ttl_seconds,))
+        self._size = self._conn.execute("SELECT COUNT(*) FROM search_cache").fetchone()[0]
+
+        target = int(self.max_entries * 0.9)
+        if self._size > target:
+            self._conn.execute(
+                "DELETE FROM search_cache WHERE key IN (SELECT key FROM search_cache ORDER BY accessed_at LIMIT ?)",
+                (self._size - target,)
+            )
+            self._size = target
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM search_cache")
+            self._size = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Returns hit/miss counters for this process along with the current cache size.
+        """
+
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": (self.hits / lookups) if lookups else 0.0,
+            "entries": self._size,
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+        }
+
+
+_search_cache: Optional[SpotifySearchCache] = None
+_search_cache_lock = threading.Lock()
+
+
+def get_search_cache() -> SpotifySearchCache:
+    """
+    Returns the process-wide Spotify search cache, creating it on first use.
+
+    Configured through SPOTIFY_SEARCH_CACHE_TTL (seconds) and SPOTIFY_SEARCH_CACHE_MAX_ENTRIES.
+    """
+
+    global _search_cache
+
+    with _search_cache_lock:
+        if _search_cache is None:
+            _search_cache = SpotifySearchCache(
+                get_cache_dir() / "spotify_search.sqlite3",
+                ttl_seconds=int(os.getenv("SPOTIFY_SEARCH_CACHE_TTL", DEFAULT_TTL_SECONDS)),
+                max_entries=int(os.getenv("SPOTIFY_SEARCH_CACHE_MAX_ENTRIES", DEFAULT_MAX_ENTRIES)),
+            )
+        return _search_cache
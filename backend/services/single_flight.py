@@ -0,0 +1,101 @@
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls that share a key into one in-flight execution.
+
+    The first caller for a key (the leader) runs the work; every caller arriving while
+    it is still running waits for the same result instead of repeating it. Waiters are
+    backed by a thread-safe concurrent.futures.Future, so sync callers, async callers and
+    callers running on different event loops (one per transfer) all share a flight.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[str, Future] = {}
+        self.coalesced = 0
+
+    def _claim(self, key: str) -> Tuple[Future, bool]:
+        with self._lock:
+            future = self._calls.get(key)
+            if future is not None:
+                self.coalesced += 1
+                return future, False
+
+            future = Future()
+            self._calls[key] = future
+            return future, True
+
+    def _finish(self, key: str, future: Future, result: Any = None, error: BaseException = None) -> None:
+        with self._lock:
+            self._calls.pop(key, None)
+
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    def do(self, key: str, fn: Callable[[], T]) -> T:
+        """
+        Runs fn() unless an identical call is already in flight, then returns its result.
+
+        Args:
+            key (str): Identity of the call.
+            fn (Callable[[], T]): The work to run when this caller leads the flight.
+
+        Returns:
+            T: Result of the (possibly shared) call. Errors are shared the same way.
+        """
+
+        future, leader = self._claim(key)
+        if not leader:
+            return future.result()
+
+        try:
+            result = fn()
+        except BaseException as error:
+            self._finish(key, future, error=error)
+            raise
+
+        self._finish(key, future, result=result)
+        return result
+
+    async def do_async(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Asyncio version of do().
+
+        Args:
+            key (str): Identity of the call.
+            fn (Callable[[], Awaitable[T]]): Coroutine function to await when leading the flight.
+
+        Returns:
+            T: Result of the (possibly shared) call.
+        """
+
+        future, leader = self._claim(key)
+        if not leader:
+            # Shielded so a cancelled waiter does not cancel the flight everyone shares
+            return await asyncio.shield(asyncio.wrap_future(future))
+
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            # Waiters were not cancelled themselves, so hand them a regular failure
+            self._finish(key, future, error=RuntimeError(f"In-flight call for '{key}' was cancelled"))
+            raise
+        except BaseException as error:
+            self._finish(key, future, error=error)
+            raise
+
+        self._finish(key, future, result=result)
+        return result
+
+
+# Shared by every transfer running in this process
+search_flights = SingleFlight()
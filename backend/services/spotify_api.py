@@ -1,17 +1,106 @@
 import os
-import re
+import asyncio
+import aiohttp
 import spotipy
+import requests
 from rich import print
+from urllib3.util.retry import Retry
 from spotipy.oauth2 import SpotifyOAuth
+from spotipy.cache_handler import CacheFileHandler
 from dotenv import load_dotenv
-from typing import Optional, List, Dict, Any, Tuple
-from backend.models.transfer import SpotifyTrack, YouTubeVideo, SongResult
+from typing import Optional, List, Dict, Any, Tuple, Union, AsyncIterable, AsyncIterator, Callable, Iterable
+from backend.models.records import SongRecord, SpotifyTrack, YouTubeVideo
+from backend.models.transfer import TransferProgress
+from backend.services.title_parser import ParsedTitle, channel_artist, has_confident_split, parse_title, with_channel_artist
+from backend.services.match_scoring import CandidateScorer, calculate_match_confidence
+from backend.services.search_cache import get_search_cache
+from backend.services.single_flight import search_flights
+from backend.services.query_planner import get_query_planner
+from backend.services.utils import normalize_query
+from backend.services.rate_limiter import SpotifyRateLimitError, call_spotify
+from backend.services.track_mapping import get_track_mapping_store
+from backend.services.track_index import compact_track, get_track_index
+from backend.services.artist_catalog import ArtistPrefetcher, detected_artist
+from backend.services.client_pool import PooledClient, get_client_pool
+from backend.services.playlist_directory import get_playlist_directory
+from backend.services.playlist_writer import write_playlist_tracks
+from backend.services.spotify_async import (
+    AsyncSpotifyClient,
+    DEFAULT_SEARCH_CONCURRENCY,
+    SPOTIFY_RETRY_BACKOFF,
+    SPOTIFY_RETRY_STATUSES,
+    SPOTIFY_TRANSPORT_RETRIES,
+    clamp_concurrency,
+    iterate_in_thread
+)
 
 load_dotenv()
 
+
+def _build_spotify_session() -> requests.Session:
+    """
+    Builds the HTTP session of a Spotify client.
+
+    urllib3 retries any response carrying Retry-After (429s included) unless told not to,
+    which would sleep and resend inside each worker thread behind the shared rate limiter's
+    back. Only 5xx responses are retried here; 429s are left to call_spotify.
+
+    POSTs are never resent: adding tracks is not idempotent, and playlist_writer checks
+    whether a failed add landed before sending it again.
+    """
+
+    retry = Retry(
+        total=SPOTIFY_TRANSPORT_RETRIES,
+        connect=None,
+        read=False,
+        allowed_methods=frozenset(["GET", "PUT", "DELETE"]),
+        status=SPOTIFY_TRANSPORT_RETRIES,
+        backoff_factor=SPOTIFY_RETRY_BACKOFF,
+        status_forcelist=SPOTIFY_RETRY_STATUSES,
+        respect_retry_after_header=False
+    )
+    adapter = requests.adapters.HTTPAdapter(max_retries=retry)
+
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def _build_spotify_client(scope: str, cache_handler: CacheFileHandler) -> PooledClient:
+    auth_manager = SpotifyOAuth(
+        client_id=os.getenv("SPOTIFY_CLIENT_ID"),
+        client_secret=os.getenv("SPOTIFY_CLIENT_SECRET"),
+        redirect_uri=os.getenv("SPOTIFY_REDIRECT_URI"),
+        scope=scope,
+        cache_handler=cache_handler
+    )
+    sp = spotipy.Spotify(
+        auth_manager=auth_manager,
+        # 429s are left to the shared rate limiter (call_spotify) instead of spotipy's per-call sleep
+        requests_session=_build_spotify_session()
+    )
+
+    def expires_at() -> Optional[float]:
+        token_info = auth_manager.cache_handler.get_cached_token()
+        return token_info["expires_at"] if token_info else None
+
+    def refresh() -> None:
+        # Saved through the auth manager's cache handler, where spotipy reads it on the next call
+        auth_manager.refresh_access_token(auth_manager.cache_handler.get_cached_token()["refresh_token"])
+
+    return PooledClient(sp, expires_at, refresh)
+
+
 def get_spotify_client(scope: str = None) -> spotipy.Spotify:
     """
-    Authenticates and returns a Spotipy client instance.
+    Returns the pooled, authenticated Spotipy client for the configured account.
+
+    The client is built once per (Spotify app, token cache file, scope) and its token is
+    refreshed in the background before it expires (see client_pool). The backend acts as
+    a single Spotify account: the one whose token is in spotipy's cache file (.cache, or
+    .cache-{SPOTIPY_CLIENT_USERNAME}). Every caller shares that account's client; the
+    routes carry no per-user tokens to key it by.
 
     Args:
         scope (str): The Spotify OAuth scopes as a space-separated string.
@@ -23,51 +112,38 @@ def get_spotify_client(scope: str = None) -> spotipy.Spotify:
     if scope is None:
         scope = os.getenv("SPOTIFY_SCOPE")
 
-    sp = spotipy.Spotify(auth_manager=SpotifyOAuth(
-        client_id=os.getenv("SPOTIFY_CLIENT_ID"),
-        client_secret=os.getenv("SPOTIFY_CLIENT_SECRET"),
-        redirect_uri=os.getenv("SPOTIFY_REDIRECT_URI"),
-        scope=scope
-    ))
-
-    return sp
+    cache_handler = CacheFileHandler()
+    key = f"spotify:{os.getenv('SPOTIFY_CLIENT_ID')}:{os.path.abspath(cache_handler.cache_path)}:{scope}"
+    return get_client_pool().get(key, lambda: _build_spotify_client(scope, cache_handler))
 
 
-def api_get_existing_playlist_id(sp: spotipy.Spotify, user_id: str, name: str) -> str | None:
+def api_get_existing_playlist_id(sp: spotipy.Spotify, user_id: Optional[str], name: str) -> str | None:
     """
     Checks if a playlist with the given name already exists.
 
+    Answered from the cached playlist directory (see playlist_directory), which lists the
+    user's playlists 50 at a time at most once per PLAYLIST_DIRECTORY_TTL.
+
     Args:
         sp (spotipy.Spotify): Authenticated Spotify client.
-        user_id (str): id of the user
+        user_id (Optional[str]): id of the user (looked up when None)
         name (str): The name of the playlist to look for.
 
     Returns:
         str | None: The ID of the playlist if found, otherwise None.
     """
 
-    user_id = sp.me()["id"]
-    limit = 10
-    offset = 0
-
-    while True:
-        playlists = sp.current_user_playlists(limit=limit, offset=offset)
-        for playlist in playlists["items"]:
-            if playlist["name"].lower() == name.lower() and playlist["owner"]["id"] == user_id:
-                return playlist["id"]
-
-        if playlists["next"]:
-            offset += limit
-        else:
-            break
-
-    return None
+    entry = get_playlist_directory().find(sp, name, user_id=user_id)
+    return entry.playlist_id if entry else None
 
 
 def api_create_playlist(sp: spotipy.Spotify, name: str, isPublic: bool = True, description: str = "") -> Dict[str, Any]:
     """
     Creates a new playlist or reuses existing one with same name.
 
+    An existing playlist is found in the cached playlist directory and returned from
+    it, so reusing a playlist costs no API call and creating one a single call.
+
     Args:
         sp (spotipy.Spotify): The authenticated Spotify client.
         name (str): The name of the playlist.
@@ -75,216 +151,147 @@ def api_create_playlist(sp: spotipy.Spotify, name: str, isPublic: bool = True, d
         description (str): (Optional) Description for the playlist.
 
     Returns:
-        Dict[str, Any]: Complete playlist object with id, url, etc.
+        Dict[str, Any]: Playlist object with id, name, snapshot_id and external_urls
+        (the complete object when the playlist was just created).
     """
 
-    user_id = sp.me()["id"] 
-    existing_id = api_get_existing_playlist_id(sp, user_id, name)
+    directory = get_playlist_directory()
+    user_id = directory.user_id(sp)
     
-    if existing_id:
-        print(f"[bold yellow]Playlist '{name}' already exists. Using existing playlist.[/bold yellow]\n")
-        # Get the full playlist object
-        playlist = sp.playlist(existing_id)
-        return playlist
+    # Held while creating, so concurrent transfers to the same name share one playlist
+    with directory.locked(user_id):
+        existing = directory.find(sp, name, user_id=user_id)
+        if existing:
+            print(f"[bold yellow]Playlist '{name}' already exists. Using existing playlist.[/bold yellow]\n")
+            return existing.to_playlist()
+
+        # Create the playlist
+        new_playlist = call_spotify(sp.user_playlist_create, user=user_id, name=name, public=isPublic, description=description)
+        directory.add(user_id, new_playlist)
+        return new_playlist
+
 
-    # Create the playlist
-    new_playlist = sp.user_playlist_create(user=user_id, name=name, public=isPublic, description=description)
-    return new_playlist
+# Fielded track:/artist: queries for titles with a reliable "Artist - Song" split
+FIELDED_QUERIES = os.getenv("SPOTIFY_FIELDED_QUERIES", "true").lower() == "true"
 
 
-def generate_smart_search_queries(youtube_title: str) -> List[str]:
+def fielded_query(track: str, artist: str) -> str:
     """
-    Generate intelligent search queries from YouTube title by cleaning and splitting.
+    Builds a Spotify fielded search query, e.g. 'track:"You Still Love Me" artist:"Tasha Cobbs"'.
+    """
+
+    # Quotes would end the phrase early, and Spotify ignores them inside a name anyway
+    track = track.replace('"', '')
+    artist = artist.replace('"', '')
+    return f'track:"{track}" artist:"{artist}"'
+
+
+def generate_search_plan(
+    youtube_title: Union[str, ParsedTitle],
+    owner_artist: Optional[str] = None
+) -> List[Tuple[str, str]]:
+    """
+    Generate intelligent search queries from YouTube title by cleaning and splitting,
+    labelled with the strategy that produced each one.
     
     This function takes a messy YouTube title like:
     "Tasha Cobbs - You Still Love Me [Official Video] (Bass Boosted)"
     
     And generates multiple search strategies:
-    1. "Tasha Cobbs - You still Love Me [Official Video] (Bass Boosted)"  # Original
-    2. "Tasha Cobbs - You still Love Me"  # Cleaned version
-    3. "Tasha Cobbs You still Love Me"    # Artist + song format
-    4. "You still Love Me"                # Just song name
+    0. channel:     'track:"You still Love Me" artist:"Tasha Cobbs"' (artist-owned channels only)
+    0. fielded:     'track:"You still Love Me" artist:"Tasha Cobbs"' (confident "Artist - Song" splits)
+    1. original:    "Tasha Cobbs - You still Love Me [Official Video] (Bass Boosted)"
+    2. cleaned:     "Tasha Cobbs - You still Love Me"
+    3. artist_song: "Tasha Cobbs You still Love Me"
+    4. song:        "You still Love Me"
+    5. artist:      "Tasha Cobbs"
     
     Args:
-        youtube_title (str): The original YouTube video title
+        youtube_title (Union[str, ParsedTitle]): The original YouTube video title, or its parsed record
+        owner_artist (Optional[str]): Artist of the video's "Artist - Topic" or VEVO channel
         
     Returns:
-        List[str]: List of search queries ordered by likelihood of success
+        List[Tuple[str, str]]: (strategy, query) pairs in the default order
     """
     
+    parsed = youtube_title if isinstance(youtube_title, ParsedTitle) else parse_title(youtube_title)
     queries = []
-    title = youtube_title.strip()
-    
-    # 1. Always try the original title first
-    queries.append(title)
-    
-    # 2. Remove common YouTube noise patterns
-    noise_patterns = [
-        r'\[.*?\]',              # [Official Video], [HD], [Lyrics]
-        r'\(.*?\)',              # (Official Video), (Lyrics), (Bass Boosted)
-        r'【.*?】',               # Japanese/Chinese brackets
-        r'\s*-\s*official.*',    # - Official Video, - Official Audio
-        r'\s*-\s*lyrics?.*',     # - Lyrics, - Lyric Video
-        r'\s*(bass\s*boosted|nightcore|remix|cover|acoustic|live).*',  # Modifications
-        r'\s*\|\s*.*',           # Everything after pipe |
-        r'\s*ft\.?\s*.*',        # Remove featuring artists for cleaner search
-        r'\s*feat\.?\s*.*',      # Remove featuring artists
-        r'\s*featuring\s*.*',    # Remove featuring artists
-    ]
-    
-    clean_title = title
-    for pattern in noise_patterns:
-        clean_title = re.sub(pattern, '', clean_title, flags=re.IGNORECASE)
-    
-    clean_title = clean_title.strip()
-    if clean_title and clean_title != title:
-        queries.append(clean_title)
-    
-    # 3. Try different splitting strategies
-    separators = [' - ', ' – ', ' — ', ' | ', ' • ', ': ']
-    
-    for sep in separators:
-        if sep in title:
-            parts = title.split(sep, 1)  # Only split on first occurrence
-            if len(parts) >= 2:
-                artist_part = parts[0].strip()
-                song_part = parts[1].strip()
-                
-                # Clean the song part of noise
-                for pattern in noise_patterns:
-                    song_part = re.sub(pattern, '', song_part, flags=re.IGNORECASE)
-                song_part = song_part.strip()
-                
-                if artist_part and song_part:
-                    # Try "artist song" format (no separator)
-                    artist_song = f"{artist_part} {song_part}"
-                    queries.append(artist_song)
-                    
-                    # Try just the song name
-                    queries.append(song_part)
-                    
-                    # Try just the artist name
-                    queries.append(artist_part)
-            break
+    
+    # 0. The channel names the artist exactly: a fielded query is the most precise search
+    if owner_artist:
+        same_artist = parsed.artist and parsed.artist.lower() == owner_artist.lower()
+        song = parsed.song if same_artist else parsed.clean_title
+        if song:
+            queries.append(("channel", fielded_query(song, owner_artist)))
+    
+    # 0. A dash-separated title names track and artist: Spotify only returns tracks matching both
+    if FIELDED_QUERIES and has_confident_split(parsed):
+        queries.append(("fielded", fielded_query(parsed.song, parsed.artist)))
+    
+    # 1. Always try the original title
+    queries.append(("original", parsed.title))
+    
+    # 2. Title with common YouTube noise patterns removed
+    if parsed.clean_title and parsed.clean_title != parsed.title:
+        queries.append(("cleaned", parsed.clean_title))
+    
+    # 3. Artist/song split on the first separator found
+    if parsed.artist and parsed.song:
+        # Try "artist song" format (no separator)
+        queries.append(("artist_song", f"{parsed.artist} {parsed.song}"))
+        
+        # Try just the song name
+        queries.append(("song", parsed.song))
+        
+        # Try just the artist name
+        queries.append(("artist", parsed.artist))
     
     # 4. Remove duplicates while preserving order
     seen = set()
     unique_queries = []
-    for query in queries:
+    for strategy, query in queries:
         if query.lower() not in seen and len(query.strip()) > 2:  # Minimum length check
             seen.add(query.lower())
-            unique_queries.append(query)
+            unique_queries.append((strategy, query))
     
     return unique_queries
 
 
-def calculate_match_confidence(youtube_title: str, spotify_track: Dict[str, Any]) -> float:
+def parse_video_title(youtube_video: YouTubeVideo) -> Tuple[ParsedTitle, Optional[str]]:
+    """
+    Parses a video's title for searching and scoring, using its channel when it is an artist's.
+
+    Videos uploaded by "Artist - Topic" or VEVO channels are parsed as "Artist - Title" when
+    the title does not name the artist, so the artist counts in scoring too.
+
+    Args:
+        youtube_video (YouTubeVideo): The YouTube video.
+
+    Returns:
+        Tuple[ParsedTitle, Optional[str]]: The parsed title and the channel's artist (None
+        when the channel is not an artist channel).
     """
-    Calculate confidence score (0.0 to 1.0) for how well a Spotify track matches a YouTube title.
-    
-    This function analyzes multiple factors:
-    - Does the song name appear in the YouTube title?
-    - Does any artist name appear in the YouTube title?
-    - Are there negative indicators (remix, cover, etc.)?
     
-    Example:
-    YouTube: "Tasha Cobbs - You Still Love Me [Official Video]"
-    Spotify: {"name": "You Still Love Me", "artists": [{"name": "Tasha Cobbs"}]}
-    Result: ~0.9 confidence (high match)
+    owner_artist = channel_artist(youtube_video.video_owner_channel)
+    parsed = parse_title(with_channel_artist(youtube_video.title, youtube_video.video_owner_channel))
+    return parsed, owner_artist
+
+
+def generate_smart_search_queries(youtube_title: Union[str, ParsedTitle]) -> List[str]:
+    """
+    Generate intelligent search queries from YouTube title (see generate_search_plan).
     
-    YouTube: "You Still Love Me (Piano Cover)"
-    Spotify: {"name": "You Still Love Me", "artists": [{"name": "Tasha Cobbs"}]}
-    Result: ~0.3 confidence (low match - it's a cover)
+    Only the free-text queries are returned, as before fielded queries were introduced;
+    the transfer pipeline uses generate_search_plan directly.
     
     Args:
-        youtube_title (str): Original YouTube video title
-        spotify_track (Dict[str, Any]): Spotify track object from API
+        youtube_title (Union[str, ParsedTitle]): The original YouTube video title, or its parsed record
         
     Returns:
-        float: Confidence score between 0.0 and 1.0
+        List[str]: List of search queries ordered by likelihood of success
     """
     
-    confidence = 0.0
-    youtube_lower = youtube_title.lower()
-    
-    # Get Spotify track data
-    spotify_name = spotify_track["name"].lower()
-    spotify_artists = [artist["name"].lower() for artist in spotify_track["artists"]]
-    spotify_album = spotify_track["album"]["name"].lower()
-    
-    # 1. Song name matching (40% weight)
-    if spotify_name in youtube_lower:
-        # Exact match gets full points
-        confidence += 0.4
-    else:
-        # Partial matching - check if significant words match
-        spotify_words = set(spotify_name.split())
-        youtube_words = set(youtube_lower.split())
-        common_words = spotify_words.intersection(youtube_words)
-        
-        if common_words and len(common_words) >= len(spotify_words) * 0.6:
-            # If 60%+ of song title words match
-            confidence += 0.3
-    
-    # 2. Artist matching (35% weight)
-    artist_match_score = 0.0
-    for artist in spotify_artists:
-        if artist in youtube_lower:
-            artist_match_score = 0.35
-            break
-        else:
-            # Check partial artist name matching
-            artist_words = set(artist.split())
-            youtube_words = set(youtube_lower.split())
-            if artist_words.intersection(youtube_words):
-                artist_match_score = max(artist_match_score, 0.15)
-    
-    confidence += artist_match_score
-    
-    # 3. Album name bonus (10% weight)
-    if spotify_album in youtube_lower:
-        confidence += 0.1
-    
-    # 4. Negative indicators - penalize covers, remixes, etc.
-    negative_indicators = [
-        ('cover', -0.2),          # Strong penalty for covers
-        ('remix', -0.2),          # Medium penalty for remixes
-        ('acoustic', -0.15),      # Medium penalty for acoustic versions
-        ('live', -0.15),          # Medium penalty for live versions
-        ('instrumental', -0.25),  # Strong penalty for instrumentals
-        ('karaoke', -0.3),        # Strong penalty for karaoke
-        ('bass boosted', -0.2),   # Medium penalty for bass boosted
-        ('nightcore', -0.25),     # Strong penalty for nightcore
-        ('slowed', -0.2),         # Medium penalty for slowed versions
-        ('8d audio', -0.2),       # Medium penalty for 8D audio
-        ('piano', -0.1),          # Small penalty if "piano" appears
-    ]
-    
-    for indicator, penalty in negative_indicators:
-        if indicator in youtube_lower:
-            confidence += penalty  # penalty is negative, so this reduces confidence
-    
-    # 5. Positive indicators - bonus for official content
-    positive_indicators = [
-        ('official', 0.1),        # Bonus for official content
-        ('audio', 0.05),          # Small bonus for audio versions
-        ('music video', 0.05),    # Small bonus for music videos
-    ]
-    
-    for indicator, bonus in positive_indicators:
-        if indicator in youtube_lower:
-            confidence += bonus
-    
-    # 6. Length similarity bonus (5% weight)
-    # If the YouTube title is roughly the same length as "Artist - Song", it's probably cleaner
-    expected_length = len(spotify_artists[0]) + len(spotify_name) + 3  # +3 for " - "
-    actual_length = len(youtube_title)
-    
-    if 0.7 <= actual_length / expected_length <= 1.5:  # Within reasonable range
-        confidence += 0.05
-    
-    # Ensure confidence is between 0.0 and 1.0
-    return max(0.0, min(1.0, confidence))
+    return [query for strategy, query in generate_search_plan(youtube_title) if strategy != "fielded"]
 
 
 def create_artist_string(artists: List[Dict[str, Any]]) -> str:
@@ -319,11 +326,279 @@ def create_artist_string(artists: List[Dict[str, Any]]) -> str:
         return f"{primary_artist} feat. {featured_string}"
 
 
+def _compact_search_results(results: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Strips the tracks of a fresh search response down to the fields scoring uses (see
+    track_index.compact_track), before it is cached, indexed and scored.
+    """
+
+    tracks = results.get("tracks")
+    if not tracks or not tracks.get("items"):
+        return results
+    return {**results, "tracks": {**tracks, "items": [compact_track(track) for track in tracks["items"] if track]}}
+
+
+def _store_search_results(query: str, limit: int, search_type: str, results: Dict[str, Any]) -> None:
+    """
+    Caches a fresh search response and adds its tracks to the local track index.
+    """
+
+    get_search_cache().set(query, limit, search_type, results)
+    tracks = (results.get("tracks") or {}).get("items") or []
+    if tracks:
+        get_track_index().add_tracks(tracks)
+
+
+def api_spotify_search(sp: spotipy.Spotify, query: str, limit: int = 10, search_type: str = "track") -> Dict[str, Any]:
+    """
+    Read-through cached wrapper around sp.search.
+
+    Identical (normalized) queries made by earlier transfers are answered from the
+    persistent search cache instead of calling Spotify again, and identical queries
+    running at the same time share a single request. Calls go through the shared
+    Spotify rate limiter.
+
+    Args:
+        sp (spotipy.Spotify): The authenticated Spotify client.
+        query (str): The search query.
+        limit (int): Number of results to return.
+        search_type (str): Spotify item type to search for.
+
+    Returns:
+        Dict[str, Any]: Search response in the same shape as sp.search, with compact track objects.
+    """
+
+    cache = get_search_cache()
+    results = cache.get(query, limit, search_type)
+    if results is not None:
+        return results
+
+    def fetch() -> Dict[str, Any]:
+        fetched = _compact_search_results(call_spotify(sp.search, q=query, limit=limit, type=search_type))
+        _store_search_results(query, limit, search_type, fetched)
+        return fetched
+
+    # Identical searches already in flight (from any transfer) share one request
+    return search_flights.do(f"{cache.make_key(query, search_type)}:{limit}", fetch)
+
+
+async def api_spotify_search_async(
+    client: AsyncSpotifyClient,
+    query: str,
+    limit: int = 10,
+    search_type: str = "track"
+) -> Dict[str, Any]:
+    """
+    Asyncio version of api_spotify_search, backed by the same persistent cache.
+
+    Args:
+        client (AsyncSpotifyClient): Async Spotify client.
+        query (str): The search query.
+        limit (int): Number of results to return.
+        search_type (str): Spotify item type to search for.
+
+    Returns:
+        Dict[str, Any]: Search response in the same shape as sp.search, with compact track objects.
+    """
+
+    cache = get_search_cache()
+    results = cache.get(query, limit, search_type)
+    if results is not None:
+        return results
+
+    async def fetch() -> Dict[str, Any]:
+        fetched = _compact_search_results(await client.search(q=query, limit=limit, type=search_type))
+        # SQLite writes run off the event loop, so the other searches keep going meanwhile
+        await asyncio.to_thread(_store_search_results, query, limit, search_type, fetched)
+        return fetched
+
+    return await search_flights.do_async(f"{cache.make_key(query, search_type)}:{limit}", fetch)
+
+
+MINIMUM_CONFIDENCE = 0.6  # Only accept matches with 60%+ confidence
+HIGH_CONFIDENCE = 0.9     # Stop searching once a match is this good
+# The local index only holds tracks seen before (it may know the cover but not the original),
+# so an offline match must be as good as the one that ends a remote search early
+LOCAL_MATCH_CONFIDENCE = HIGH_CONFIDENCE
+# Fielded queries only return tracks whose name and artist contain the title's parts,
+# so a good match from one is final even without the "official" bonus
+PRECISE_STRATEGIES = ("channel", "fielded")
+PRECISE_MATCH_CONFIDENCE = 0.8
+
+
+def _score_candidates(
+    scorer: CandidateScorer,
+    tracks: List[Dict[str, Any]],
+    best_match: Optional[Dict[str, Any]],
+    best_confidence: float,
+    verbose: bool = False
+) -> Tuple[Optional[Dict[str, Any]], float]:
+    """
+    Scores the tracks returned by one search query against the YouTube title.
+
+    Args:
+        scorer (CandidateScorer): Scorer for the video, memoizing scores per track id.
+        tracks (List[Dict[str, Any]]): Spotify track objects returned by the search.
+        best_match (Optional[Dict[str, Any]]): Best track found by previous queries.
+        best_confidence (float): Confidence of that best track.
+        verbose (bool): Log every candidate with its confidence.
+
+    Returns:
+        Tuple[Optional[Dict[str, Any]], float]: Updated best track and its confidence.
+    """
+
+    confidences = scorer.score_batch(tracks)
+
+    for track, confidence in zip(tracks, confidences):
+        # Debug logging for first few tracks
+        if verbose:
+            track_name = track["name"]
+            artist_name = track["artists"][0]["name"]
+            print(f"[dim]  → {artist_name} - {track_name} (confidence: {confidence:.2f})[/dim]")
+
+        # Keep track of the best match
+        if confidence > best_confidence and confidence >= MINIMUM_CONFIDENCE:
+            best_confidence = confidence
+            best_match = track
+
+            # If we found a very high confidence match, stop searching
+            if confidence >= HIGH_CONFIDENCE:
+                print(f"[green] High confidence match found: {confidence:.2f}[/green]")
+                break
+
+    return best_match, best_confidence
+
+
+class _SearchOutcome:
+    """
+    Tracks the best match across the searches made for one video and reports the
+    outcome to the query planner.
+
+    Only the best match is kept, as a SpotifyTrack record: the raw candidates of a search
+    are dropped as soon as they are scored.
+    """
+
+    def __init__(self):
+        self.planner = get_query_planner()
+        self.best_match: Optional[SpotifyTrack] = None
+        self.best_confidence = 0.0
+        self.winner: Optional[str] = None
+        self.winner_rank = 0
+        self.tried: List[Tuple[str, bool, bool, int]] = []
+
+    def should_try(self, strategy: str) -> bool:
+        return self.planner.should_try(strategy, have_match=self.best_match is not None)
+
+    def update(self, strategy: str, scorer: CandidateScorer, tracks: List[Dict[str, Any]], verbose: bool = False) -> None:
+        had_match = self.best_match is not None
+
+        best_track, best_confidence = None, self.best_confidence
+        if tracks:
+            best_track, best_confidence = _score_candidates(scorer, tracks, None, self.best_confidence, verbose=verbose)
+
+        improved = best_track is not None
+        if improved:
+            self.best_match = _build_spotify_track(best_track, best_confidence)
+            self.best_confidence = best_confidence
+            self.winner = strategy
+            self.winner_rank = next(rank for rank, track in enumerate(tracks) if track is best_track)
+        self.tried.append((strategy, had_match, improved, len(tracks)))
+
+    def is_final(self) -> bool:
+        """
+        Tells whether the best match is good enough to stop searching.
+        """
+
+        if self.best_confidence >= HIGH_CONFIDENCE:
+            return True
+        return self.winner in PRECISE_STRATEGIES and self.best_confidence >= PRECISE_MATCH_CONFIDENCE
+
+    def record(self) -> None:
+        self.planner.record(self.tried, self.winner if self.best_match else None, self.winner_rank)
+
+
+def _match_from_index(
+    parsed_title: ParsedTitle,
+    scorer: CandidateScorer,
+    artist: Optional[str] = None
+) -> Optional[SpotifyTrack]:
+    """
+    Tries to match a video against the local index of previously seen tracks.
+
+    When the video's artist had their catalog prefetched, the index holds their original
+    tracks, so a track by them is trusted like a fielded search result.
+
+    Args:
+        parsed_title (ParsedTitle): The parsed YouTube title.
+        scorer (CandidateScorer): Scorer for the video (its memoized scores are reused by remote searches).
+        artist (Optional[str]): The video's detected artist (see artist_catalog.detected_artist).
+
+    Returns:
+        Optional[SpotifyTrack]: The best indexed track if it reaches LOCAL_MATCH_CONFIDENCE
+        (PRECISE_MATCH_CONFIDENCE for a prefetched artist), else None.
+    """
+
+    track_index = get_track_index()
+    candidates = track_index.candidates(parsed_title)
+    if not candidates:
+        return None
+
+    confidences = scorer.score_batch(candidates)
+    best_confidence, best_index = max((confidence, index) for index, confidence in enumerate(confidences))
+    if best_confidence < LOCAL_MATCH_CONFIDENCE:
+        by_artist = artist and any(
+            normalize_query(track_artist["name"]) == normalize_query(artist)
+            for track_artist in candidates[best_index]["artists"]
+        )
+        if best_confidence < PRECISE_MATCH_CONFIDENCE or not by_artist or not track_index.has_catalog(artist):
+            return None
+
+    spotify_track = _build_spotify_track(candidates[best_index], best_confidence)
+    print(f"[dim]Matched from the local track index[/dim]")
+    _log_found(spotify_track)
+    return spotify_track
+
+
+def _build_spotify_track(best_match: Dict[str, Any], best_confidence: float) -> SpotifyTrack:
+    """
+    Converts a raw Spotify track object into a SpotifyTrack record.
+
+    Args:
+        best_match (Dict[str, Any]): Raw Spotify track object.
+        best_confidence (float): Confidence of the match.
+
+    Returns:
+        SpotifyTrack: Track record used by the rest of the transfer.
+    """
+
+    # Extract thumbnail (album art) - prefer larger images
+    thumbnail_url = None
+    if best_match["album"]["images"]:
+        # Images are sorted by size (largest first)
+        thumbnail_url = best_match["album"]["images"][0]["url"]
+
+    return SpotifyTrack(
+        track_id=best_match["id"],
+        name=best_match["name"],
+        artist=create_artist_string(best_match["artists"]),  # Handles multiple artists
+        spotify_url=best_match["external_urls"]["spotify"],
+        album=best_match["album"]["name"],
+        thumbnail_url=thumbnail_url,
+        confidence=best_confidence
+    )
+
+
+def _log_found(spotify_track: SpotifyTrack) -> None:
+    print(f"[green]✅ Found: {spotify_track.artist} - {spotify_track.name} (confidence: {spotify_track.confidence:.2f})[/green]")
+
+
 def api_search_track_detailed(sp: spotipy.Spotify, youtube_video: YouTubeVideo) -> Optional[SpotifyTrack]:
     """
     Enhanced search for a song on Spotify using YouTube video data with confidence scoring.
     
     This function:
+    0. Returns the stored mapping right away if the video was matched before, or a
+       high confidence match from the local index of previously seen tracks
     1. Generates multiple smart search queries from the YouTube title
     2. Searches Spotify with each query (gets multiple results, not just 1)
     3. Calculates confidence scores for each match
@@ -335,155 +610,411 @@ def api_search_track_detailed(sp: spotipy.Spotify, youtube_video: YouTubeVideo)
 
     Returns:
         Optional[SpotifyTrack]: Best matching Spotify track if found with sufficient confidence, else None.
+
+    Raises:
+        SpotifyRateLimitError: If Spotify kept rate limiting the searches.
     """
     
-    # Generate smart search queries
-    search_queries = generate_smart_search_queries(youtube_video.title)
+    # Videos matched by an earlier transfer resolve without any search
+    mappings = get_track_mapping_store()
+    known_track = mappings.get(youtube_video.video_id)
+    if known_track:
+        print(f"[green]✅ Known video: {known_track.artist} - {known_track.name}[/green]")
+        return known_track
+    
+    # Parse the title once, then try tracks seen by earlier searches before going remote
+    parsed_title, owner_artist = parse_video_title(youtube_video)
+    scorer = CandidateScorer(parsed_title, youtube_video.duration_ms, owner_artist)
+    local_track = _match_from_index(parsed_title, scorer, detected_artist(parsed_title, owner_artist))
+    if local_track:
+        mappings.put(youtube_video.video_id, local_track)
+        return local_track
     
-    best_match = None
-    best_confidence = 0.0
-    minimum_confidence = 0.6  # Only accept matches with 60%+ confidence
+    search_plan = get_query_planner().plan(generate_search_plan(parsed_title, owner_artist))
+    outcome = _SearchOutcome()
     
     print(f"[cyan]Searching for: {youtube_video.title}[/cyan]")
-    print(f"[dim]Search strategies: {search_queries[:3]}...[/dim]")  # Show first 3
+    print(f"[dim]Search strategies: {[query for _, query, _ in search_plan[:3]]}...[/dim]")  # Show first 3
     
-    for query_index, query in enumerate(search_queries):
+    for query_index, (strategy, query, limit) in enumerate(search_plan):
+        if not outcome.should_try(strategy):
+            continue
+        
         try:
             # Search Spotify - get multiple results for better matching
-            results = sp.search(q=query, limit=10, type="track")  # Get top 10 instead of 1
+            results = api_spotify_search(sp, query, limit=limit)
             tracks = results.get('tracks', {}).get('items', [])
             
-            if not tracks:
-                continue
-            
-            # Evaluate each track from this search
-            for track in tracks:
-                confidence = calculate_match_confidence(youtube_video.title, track)
-                
-                # Debug logging for first few tracks
-                if query_index == 0:  # Only log for first query to avoid spam
-                    track_name = track["name"]
-                    artist_name = track["artists"][0]["name"]
-                    print(f"[dim]  → {artist_name} - {track_name} (confidence: {confidence:.2f})[/dim]")
-                
-                # Keep track of the best match
-                if confidence > best_confidence and confidence >= minimum_confidence:
-                    best_confidence = confidence
-                    best_match = track
-                    
-                    # If we found a very high confidence match, stop searching
-                    if confidence >= 0.9:
-                        print(f"[green] High confidence match found: {confidence:.2f}[/green]")
-                        break
+            # Evaluate each track from this search (only log the first query to avoid spam)
+            outcome.update(strategy, scorer, tracks, verbose=query_index == 0)
             
-            # If we found a very high confidence match, stop all searches
-            if best_confidence >= 0.9:
+            # Stop all searches once the match is final (very high confidence, or a good fielded match)
+            if outcome.is_final():
                 break
                 
+        except SpotifyRateLimitError:
+            # Not a miss: let the caller report the video as rate limited
+            raise
         except Exception as e:
             print(f"[red]Search failed for query '{query}': {e}[/red]")
             continue
     
-    if best_match:
-        # Extract thumbnail (album art) - prefer larger images
-        thumbnail_url = None
-        if best_match["album"]["images"]:
-            # Images are sorted by size (largest first)
-            thumbnail_url = best_match["album"]["images"][0]["url"]
-        
-        # Create SpotifyTrack object with all the rich data
-        spotify_track = SpotifyTrack(
-            track_id=best_match["id"],
-            name=best_match["name"],
-            artist=create_artist_string(best_match["artists"]),  # Handles multiple artists
-            album=best_match["album"]["name"],
-            spotify_url=best_match["external_urls"]["spotify"],
-            thumbnail_url=thumbnail_url,
-            preview_url=best_match.get("preview_url")  # 30-second preview URL
-        )
-        
-        artist_name = best_match["artists"][0]["name"]
-        print(f"[green]✅ Found: {artist_name} - {best_match['name']} (confidence: {best_confidence:.2f})[/green]")
-        
-        return spotify_track
+    outcome.record()
+    
+    if outcome.best_match:
+        _log_found(outcome.best_match)
+        mappings.put(youtube_video.video_id, outcome.best_match)
+        return outcome.best_match
     else:
-        print(f"[red]❌ No match found above {minimum_confidence} confidence threshold[/red]")
+        print(f"[red]❌ No match found above {MINIMUM_CONFIDENCE} confidence threshold[/red]")
         return None
 
 
-def api_process_videos_to_songs(
+async def api_search_track_detailed_async(client: AsyncSpotifyClient, youtube_video: YouTubeVideo) -> Optional[SpotifyTrack]:
+    """
+    Asyncio version of api_search_track_detailed used by the concurrent matching engine.
+
+    Queries are still tried one after another for a given video so the early exit on a
+    high confidence match keeps saving calls; concurrency comes from matching many
+    videos at the same time. Known videos are pre-resolved in bulk by the engine; others
+    are first matched against the local track index, then searched remotely. The accepted
+    match is recorded in the mapping store. Index and mapping store queries run in worker
+    threads, so a catalog being written does not hold up the event loop.
+
+    Args:
+        client (AsyncSpotifyClient): Async Spotify client sharing one aiohttp session.
+        youtube_video (YouTubeVideo): YouTube video metadata for searching.
+
+    Returns:
+        Optional[SpotifyTrack]: Best matching Spotify track if found with sufficient confidence, else None.
+
+    Raises:
+        SpotifyRateLimitError: If Spotify kept rate limiting the searches.
+    """
+
+    parsed_title, owner_artist = parse_video_title(youtube_video)
+    scorer = CandidateScorer(parsed_title, youtube_video.duration_ms, owner_artist)
+    local_track = await asyncio.to_thread(
+        _match_from_index, parsed_title, scorer, detected_artist(parsed_title, owner_artist)
+    )
+    if local_track:
+        await asyncio.to_thread(get_track_mapping_store().put, youtube_video.video_id, local_track)
+        return local_track
+
+    search_plan = get_query_planner().plan(generate_search_plan(parsed_title, owner_artist))
+    outcome = _SearchOutcome()
+
+    for strategy, query, limit in search_plan:
+        if not outcome.should_try(strategy):
+            continue
+
+        try:
+            results = await api_spotify_search_async(client, query, limit=limit)
+            tracks = results.get('tracks', {}).get('items', [])
+
+            outcome.update(strategy, scorer, tracks)
+
+            if outcome.is_final():
+                break
+
+        except SpotifyRateLimitError:
+            # Not a miss: let the caller report the video as rate limited
+            raise
+        except Exception as e:
+            print(f"[red]Search failed for query '{query}': {e}[/red]")
+            continue
+
+    outcome.record()
+
+    if outcome.best_match:
+        _log_found(outcome.best_match)
+        await asyncio.to_thread(get_track_mapping_store().put, youtube_video.video_id, outcome.best_match)
+        return outcome.best_match
+
+    print(f"[red]❌ No match found for '{youtube_video.title}' above {MINIMUM_CONFIDENCE} confidence threshold[/red]")
+    return None
+
+
+class VideoDeduper:
+    """
+    Gives every video a slot, shared by videos with the same video_id or normalized title.
+
+    The title includes the artist of an artist-owned channel, so two "Topic" uploads both
+    titled "Intro" by different artists stay distinct. Works incrementally, so videos can
+    be deduplicated while playlist pages stream in.
+    """
+
+    def __init__(self):
+        self.unique_videos: List[YouTubeVideo] = []
+        self._slot_by_key: Dict[str, int] = {}
+
+    def slot_for(self, youtube_video: YouTubeVideo) -> Tuple[int, bool]:
+        """
+        Returns the slot of the video and whether it is the first video seen for that slot.
+        """
+
+        title = with_channel_artist(youtube_video.title, youtube_video.video_owner_channel)
+        keys = (f"id:{youtube_video.video_id}", f"title:{normalize_query(title)}")
+        slot = next((self._slot_by_key[key] for key in keys if key in self._slot_by_key), None)
+
+        is_new = slot is None
+        if is_new:
+            slot = len(self.unique_videos)
+            self.unique_videos.append(youtube_video)
+
+        for key in keys:
+            self._slot_by_key.setdefault(key, slot)
+        return slot, is_new
+
+
+# Outcome of matching one video: the track, None when not found, or the rate limit error
+MatchResult = Union[SpotifyTrack, SpotifyRateLimitError, None]
+
+# SongResult.error of videos that could not be searched because Spotify kept rate limiting
+RATE_LIMITED_ERROR = "Rate limited by Spotify, please retry"
+
+
+def _song_record_for(index: int, youtube_video: YouTubeVideo, spotify_track: MatchResult) -> SongRecord:
+    """
+    Creates the SongRecord of a playlist entry from its match result.
+    """
+
+    if isinstance(spotify_track, SpotifyRateLimitError):
+        return SongRecord(index, youtube_video, None, RATE_LIMITED_ERROR)
+    return SongRecord(index, youtube_video, spotify_track, None if spotify_track else youtube_video.skip_reason)
+
+
+# Videos buffered between the YouTube fetching stage and the Spotify matching stage (two API pages)
+PIPELINE_QUEUE_SIZE = 100
+
+
+async def _single_page(youtube_videos: List[YouTubeVideo]) -> AsyncIterator[List[YouTubeVideo]]:
+    yield youtube_videos
+
+
+async def api_match_video_pages_async(
+    sp: spotipy.Spotify,
+    video_pages: AsyncIterable[List[YouTubeVideo]],
+    concurrency: int = DEFAULT_SEARCH_CONCURRENCY,
+    queue_size: int = PIPELINE_QUEUE_SIZE,
+    progress: Optional[TransferProgress] = None,
+    on_resolved: Optional[Callable[[int, YouTubeVideo, MatchResult], None]] = None
+) -> Tuple[List[YouTubeVideo], List[MatchResult]]:
+    """
+    Matches a stream of YouTube playlist pages against Spotify as a two-stage pipeline.
+
+    The producer stage pulls pages from `video_pages`, deduplicates the videos, resolves
+    the ones already in the mapping store with one bulk lookup per page, drops the ones
+    enrichment marked with a skip_reason and puts the rest on a bounded queue. The matching stage is `concurrency` workers searching Spotify for
+    the queued videos. Matching page 1 therefore overlaps fetching page 2, and the producer
+    blocks once `queue_size` videos are waiting, whatever the playlist size.
+
+    Artists with ARTIST_PREFETCH_MIN_VIDEOS or more videos to search have their catalog
+    prefetched into the local track index before those videos are queued, so they match
+    offline instead of running a search chain each.
+
+    Duplicate videos (same video_id or normalized title) are searched once and the result
+    is fanned out to every position they occupy. A video whose searches stayed rate limited
+    gets the SpotifyRateLimitError instead of None, so it is not reported as missing from Spotify.
+
+    Args:
+        sp (spotipy.Spotify): The authenticated Spotify client (used for auth tokens).
+        video_pages (AsyncIterable[List[YouTubeVideo]]): Playlist pages, in order.
+        concurrency (int): Maximum number of videos being searched at the same time.
+        queue_size (int): Maximum number of videos waiting between the two stages.
+        progress (Optional[TransferProgress]): Counters updated as videos are received and resolved.
+        on_resolved (Optional[Callable[[int, YouTubeVideo, MatchResult], None]]): Called with
+            (playlist position, video, match result) as soon as each playlist entry is resolved.
+
+    Returns:
+        Tuple[List[YouTubeVideo], List[MatchResult]]: Every video received, in playlist
+        order, and the match result for each of them.
+    """
+
+    deduper = VideoDeduper()
+    mappings = get_track_mapping_store()
+    queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+    progress = progress or TransferProgress()
+
+    youtube_videos: List[YouTubeVideo] = []
+    positions: List[int] = []
+    unique_tracks: List[MatchResult] = []
+    slot_positions: List[List[int]] = []  # Playlist positions sharing each slot
+    resolved: List[bool] = []
+    known_count = 0
+    searched_count = 0
+
+    def resolve(slot: int, spotify_track: MatchResult) -> None:
+        unique_tracks[slot] = spotify_track
+        resolved[slot] = True
+        if on_resolved:
+            for position in slot_positions[slot]:
+                on_resolved(position, youtube_videos[position], spotify_track)
+
+    async def produce(prefetcher: ArtistPrefetcher) -> None:
+        nonlocal known_count
+
+        async for page in video_pages:
+            new_videos = []
+            for youtube_video in page:
+                slot, is_new = deduper.slot_for(youtube_video)
+                position = len(youtube_videos)
+                youtube_videos.append(youtube_video)
+                positions.append(slot)
+                if is_new:
+                    unique_tracks.append(None)
+                    slot_positions.append([])
+                    resolved.append(False)
+                    new_videos.append((slot, youtube_video))
+                slot_positions[slot].append(position)
+                if resolved[slot] and on_resolved:
+                    # Repeat of a video that is already resolved
+                    on_resolved(position, youtube_video, unique_tracks[slot])
+
+            # Videos matched by an earlier transfer never reach the search stage
+            known_tracks = await asyncio.to_thread(
+                mappings.get_many, [youtube_video.video_id for _, youtube_video in new_videos]
+            )
+            known_count += len(known_tracks)
+
+            to_search = []
+            for slot, youtube_video in new_videos:
+                if youtube_video.video_id in known_tracks:
+                    resolve(slot, known_tracks[youtube_video.video_id])
+                elif youtube_video.skip_reason:
+                    # Unavailable and non-music videos (see enrich_videos) are never searched
+                    resolve(slot, None)
+                else:
+                    to_search.append((slot, youtube_video, detected_artist(*parse_video_title(youtube_video))))
+
+            progress.total_videos += len(page)
+            progress.unique_videos += len(new_videos)
+            progress.processed_videos += len(new_videos) - len(to_search)
+            progress.matched_videos += len(known_tracks)
+
+            # Artists with many videos get their catalog pulled into the local track index
+            # first; their videos wait for it, the others are queued right away
+            due = await asyncio.to_thread(prefetcher.due, [artist for _, _, artist in to_search])
+            waiting = []
+            for slot, youtube_video, artist in to_search:
+                if artist and normalize_query(artist) in due:
+                    waiting.append((slot, youtube_video))
+                else:
+                    await queue.put((slot, youtube_video))
+
+            if due:
+                await prefetcher.fetch(due)
+            for item in waiting:
+                await queue.put(item)
+
+        # One end marker per worker
+        for _ in range(concurrency):
+            await queue.put(None)
+
+    async def match(client: AsyncSpotifyClient) -> None:
+        nonlocal searched_count
+
+        while True:
+            item = await queue.get()
+            if item is None:
+                return
+
+            slot, youtube_video = item
+            searched_count += 1
+            print(f"[cyan][{searched_count}] Searching for: {youtube_video.title}[/cyan]")
+            try:
+                spotify_track = await api_search_track_detailed_async(client, youtube_video)
+            except SpotifyRateLimitError as e:
+                print(f"[red]Rate limited while searching '{youtube_video.title}': {e}[/red]")
+                spotify_track = e
+
+            progress.processed_videos += 1
+            if isinstance(spotify_track, SpotifyTrack):
+                progress.matched_videos += 1
+            resolve(slot, spotify_track)
+
+    timeout = aiohttp.ClientTimeout(total=30)
+
+    async with aiohttp.ClientSession(timeout=timeout) as session:
+        client = AsyncSpotifyClient(sp, session)
+        prefetcher = ArtistPrefetcher(client)
+        tasks = [asyncio.create_task(produce(prefetcher))]
+        tasks += [asyncio.create_task(match(client)) for _ in range(concurrency)]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            # A failing stage (e.g. a YouTube API error) must not leave the other one waiting
+            for task in tasks:
+                task.cancel()
+            get_query_planner().record_traffic(client.requests, client.response_bytes)
+
+    if len(deduper.unique_videos) < len(youtube_videos):
+        print(f"[dim]Coalesced {len(youtube_videos) - len(deduper.unique_videos)} duplicate videos[/dim]")
+    if known_count:
+        print(f"[dim]Resolved {known_count} known videos from the mapping store[/dim]")
+    if prefetcher.prefetched:
+        print(f"[dim]Prefetched the catalogs of {prefetcher.prefetched} artists[/dim]")
+
+    return youtube_videos, [unique_tracks[slot] for slot in positions]
+
+
+async def api_match_videos_async(
     sp: spotipy.Spotify,
     youtube_videos: List[YouTubeVideo],
+    concurrency: int = DEFAULT_SEARCH_CONCURRENCY
+) -> List[MatchResult]:
+    """
+    Matches every YouTube video against Spotify with bounded concurrency.
+
+    Runs the api_match_video_pages_async pipeline over an already loaded list.
+
+    Args:
+        sp (spotipy.Spotify): The authenticated Spotify client (used for auth tokens).
+        youtube_videos (List[YouTubeVideo]): Videos to match.
+        concurrency (int): Maximum number of videos being searched at the same time.
+
+    Returns:
+        List[MatchResult]: One entry per video, in playlist order.
+    """
+
+    _, spotify_tracks = await api_match_video_pages_async(sp, _single_page(youtube_videos), concurrency)
+    return spotify_tracks
+
+
+def _finish_song_results(
+    sp: spotipy.Spotify,
+    youtube_videos: List[YouTubeVideo],
+    spotify_tracks: List[MatchResult],
     playlist_id: str
-) -> List[SongResult]:
+) -> List[SongRecord]:
     """
-    Process all YouTube videos, search for them on Spotify, and create detailed song results.
-    
-    This is the main orchestrator function that:
-    1. Takes a list of YouTube videos from a playlist
-    2. For each video, tries to find a matching song on Spotify
-    3. Creates a SongResult object with all the metadata
-    4. Batches successful Spotify track IDs and adds them to the playlist
-    5. Returns a complete list of results for the frontend
-    
+    Builds the SongRecords, adds the matched tracks to the playlist and logs the summary.
+
     Args:
         sp (spotipy.Spotify): The authenticated Spotify client.
-        youtube_videos (List[YouTubeVideo]): List of YouTube videos to process.
+        youtube_videos (List[YouTubeVideo]): Videos in playlist order.
+        spotify_tracks (List[MatchResult]): Match result of every video.
         playlist_id (str): Spotify playlist ID where successful matches will be added.
 
     Returns:
-        List[SongResult]: Complete list of song results with success/failure status and metadata.
+        List[SongRecord]: The result of every video, in playlist order.
     """
     
     song_results = []
     successful_track_ids = []
-    
     total_videos = len(youtube_videos)
-    print(f"[bold blue] Processing {total_videos} videos...[/bold blue]")
     
-    for index, youtube_video in enumerate(youtube_videos):
-        print(f"\n[bold] [{index + 1}/{total_videos}][/bold]")
-        
-        # Search for the track on Spotify using our enhanced search
-        spotify_track = api_search_track_detailed(sp, youtube_video)
-        
-        if spotify_track:
-            # ✅ SUCCESS - Found matching song on Spotify
+    for index, (youtube_video, spotify_track) in enumerate(zip(youtube_videos, spotify_tracks)):
+        if isinstance(spotify_track, SpotifyTrack):
             successful_track_ids.append(spotify_track.track_id)
-            
-            song_result = SongResult(
-                id=f"song_{index}",
-                title=spotify_track.name,                    # Clean Spotify title
-                artist=spotify_track.artist,                 # Formatted artist string
-                album=spotify_track.album,                   # Album name
-                thumbnail=spotify_track.thumbnail_url,       # Album artwork
-                status="success",
-                spotify_url=spotify_track.spotify_url,       # Individual track URL
-                youtube_url=youtube_video.youtube_url,       # Original YouTube URL
-                original_youtube_title=youtube_video.title,  # Original messy title
-                spotify_match_confidence=0.8  # Could store actual confidence from search
-            )
-            
-        else:
-            # ❌ FAILED - Not found on Spotify
-            song_result = SongResult(
-                id=f"song_{index}",
-                title=youtube_video.title,                   # Keep original YouTube title
-                artist="Unknown Artist",                     # No Spotify data available
-                thumbnail=youtube_video.thumbnail_url,       # Use YouTube thumbnail
-                status="failed",
-                youtube_url=youtube_video.youtube_url,       # Original YouTube URL
-                error="Song not found on Spotify or confidence too low",
-                original_youtube_title=youtube_video.title
-            )
         
-        song_results.append(song_result)
+        song_results.append(_song_record_for(index, youtube_video, spotify_track))
     
     # Batch add all successful tracks to the Spotify playlist
     if successful_track_ids:
         print(f"\n[bold green]Adding {len(successful_track_ids)} tracks to playlist...[/bold green]")
-        api_add_tracks_to_playlist(sp, playlist_id, successful_track_ids)
-        print(f"[green]Successfully added tracks to playlist![/green]")
+        added = api_add_tracks_to_playlist(sp, playlist_id, successful_track_ids)
+        print(f"[green]Successfully added {added} tracks to playlist![/green]")
     else:
         print(f"[yellow]⚠️ No tracks to add to playlist[/yellow]")
     
@@ -497,9 +1028,135 @@ def api_process_videos_to_songs(
     print(f"[red]Failed matches: {failed_count}[/red]")
     print(f"[blue]Success rate: {success_rate:.1f}%[/blue]")
     
+    mapping_stats = get_track_mapping_store().stats()
+    print(f"[dim]Known videos: {mapping_stats['hits']} resolved without searching ({mapping_stats['entries']} stored)[/dim]")
+    
+    index_stats = get_track_index().stats()
+    print(f"[dim]Local track index: {index_stats['tracks']} tracks[/dim]")
+    
+    cache_stats = get_search_cache().stats()
+    print(f"[dim]Search cache: {cache_stats['hits']} hits / {cache_stats['misses']} misses ({cache_stats['entries']} entries)[/dim]")
+    
+    planner = get_query_planner()
+    planner.save()
+    planner_stats = planner.stats()
+    print(f"[dim]Searches per matched track: {planner_stats['searches_per_match']:.2f}, {planner_stats['bytes_per_search'] / 1024:.1f} KB per Spotify search[/dim]")
+    
     return song_results
 
 
+def _match_pages(
+    sp: spotipy.Spotify,
+    video_pages: Iterable[List[YouTubeVideo]],
+    concurrency: int,
+    progress: Optional[TransferProgress] = None,
+    on_resolved: Optional[Callable[[int, YouTubeVideo, MatchResult], None]] = None
+) -> Tuple[List[YouTubeVideo], List[MatchResult]]:
+    """
+    Matches playlist pages on the distributed workers when that mode is on and a worker is
+    alive, else in this process with the async pipeline.
+    """
+
+    # Imported here: distributed_matching builds on this module
+    from backend.services.distributed_matching import get_match_queue
+
+    match_queue = get_match_queue()
+    if match_queue:
+        if match_queue.live_workers():
+            return match_queue.match_pages(video_pages, progress=progress, on_resolved=on_resolved)
+        print("[yellow]No distributed match worker is running, matching locally[/yellow]")
+
+    async def run() -> Tuple[List[YouTubeVideo], List[MatchResult]]:
+        return await api_match_video_pages_async(
+            sp,
+            iterate_in_thread(iter(video_pages)),
+            concurrency,
+            progress=progress,
+            on_resolved=on_resolved
+        )
+
+    # Runs inside the sync request worker thread, so there is no running event loop here
+    return asyncio.run(run())
+
+
+def api_process_videos_to_songs(
+    sp: spotipy.Spotify,
+    youtube_videos: List[YouTubeVideo],
+    playlist_id: str,
+    concurrency: Optional[int] = DEFAULT_SEARCH_CONCURRENCY
+) -> List[SongRecord]:
+    """
+    Process all YouTube videos, search for them on Spotify, and create detailed song results.
+    
+    This is the main orchestrator function that:
+    1. Takes a list of YouTube videos from a playlist
+    2. Matches the videos against Spotify concurrently (bounded by `concurrency`)
+    3. Creates a SongRecord for every video, in playlist order
+    4. Batches successful Spotify track IDs and adds them to the playlist
+    5. Returns a complete list of results for the frontend
+    
+    Args:
+        sp (spotipy.Spotify): The authenticated Spotify client.
+        youtube_videos (List[YouTubeVideo]): List of YouTube videos to process.
+        playlist_id (str): Spotify playlist ID where successful matches will be added.
+        concurrency (Optional[int]): Maximum number of videos searched at the same time.
+
+    Returns:
+        List[SongRecord]: The result of every video, in playlist order (see SongRecord.to_result).
+    """
+    
+    concurrency = clamp_concurrency(concurrency)
+    print(f"[bold blue] Processing {len(youtube_videos)} videos (concurrency: {concurrency})...[/bold blue]")
+    
+    _, spotify_tracks = _match_pages(sp, [youtube_videos], concurrency)
+    
+    return _finish_song_results(sp, youtube_videos, spotify_tracks, playlist_id)
+
+
+def api_process_video_pages_to_songs(
+    sp: spotipy.Spotify,
+    video_pages: Iterable[List[YouTubeVideo]],
+    playlist_id: str,
+    concurrency: Optional[int] = DEFAULT_SEARCH_CONCURRENCY,
+    progress: Optional[TransferProgress] = None,
+    on_song: Optional[Callable[[SongRecord], None]] = None
+) -> Tuple[List[YouTubeVideo], List[SongRecord]]:
+    """
+    Streaming version of api_process_videos_to_songs.
+
+    Pages are pulled from `video_pages` (e.g. iter_playlist_video_pages) in a worker thread
+    while earlier pages are being matched, so fetching and matching overlap and only a
+    bounded number of videos wait between the two.
+
+    Args:
+        sp (spotipy.Spotify): The authenticated Spotify client.
+        video_pages (Iterable[List[YouTubeVideo]]): Playlist pages, fetched lazily.
+        playlist_id (str): Spotify playlist ID where successful matches will be added.
+        concurrency (Optional[int]): Maximum number of videos searched at the same time.
+        progress (Optional[TransferProgress]): Counters and stage updated while the pages are processed.
+        on_song (Optional[Callable[[SongRecord], None]]): Receives each video's SongRecord as soon
+            as it is resolved (before the tracks are added to the playlist).
+
+    Returns:
+        Tuple[List[YouTubeVideo], List[SongRecord]]: Every video of the playlist and its result.
+    """
+    
+    concurrency = clamp_concurrency(concurrency)
+    progress = progress or TransferProgress()
+    print(f"[bold blue] Streaming playlist videos (concurrency: {concurrency})...[/bold blue]")
+    
+    def on_resolved(index: int, youtube_video: YouTubeVideo, spotify_track: MatchResult) -> None:
+        on_song(_song_record_for(index, youtube_video, spotify_track))
+    
+    progress.stage = "matching"
+    youtube_videos, spotify_tracks = _match_pages(
+        sp, video_pages, concurrency, progress=progress, on_resolved=on_resolved if on_song else None
+    )
+    
+    progress.stage = "adding"
+    return youtube_videos, _finish_song_results(sp, youtube_videos, spotify_tracks, playlist_id)
+
+
 # Legacy functions for backward compatibility
 def api_search_track(sp: spotipy.Spotify, title: str) -> str | None:
     """
@@ -514,7 +1171,7 @@ def api_search_track(sp: spotipy.Spotify, title: str) -> str | None:
         str | None: The Spotify track ID if found, else None.
     """
 
-    results = sp.search(q=title, limit=1, type="track")
+    results = api_spotify_search(sp, title, limit=1)
     tracks = results.get('tracks', {}).get('items', [])
     if tracks:
         return tracks[0]['id']
@@ -522,25 +1179,32 @@ def api_search_track(sp: spotipy.Spotify, title: str) -> str | None:
     return None
 
 
-def api_add_tracks_to_playlist(sp: spotipy.Spotify, playlist_id: str, track_ids: list[str]) -> None:
+def api_add_tracks_to_playlist(sp: spotipy.Spotify, playlist_id: str, track_ids: list[str]) -> int:
     """
     Adds a list of track IDs to a specified Spotify playlist in batches.
 
+    Tracks keep the order of `track_ids`; duplicates, None values and tracks the playlist
+    already contains are skipped. Batches are retried and journaled, so an interrupted
+    write resumes where it stopped (see playlist_writer).
+
     Args:
         sp (spotipy.Spotify): The authenticated Spotify client.
         playlist_id (str): The ID of the target playlist.
         track_ids (list[str]): A list of Spotify track IDs to add.
-    """
 
-    # Remove duplicates and None values
-    track_ids = list(filter(None, set(track_ids)))
+    Returns:
+        int: Number of tracks added.
 
-    # Add in batches of 100 (Spotify API limit)
-    for i in range(0, len(track_ids), 100):
-        batch = track_ids[i:i + 100]
-        sp.playlist_add_items(playlist_id, batch)
+    Raises:
+        PlaylistWriteError: If a batch could not be added after every retry.
+    """
 
-    return
+    result = write_playlist_tracks(sp, playlist_id, track_ids)
+    if result.already_present:
+        print(f"[dim]Skipped {result.already_present} tracks already in the playlist[/dim]")
+    if result.resumed_batches:
+        print(f"[dim]Resumed after {result.resumed_batches} batches committed by an earlier run[/dim]")
+    return result.added
 
 
 def api_add_tracks_from_titles(
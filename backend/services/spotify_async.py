@@ -0,0 +1,160 @@
+import json
+import asyncio
+import aiohttp
+import spotipy
+from rich import print
+from typing import Any, AsyncIterator, Dict, Iterator, Optional, TypeVar
+from backend.services.rate_limiter import SpotifyRateLimitError, get_spotify_rate_limiter, retry_after_seconds
+
+T = TypeVar("T")
+
+SPOTIFY_API_BASE = "https://api.spotify.com/v1"
+
+# Retries of transient 5xx responses, with exponential backoff (spotipy's defaults, also used
+# by the sync clients' HTTP sessions)
+SPOTIFY_TRANSPORT_RETRIES = 3
+SPOTIFY_RETRY_BACKOFF = 0.3
+SPOTIFY_RETRY_STATUSES = (500, 502, 503, 504)
+
+# Default number of videos matched at the same time during a transfer
+DEFAULT_SEARCH_CONCURRENCY = 8
+MAX_SEARCH_CONCURRENCY = 32
+
+
+class AsyncSpotifyClient:
+    """
+    Minimal asyncio Spotify Web API client used by the matching engine.
+
+    Spotipy is blocking, so searches issued through it run one at a time. This client
+    reuses the spotipy auth manager for tokens and sends the actual HTTP calls through
+    a shared aiohttp session, so many searches can be in flight at once.
+    """
+
+    def __init__(self, sp: spotipy.Spotify, session: aiohttp.ClientSession, max_retries: int = 5):
+        self.sp = sp
+        self.session = session
+        self.max_retries = max_retries
+        self.rate_limiter = get_spotify_rate_limiter()
+        # Successful requests and the size of their bodies, for search traffic stats
+        self.requests = 0
+        self.response_bytes = 0
+        self._auth_headers: Optional[Dict[str, str]] = None
+        self._auth_lock = asyncio.Lock()
+
+    async def _get_auth_headers(self, refresh: bool = False) -> Dict[str, str]:
+        """
+        Returns the bearer header, fetching it from spotipy off the event loop when needed.
+
+        The spotipy auth manager may read the token cache or refresh the token over HTTP,
+        so it is only consulted once per engine run (and again after a 401).
+        """
+        async with self._auth_lock:
+            if self._auth_headers is None or refresh:
+                token = await asyncio.to_thread(self.sp.auth_manager.get_access_token, as_dict=False)
+                self._auth_headers = {"Authorization": f"Bearer {token}"}
+            return self._auth_headers
+
+    async def get(self, endpoint: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Performs an authenticated GET against the Spotify Web API.
+
+        Args:
+            endpoint (str): Path relative to the API base, e.g. "search".
+            params (Dict[str, Any]): Query string parameters.
+
+        Returns:
+            Dict[str, Any]: Decoded JSON response.
+
+        Raises:
+            SpotifyRateLimitError: If Spotify keeps answering 429 after every retry.
+            spotipy.SpotifyException: On any other error, 5xx included once its retries are spent.
+        """
+
+        url = f"{SPOTIFY_API_BASE}/{endpoint}"
+        headers = await self._get_auth_headers()
+        server_errors = 0
+
+        for attempt in range(self.max_retries + 1):
+            # Every request takes a token from the limiter shared with the sync spotipy calls
+            await self.rate_limiter.acquire_async()
+
+            async with self.session.get(url, params=params, headers=headers) as response:
+                if response.status == 401 and attempt < self.max_retries:
+                    headers = await self._get_auth_headers(refresh=True)
+                    continue
+
+                if response.status == 429:
+                    if attempt == self.max_retries:
+                        break
+                    retry_after = retry_after_seconds(response.headers)
+                    print(f"[yellow]Rate limited by Spotify, pausing all calls for {retry_after}s[/yellow]")
+                    # Pausing the shared bucket holds back every other in-flight search too
+                    await self.rate_limiter.pause_async(retry_after)
+                    continue
+
+                if (
+                    response.status in SPOTIFY_RETRY_STATUSES
+                    and server_errors < SPOTIFY_TRANSPORT_RETRIES
+                    and attempt < self.max_retries
+                ):
+                    # Transient server error: back off this request only, the bucket is not paused
+                    await asyncio.sleep(SPOTIFY_RETRY_BACKOFF * 2 ** server_errors)
+                    server_errors += 1
+                    continue
+
+                if response.status >= 400:
+                    text = await response.text()
+                    raise spotipy.SpotifyException(response.status, -1, f"{url}:\n {text}", headers=dict(response.headers))
+
+                body = await response.read()
+                self.requests += 1
+                self.response_bytes += len(body)
+                return json.loads(body)
+
+        raise SpotifyRateLimitError(f"Spotify is still rate limiting {url} after {self.max_retries} retries")
+
+    async def search(self, q: str, limit: int = 10, type: str = "track") -> Dict[str, Any]:
+        """
+        Async equivalent of spotipy.Spotify.search.
+
+        Args:
+            q (str): The search query.
+            limit (int): Number of items to return.
+            type (str): Item type to search for.
+
+        Returns:
+            Dict[str, Any]: Same payload shape as sp.search.
+        """
+
+        return await self.get("search", {"q": q, "limit": limit, "type": type})
+
+
+def clamp_concurrency(concurrency: Optional[int]) -> int:
+    """
+    Normalizes a user supplied concurrency value into the supported range.
+    """
+
+    if not concurrency:
+        return DEFAULT_SEARCH_CONCURRENCY
+    return max(1, min(MAX_SEARCH_CONCURRENCY, concurrency))
+
+
+async def iterate_in_thread(iterator: Iterator[T]) -> AsyncIterator[T]:
+    """
+    Consumes a blocking iterator (e.g. a paginated API generator) from asyncio.
+
+    Each next() runs in a worker thread, so the event loop stays free while an item is produced.
+
+    Args:
+        iterator (Iterator[T]): Blocking iterator to consume.
+
+    Yields:
+        T: The iterator's items, in order.
+    """
+
+    done = object()
+    while True:
+        item = await asyncio.to_thread(next, iterator, done)
+        if item is done:
+            return
+        yield item
@@ -0,0 +1,272 @@
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import FrozenSet, NamedTuple, Optional, Tuple
+
+# Bracketed noise: [Official Video], (Lyrics), 【MV】. Applied in this order (brackets can
+# interleave, e.g. "(a [b) c]"), before the tail patterns.
+_BRACKET_NOISE = (
+    re.compile(r'\[.*?\]'),
+    re.compile(r'\(.*?\)'),
+    re.compile(r'【.*?】'),
+)
+
+# Noise that truncates the rest of the title. Every original pattern ended in `.*`, so one
+# search for the earliest match cuts the title exactly like applying them one after another.
+# Redundant suffixes were folded: "lyrics?.*" is "lyric.*", "featuring.*" is "feat.*".
+_TAIL_NOISE = re.compile(
+    r'\s*(?:'
+    r'-\s*(?:official|lyric)'                                   # - Official Video, - Lyrics, - Lyric Video
+    r'|bass\s*boosted|nightcore|remix|cover|acoustic|live'      # Modifications
+    r'|\|'                                                      # Everything after pipe |
+    r'|ft|feat'                                                 # Featuring artists
+    r')',
+    re.IGNORECASE
+)
+
+# Artist/song separators, tried in order; only the first one found is used
+SEPARATORS = (' - ', ' – ', ' — ', ' | ', ' • ', ': ')
+# Dashes almost always mean "Artist - Song"; the others also separate series names, channels...
+DASH_SEPARATORS = SEPARATORS[:3]
+# Longer "artist" parts are usually a sentence that happens to contain a separator
+MAX_CONFIDENT_ARTIST_WORDS = 5
+
+# Channels that belong to exactly one artist: YouTube's auto-generated "Artist - Topic"
+# channels and VEVO channels ("TaylorSwiftVEVO", "Adele VEVO")
+_TOPIC_CHANNEL = re.compile(r'^(.+?) - Topic$')
+_VEVO_CHANNEL = re.compile(r'^(.+?)\s*VEVO$', re.IGNORECASE)
+_CAMEL_CASE_BOUNDARY = re.compile(r'(?<=[a-z])(?=[A-Z])')
+
+# Title modifiers and the confidence adjustment they carry when scoring candidates
+NEGATIVE_INDICATORS = (
+    ('cover', -0.2),          # Strong penalty for covers
+    ('remix', -0.2),          # Medium penalty for remixes
+    ('acoustic', -0.15),      # Medium penalty for acoustic versions
+    ('live', -0.15),          # Medium penalty for live versions
+    ('instrumental', -0.25),  # Strong penalty for instrumentals
+    ('karaoke', -0.3),        # Strong penalty for karaoke
+    ('bass boosted', -0.2),   # Medium penalty for bass boosted
+    ('nightcore', -0.25),     # Strong penalty for nightcore
+    ('slowed', -0.2),         # Medium penalty for slowed versions
+    ('8d audio', -0.2),       # Medium penalty for 8D audio
+    ('piano', -0.1),          # Small penalty if "piano" appears
+)
+
+POSITIVE_INDICATORS = (
+    ('official', 0.1),        # Bonus for official content
+    ('audio', 0.05),          # Small bonus for audio versions
+    ('music video', 0.05),    # Small bonus for music videos
+)
+
+INDICATORS = NEGATIVE_INDICATORS + POSITIVE_INDICATORS
+
+
+class TitleTokens(NamedTuple):
+    """
+    The part of a parsed title that candidate scoring needs, without the query cleaning.
+
+    Attributes:
+        raw (str): Title exactly as received from YouTube.
+        lower (str): Lowercased raw title, used for substring matching.
+        tokens (FrozenSet[str]): Whitespace tokens of the lowercased title.
+        adjustments (Tuple[float, ...]): Confidence adjustments for the indicators found, in scoring order.
+        modifiers (FrozenSet[str]): Indicators found in the title (cover, remix, nightcore, official...).
+    """
+
+    raw: str
+    lower: str
+    tokens: FrozenSet[str]
+    adjustments: Tuple[float, ...]
+    modifiers: FrozenSet[str]
+
+
+def tokenize_title(youtube_title: str) -> TitleTokens:
+    """
+    Lowercases and tokenizes a title and finds its modifier indicators.
+
+    Args:
+        youtube_title (str): The original YouTube video title.
+
+    Returns:
+        TitleTokens: Scoring view of the title.
+    """
+
+    lower = youtube_title.lower()
+
+    modifiers = []
+    adjustments = []
+    for indicator, adjustment in INDICATORS:
+        if indicator in lower:
+            modifiers.append(indicator)
+            adjustments.append(adjustment)
+
+    return TitleTokens(youtube_title, lower, frozenset(lower.split()), tuple(adjustments), frozenset(modifiers))
+
+
+@dataclass(frozen=True, slots=True)
+class ParsedTitle:
+    """
+    Structured view of a YouTube title, built once and shared by query generation and scoring.
+
+    Attributes:
+        raw (str): Title exactly as received from YouTube.
+        title (str): Title with surrounding whitespace stripped.
+        lower (str): Lowercased raw title, used for substring matching.
+        clean_title (str): Title with brackets, modifiers and featured artists removed.
+        artist (Optional[str]): Text before the first separator, when the title has one.
+        song (Optional[str]): Cleaned text after the first separator.
+        modifiers (FrozenSet[str]): Indicators found in the title (cover, remix, nightcore, official...).
+        adjustments (Tuple[float, ...]): Confidence adjustments for those indicators, in scoring order.
+        tokens (FrozenSet[str]): Whitespace tokens of the lowercased title.
+    """
+
+    raw: str
+    title: str
+    lower: str
+    clean_title: str
+    artist: Optional[str]
+    song: Optional[str]
+    modifiers: FrozenSet[str]
+    adjustments: Tuple[float, ...]
+    tokens: FrozenSet[str]
+
+    def has_modifier(self, modifier: str) -> bool:
+        return modifier in self.modifiers
+
+
+def clean_title_noise(text: str) -> str:
+    """
+    Removes common YouTube noise ([Official Video], (Lyrics), - Official Audio, feat. X, ...).
+
+    Args:
+        text (str): Title or title fragment to clean.
+
+    Returns:
+        str: The cleaned text, stripped of surrounding whitespace.
+    """
+
+    for pattern in _BRACKET_NOISE:
+        text = pattern.sub('', text)
+
+    match = _TAIL_NOISE.search(text)
+    if match:
+        text = text[:match.start()]
+    return text.strip()
+
+
+def _parse_title(youtube_title: str) -> ParsedTitle:
+    title = youtube_title.strip()
+    scoring = tokenize_title(youtube_title)
+
+    artist = None
+    song = None
+    for sep in SEPARATORS:
+        if sep in title:
+            artist_part, song_part = title.split(sep, 1)  # Only split on first occurrence
+            artist = artist_part.strip() or None
+            song = clean_title_noise(song_part) or None
+            break
+
+    return ParsedTitle(
+        raw=youtube_title,
+        title=title,
+        lower=scoring.lower,
+        clean_title=clean_title_noise(title),
+        artist=artist,
+        song=song,
+        modifiers=scoring.modifiers,
+        adjustments=scoring.adjustments,
+        tokens=scoring.tokens,
+    )
+
+
+@lru_cache(maxsize=8192)
+def parse_title(youtube_title: str) -> ParsedTitle:
+    """
+    Parses a YouTube title into a ParsedTitle record.
+
+    Results are memoized, so query generation, scoring and logging for the same video
+    all share one parse.
+
+    Args:
+        youtube_title (str): The original YouTube video title.
+
+    Returns:
+        ParsedTitle: The structured title record.
+    """
+
+    return _parse_title(youtube_title)
+
+
+def channel_artist(channel: Optional[str]) -> Optional[str]:
+    """
+    Returns the artist an artist-owned channel belongs to, or None for any other channel.
+
+    Examples:
+    - "Tasha Cobbs - Topic" -> "Tasha Cobbs"
+    - "TashaCobbsVEVO"      -> "Tasha Cobbs"
+
+    Args:
+        channel (Optional[str]): Channel title of the video owner.
+
+    Returns:
+        Optional[str]: The artist name, or None.
+    """
+
+    if not channel:
+        return None
+
+    match = _TOPIC_CHANNEL.match(channel.strip())
+    if match:
+        return match.group(1).strip() or None
+
+    match = _VEVO_CHANNEL.match(channel.strip())
+    if match:
+        # VEVO channel names are the artist name without spaces
+        return _CAMEL_CASE_BOUNDARY.sub(' ', match.group(1)).strip() or None
+
+    return None
+
+
+def with_channel_artist(youtube_title: str, channel: Optional[str]) -> str:
+    """
+    Prefixes the title with the artist of an artist-owned channel when the title lacks it.
+
+    "Topic" and VEVO uploads are often titled with the song name only; as "Artist - Song"
+    they parse, search and score like any well-formed title.
+
+    Args:
+        youtube_title (str): The original YouTube video title.
+        channel (Optional[str]): Channel title of the video owner.
+
+    Returns:
+        str: The title to parse for searching and scoring.
+    """
+
+    artist = channel_artist(channel)
+    if not artist or artist.lower() in youtube_title.lower():
+        return youtube_title
+    return f"{artist} - {youtube_title}"
+
+
+def has_confident_split(parsed: ParsedTitle) -> bool:
+    """
+    Tells whether a title's artist/song split is reliable enough for fielded Spotify queries.
+
+    A fielded query only returns tracks whose name and artist both contain the given
+    phrases, so a wrong split finds nothing; it is only used when the title was split
+    on a dash and the artist part looks like a name.
+
+    Args:
+        parsed (ParsedTitle): The parsed YouTube title.
+
+    Returns:
+        bool: True when parsed.artist and parsed.song can be searched as track/artist fields.
+    """
+
+    if not (parsed.artist and parsed.song):
+        return False
+    # Dashes come first in SEPARATORS, so a title containing one was split on it
+    if not any(sep in parsed.title for sep in DASH_SEPARATORS):
+        return False
+    return len(parsed.artist.split()) <= MAX_CONFIDENT_ARTIST_WORDS
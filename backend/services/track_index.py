@@ -0,0 +1,313 @@
+import json
+import time
+import zlib
+import sqlite3
+import threading
+from itertools import islice
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+from backend.services.title_parser import ParsedTitle, clean_title_noise
+from backend.services.utils import get_cache_dir, normalize_query
+
+# Upper bound on candidates pulled from the index for one title
+MAX_CANDIDATES = 50
+# Prefetched artist catalogs are refreshed after a week, to pick up new releases
+CATALOG_MAX_AGE = 7 * 24 * 60 * 60
+# Tracks written per transaction, so lookups are never held up for a whole artist catalog
+WRITE_BATCH_SIZE = 1000
+
+
+def _phrase(text: str) -> Optional[str]:
+    """
+    Quotes text as an FTS5 phrase, or returns None when it has nothing to match on.
+    """
+
+    if not any(char.isalnum() for char in text):
+        return None
+    return '"' + text.replace('"', '""') + '"'
+
+
+def _key(text: str) -> str:
+    return normalize_query(clean_title_noise(text))
+
+
+def compact_track(spotify_track: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Keeps only the fields scoring and SpotifyTrack need from a Spotify track object.
+
+    Full track objects carry the album, artist objects and market lists (several KB each);
+    the compact form is a few hundred bytes.
+    """
+
+    album = spotify_track.get("album") or {}
+    return {
+        "id": spotify_track["id"],
+        "name": spotify_track["name"],
+        "artists": [{"name": artist["name"]} for artist in spotify_track["artists"]],
+        "album": {"name": album.get("name", ""), "images": album.get("images", [])[:1]},
+        "external_urls": {"spotify": spotify_track["external_urls"]["spotify"]},
+        "duration_ms": spotify_track.get("duration_ms"),
+    }
+
+
+class LocalTrackIndex:
+    """
+    On-disk catalog of every Spotify track seen in search results, with an inverted index.
+
+    Track records are stored once, zlib-compressed, and indexed two ways:
+    - an exact (artist, song) key table: the parsed "Artist - Song" of a title is a single
+      b-tree lookup, which stays in the tens of microseconds on catalogs of millions of tracks;
+    - a contentless FTS5 table (posting lists only) over name, artists and album, used as
+      a phrase-search fallback when the title's parts do not equal a known track's exactly.
+
+    Artists whose whole catalog was prefetched (see artist_catalog) are recorded too, since
+    the index then knows their original tracks and not only the ones searches happened to return.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS tracks (
+                rowid INTEGER PRIMARY KEY,
+                track_id TEXT NOT NULL UNIQUE,
+                payload BLOB NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS track_keys (
+                artist_key TEXT NOT NULL,
+                name_key TEXT NOT NULL,
+                track_rowid INTEGER NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_track_keys ON track_keys (artist_key, name_key)")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS artist_catalogs (
+                artist_key TEXT PRIMARY KEY,
+                artist_id TEXT NOT NULL,
+                track_count INTEGER NOT NULL,
+                fetched_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            """
+            CREATE VIRTUAL TABLE IF NOT EXISTS track_terms USING fts5(
+                name, artists, album,
+                content='',
+                tokenize='unicode61 remove_diacritics 2'
+            )
+            """
+        )
+
+    def add_tracks(self, spotify_tracks: Iterable[Dict[str, Any]]) -> int:
+        """
+        Adds tracks that are not indexed yet (tracks are immutable, so known ids are skipped).
+
+        Args:
+            spotify_tracks (Iterable[Dict[str, Any]]): Spotify track objects from a search.
+
+        Returns:
+            int: Number of newly indexed tracks.
+        """
+
+        added = 0
+        spotify_tracks = iter(spotify_tracks)
+        while batch := list(islice(spotify_tracks, WRITE_BATCH_SIZE)):
+            added += self._add_batch(batch)
+        return added
+
+    def _add_batch(self, spotify_tracks: List[Dict[str, Any]]) -> int:
+        added = 0
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                for spotify_track in spotify_tracks:
+                    if not spotify_track or not spotify_track.get("id"):
+                        continue
+
+                    record = compact_track(spotify_track)
+                    cursor = self._conn.execute(
+                        "INSERT OR IGNORE INTO tracks (track_id, payload) VALUES (?, ?)",
+                        (record["id"], zlib.compress(json.dumps(record, separators=(",", ":")).encode("utf-8")))
+                    )
+                    if not cursor.rowcount:
+                        continue
+
+                    name_key = _key(record["name"])
+                    self._conn.executemany(
+                        "INSERT INTO track_keys (artist_key, name_key, track_rowid) VALUES (?, ?, ?)",
+                        [(_key(artist["name"]), name_key, cursor.lastrowid) for artist in record["artists"]]
+                    )
+                    self._conn.execute(
+                        "INSERT INTO track_terms (rowid, name, artists, album) VALUES (?, ?, ?, ?)",
+                        (
+                            cursor.lastrowid,
+                            record["name"],
+                            " ; ".join(artist["name"] for artist in record["artists"]),
+                            record["album"]["name"],
+                        )
+                    )
+                    added += 1
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+        return added
+
+    def _exact_rowids(self, parsed: ParsedTitle, limit: int) -> List[int]:
+        artist = _key(parsed.artist)
+        song = _key(parsed.song)
+        if not artist or not song:
+            return []
+
+        # Both orders: "Song - Artist" uploads are common too
+        rows = self._conn.execute(
+            """
+            SELECT track_rowid FROM track_keys WHERE artist_key = ? AND name_key = ?
+            UNION
+            SELECT track_rowid FROM track_keys WHERE artist_key = ? AND name_key = ?
+            LIMIT ?
+            """,
+            (artist, song, song, artist, limit)
+        ).fetchall()
+        return [rowid for (rowid,) in rows]
+
+    def _match_expressions(self, parsed: ParsedTitle) -> List[str]:
+        expressions = []
+        if parsed.artist and parsed.song:
+            artist = _phrase(parsed.artist)
+            song = _phrase(parsed.song)
+            if artist and song:
+                expressions.append(f"name : {song} AND artists : {artist}")
+                # "Song - Artist" uploads are common too
+                expressions.append(f"name : {artist} AND artists : {song}")
+        return expressions
+
+    def candidates(self, parsed: ParsedTitle, limit: int = MAX_CANDIDATES) -> List[Dict[str, Any]]:
+        """
+        Retrieves indexed tracks that could match a YouTube title.
+
+        Args:
+            parsed (ParsedTitle): The parsed YouTube title.
+            limit (int): Maximum number of candidates to return.
+
+        Returns:
+            List[Dict[str, Any]]: Spotify track objects (reduced to the scored fields).
+        """
+
+        if not (parsed.artist and parsed.song):
+            return []
+
+        expressions = self._match_expressions(parsed)
+
+        with self._lock:
+            rowids = self._exact_rowids(parsed, limit)
+            if rowids:
+                rows = self._conn.execute(
+                    "SELECT payload FROM tracks WHERE rowid IN (SELECT value FROM json_each(?))",
+                    (json.dumps(rowids),)
+                ).fetchall()
+            elif expressions:
+                rows = self._conn.execute(
+                    f"""
+                    SELECT payload FROM tracks WHERE rowid IN (
+                        {" UNION ".join("SELECT rowid FROM track_terms WHERE track_terms MATCH ?" for _ in expressions)}
+                        LIMIT ?
+                    )
+                    """,
+                    (*expressions, limit)
+                ).fetchall()
+            else:
+                rows = []
+
+            if rows:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+        return [json.loads(zlib.decompress(payload)) for (payload,) in rows]
+
+    def has_catalog(self, artist: str, max_age: float = CATALOG_MAX_AGE) -> bool:
+        """
+        Tells whether the artist's catalog was prefetched within `max_age` seconds.
+        """
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT fetched_at FROM artist_catalogs WHERE artist_key = ?", (_key(artist),)
+            ).fetchone()
+        return row is not None and time.time() - row[0] < max_age
+
+    def mark_catalog(self, artist: str, artist_id: str, track_count: int) -> None:
+        """
+        Records that an artist's catalog was prefetched into the index.
+
+        Args:
+            artist (str): Artist name as found in YouTube titles.
+            artist_id (str): Spotify artist id.
+            track_count (int): Number of tracks in the fetched catalog.
+        """
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO artist_catalogs (artist_key, artist_id, track_count, fetched_at) VALUES (?, ?, ?, ?)",
+                (_key(artist), artist_id, track_count, time.time())
+            )
+
+    def optimize(self) -> None:
+        """
+        Merges the FTS segments written by incremental inserts into one compact b-tree.
+        """
+
+        with self._lock:
+            self._conn.execute("INSERT INTO track_terms (track_terms) VALUES ('optimize')")
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Returns lookup counters for this process along with the number of indexed tracks.
+        """
+
+        with self._lock:
+            # Tracks are never deleted, so the last rowid is the count without a full scan
+            tracks = self._conn.execute("SELECT COALESCE(MAX(rowid), 0) FROM tracks").fetchone()[0]
+            artist_catalogs = self._conn.execute("SELECT COUNT(*) FROM artist_catalogs").fetchone()[0]
+
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": (self.hits / lookups) if lookups else 0.0,
+            "tracks": tracks,
+            "artist_catalogs": artist_catalogs,
+        }
+
+
+_track_index: Optional[LocalTrackIndex] = None
+_track_index_lock = threading.Lock()
+
+
+def get_track_index() -> LocalTrackIndex:
+    """
+    Returns the process-wide local track index, creating it on first use.
+    """
+
+    global _track_index
+
+    with _track_index_lock:
+        if _track_index is None:
+            _track_index = LocalTrackIndex(get_cache_dir() / "track_index.sqlite3")
+        return _track_index
@@ -0,0 +1,123 @@
+import json
+import time
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+from backend.models.records import SpotifyTrack
+from backend.services.utils import get_cache_dir
+
+
+class TrackMappingStore:
+    """
+    Persistent YouTube video_id -> accepted Spotify track mapping stored in SQLite.
+
+    Every accepted match is recorded with its confidence and timestamp, together with the
+    track fields the transfer needs, so a known video resolves without any Spotify call.
+    Misses are never stored: the song may be released on Spotify later.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS video_mappings (
+                video_id TEXT PRIMARY KEY,
+                track_id TEXT NOT NULL,
+                confidence REAL NOT NULL,
+                track TEXT NOT NULL,
+                matched_at REAL NOT NULL
+            )
+            """
+        )
+
+    def get(self, video_id: str) -> Optional[SpotifyTrack]:
+        return self.get_many([video_id]).get(video_id)
+
+    def get_many(self, video_ids: Iterable[str]) -> Dict[str, SpotifyTrack]:
+        """
+        Resolves many videos at once.
+
+        The ids are passed as a single JSON parameter, so a playlist of any size is one
+        primary-key lookup query (no bound-parameter limit to chunk around).
+
+        Args:
+            video_ids (Iterable[str]): YouTube video ids.
+
+        Returns:
+            Dict[str, SpotifyTrack]: Known tracks keyed by video id; unknown ids are absent.
+        """
+
+        video_ids = list(dict.fromkeys(video_ids))
+        if not video_ids:
+            return {}
+
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT video_id, track FROM video_mappings WHERE video_id IN (SELECT value FROM json_each(?))",
+                (json.dumps(video_ids),)
+            ).fetchall()
+
+            self.hits += len(rows)
+            self.misses += len(video_ids) - len(rows)
+
+        return {video_id: SpotifyTrack.from_dict(json.loads(track)) for video_id, track in rows}
+
+    def put(self, video_id: str, spotify_track: SpotifyTrack) -> None:
+        """
+        Records the track accepted for a video, replacing any previous mapping.
+
+        Args:
+            video_id (str): YouTube video id.
+            spotify_track (SpotifyTrack): The accepted track, with its confidence.
+        """
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO video_mappings (video_id, track_id, confidence, track, matched_at) VALUES (?, ?, ?, ?, ?)",
+                (video_id, spotify_track.track_id, spotify_track.confidence or 0.0, json.dumps(spotify_track.to_dict()), time.time())
+            )
+
+    def delete(self, video_id: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM video_mappings WHERE video_id = ?", (video_id,))
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Returns hit/miss counters for this process along with the number of stored mappings.
+        """
+
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM video_mappings").fetchone()[0]
+
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": (self.hits / lookups) if lookups else 0.0,
+            "entries": entries,
+        }
+
+
+_track_mappings: Optional[TrackMappingStore] = None
+_track_mappings_lock = threading.Lock()
+
+
+def get_track_mapping_store() -> TrackMappingStore:
+    """
+    Returns the process-wide video -> track mapping store, creating it on first use.
+    """
+
+    global _track_mappings
+
+    with _track_mappings_lock:
+        if _track_mappings is None:
+            _track_mappings = TrackMappingStore(get_cache_dir() / "track_mappings.sqlite3")
+        return _track_mappings
@@ -1,17 +1,22 @@
 from googleapiclient.discovery import Resource
 import spotipy
 import time
+from itertools import chain
 from datetime import datetime
 from backend.services.youtube_api import (
-    get_video_details_from_playlist,  # New function!
+    iter_playlist_video_pages,
+    enrich_video_pages,
+    get_playlist_etag,
     extract_playlist_id
 )
 from backend.services.spotify_api import (
     api_create_playlist,
-    api_process_videos_to_songs,  # New function!
+    api_process_video_pages_to_songs,
 )
-from backend.models.transfer import TransferResponse, SongResult
-from typing import List
+from backend.services.playlist_sync import filter_new_videos, get_playlist_sync_store
+from backend.models.records import SongRecord, TransferRecord
+from backend.models.transfer import TransferProgress
+from typing import Callable, List, Optional
 import logging
 
 # Setup a logger instance for this module
@@ -34,11 +39,25 @@ def transfer_playlist_api(
     playlist_url: str,
     playlist_name: str,
     is_public: bool = True,
-    description: str = "YouTube Playlist Transfer"
-) -> TransferResponse:
+    description: str = "YouTube Playlist Transfer",
+    concurrency: Optional[int] = None,
+    incremental: bool = False,
+    progress: Optional[TransferProgress] = None,
+    on_song: Optional[Callable[[SongRecord], None]] = None
+) -> TransferRecord:
     """
     Transfers a YouTube playlist to a new Spotify playlist with complete metadata.
 
+    The transfer is a pipeline: the first YouTube page is fetched (which validates the
+    playlist), the Spotify playlist is created, then the remaining pages are fetched
+    while the videos already received are being matched.
+
+    With `incremental`, a playlist synced before is not re-processed: if its etag is
+    unchanged nothing is fetched at all, otherwise only the playlist items added since the
+    last sync are searched and appended to the same Spotify playlist. Items that were not
+    matched last time (not found, skipped, rate limited) are searched again. Removed items
+    are left in the Spotify playlist.
+
     Args:
         youtube (Resource): Authenticated YouTube API service.
         sp (spotipy.Spotify): Authenticated Spotify client.
@@ -46,9 +65,15 @@ def transfer_playlist_api(
         playlist_name (str): Name for the new Spotify playlist.
         is_public (bool): Visibility of the Spotify playlist.
         description (str): Optional description.
+        concurrency (Optional[int]): Number of videos matched in parallel (server default when None).
+        incremental (bool): Only process the videos added since the last sync.
+        progress (Optional[TransferProgress]): Stage and counters updated as the transfer runs
+            (read by the transfer job endpoints).
+        on_song (Optional[Callable[[SongRecord], None]]): Receives each video's SongRecord as
+            soon as it is resolved (streamed by the transfer events endpoint).
 
     Returns:
-        TransferResponse: Complete transfer results with all metadata.
+        TransferRecord: Complete transfer results (TransferRecord.to_response builds the API model).
     """
     
     # Start timing the transfer
@@ -56,43 +81,87 @@ def transfer_playlist_api(
     created_at = datetime.utcnow().isoformat() + "Z"
     
     logger.info(f"Starting playlist transfer: {playlist_name}")
+    progress = progress or TransferProgress()
+    progress.stage = "fetching"
     
     try:
         # Step 1: Extract playlist ID from URL
         logger.info("Extracting playlist ID from URL...")
         playlist_id = extract_playlist_id(playlist_url)
         
-        # Step 2: Get detailed YouTube video data
-        logger.info("Fetching YouTube video details...")
-        youtube_videos = get_video_details_from_playlist(youtube, playlist_id)
-        total_songs = len(youtube_videos)
+        sync_store = get_playlist_sync_store()
+        sync_state = sync_store.get(playlist_id, playlist_name) if incremental else None
+        # Read before paging, so a change made while paging is picked up by the next sync
+        playlist_etag = get_playlist_etag(youtube, playlist_id) if incremental else None
         
-        logger.info(f"Found {total_songs} videos in YouTube playlist")
+        if sync_state:
+            # Incremental sync: reuse the Spotify playlist and only look at new playlist items
+            spotify_playlist_id = sync_state.spotify_playlist_id
+            spotify_playlist_url = sync_state.spotify_playlist_url
+            
+            if playlist_etag and playlist_etag == sync_state.playlist_etag:
+                logger.info("YouTube playlist unchanged since the last sync")
+                video_pages = iter(())
+            else:
+                logger.info("Fetching videos added since the last sync...")
+                synced_item_ids = sync_store.synced_item_ids(sync_state.sync_key)
+                video_pages = filter_new_videos(iter_playlist_video_pages(youtube, playlist_id), synced_item_ids)
+        else:
+            # Step 2: Fetch the first page of YouTube videos (fails fast on a bad playlist)
+            logger.info("Fetching YouTube video details...")
+            video_pages = iter_playlist_video_pages(youtube, playlist_id)
+            first_page = next(video_pages, [])
+            
+            # Step 3: Create Spotify playlist
+            logger.info("Creating Spotify playlist...")
+            spotify_playlist = api_create_playlist(
+                sp,
+                name=playlist_name,
+                isPublic=is_public,
+                description=description
+            )
+            
+            spotify_playlist_id = spotify_playlist["id"]
+            spotify_playlist_url = spotify_playlist["external_urls"]["spotify"]
+            video_pages = chain([first_page], video_pages)
+            
+            logger.info(f"Created Spotify playlist: {spotify_playlist_url}")
         
-        # Step 3: Create Spotify playlist
-        logger.info("Creating Spotify playlist...")
-        spotify_playlist = api_create_playlist(
+        # Step 4: Enrich every page with one videos.list call (duration, availability, topics),
+        # stream the pages into the Spotify matcher and add the matches
+        logger.info("Searching for songs on Spotify and adding to playlist...")
+        youtube_videos, song_results = api_process_video_pages_to_songs(
             sp,
-            name=playlist_name,
-            isPublic=is_public,
-            description=description
+            enrich_video_pages(youtube, video_pages),
+            spotify_playlist_id,
+            concurrency=concurrency,
+            progress=progress,
+            on_song=on_song
         )
+        total_songs = len(youtube_videos)
         
-        spotify_playlist_id = spotify_playlist["id"]
-        spotify_playlist_url = spotify_playlist["external_urls"]["spotify"]
-        
-        logger.info(f"Created Spotify playlist: {spotify_playlist_url}")
-        
-        # Step 4: Process videos and search for matches on Spotify
-        logger.info("Searching for songs on Spotify and adding to playlist...")
-        song_results = api_process_videos_to_songs(sp, youtube_videos, spotify_playlist_id)
+        logger.info(f"Found {total_songs} {'new ' if sync_state else ''}videos in YouTube playlist")
         
-        # Step 5: Calculate statistics
-        successful_songs = [song for song in song_results if song.status == "success"]
-        failed_songs = [song for song in song_results if song.status == "failed"]
+        if incremental:
+            # Unmatched videos are recorded without a track, so the next sync searches them
+            # again; the etag is dropped until they all match, or that sync would skip them
+            synced_items = [
+                (youtube_video, song.spotify_track_id)
+                for youtube_video, song in zip(youtube_videos, song_results)
+            ]
+            all_matched = all(track_id for _, track_id in synced_items)
+            sync_store.record(
+                playlist_id,
+                playlist_name,
+                spotify_playlist_id,
+                spotify_playlist_url,
+                playlist_etag if all_matched else None,
+                synced_items
+            )
         
-        transferred_songs = len(successful_songs)
-        failed_songs_count = len(failed_songs)
+        # Step 5: Calculate statistics (counted, not copied: song_results can be very long)
+        transferred_songs = sum(1 for song in song_results if song.status == "success")
+        failed_songs_count = sum(1 for song in song_results if song.status == "failed")
         
         # Calculate transfer duration
         end_time = time.time()
@@ -116,8 +185,8 @@ def transfer_playlist_api(
         logger.info(f"Avg time per song: {processing_time_per_song:.2f}s")
         logger.info("========================")
         
-        # Return complete response
-        return TransferResponse(
+        # Return complete results
+        return TransferRecord(
             success=True,
             playlist_id=spotify_playlist_id,
             playlist_url=spotify_playlist_url,
@@ -139,8 +208,8 @@ def transfer_playlist_api(
         
         logger.error(f"Transfer failed: {str(e)}")
         
-        # Return error response
-        return TransferResponse(
+        # Return error results
+        return TransferRecord(
             success=False,
             playlist_id="",
             playlist_url="",
@@ -173,9 +242,14 @@ def transfer_playlist_api_legacy(
     # Call the new function
     result = transfer_playlist_api(youtube, sp, playlist_url, playlist_name, is_public, description)
     
-    # Convert to legacy format
-    matched_titles = [song.title for song in result.songs if song.status == "success"]
-    unmatched_titles = [song.title for song in result.songs if song.status == "failed"]
+    # Convert to legacy format, in one pass over the songs
+    matched_titles = []
+    unmatched_titles = []
+    for song in result.songs:
+        if song.status == "success":
+            matched_titles.append(song.title)
+        elif song.status == "failed":
+            unmatched_titles.append(song.title)
     
     return {
         "matched": matched_titles,
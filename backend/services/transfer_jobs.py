@@ -0,0 +1,358 @@
+import os
+import json
+import math
+import time
+import uuid
+import asyncio
+import threading
+from rich import print
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
+from backend.models.records import SongRecord, TransferRecord
+from backend.models.transfer import TransferJobResponse, TransferProgress
+
+# Runs a transfer with the job's progress counters and song result listener
+TransferFunction = Callable[[TransferProgress, Callable[[SongRecord], None]], TransferRecord]
+
+# Transfers running at the same time, and transfers allowed to wait for a free worker
+DEFAULT_TRANSFER_WORKERS = 2
+DEFAULT_TRANSFER_QUEUE_SIZE = 8
+# Finished jobs are kept this long for GET /transfer/{job_id}
+DEFAULT_TRANSFER_JOB_TTL = 60 * 60
+
+# Retry-After bounds when the queue is full (seconds)
+MIN_RETRY_AFTER = 5
+MAX_RETRY_AFTER = 300
+DEFAULT_RETRY_AFTER = 30
+
+# Seconds between progress events on a job's event stream
+PROGRESS_EVENT_INTERVAL = 1.0
+# Events buffered per stream subscriber; a subscriber that falls further behind misses song events
+SUBSCRIBER_QUEUE_SIZE = 1000
+
+
+def _timestamp(seconds: Optional[float]) -> Optional[str]:
+    if seconds is None:
+        return None
+    return datetime.utcfromtimestamp(seconds).isoformat() + "Z"
+
+
+class TransferQueueFullError(Exception):
+    """
+    Raised when a transfer is submitted while every worker is busy and the queue is full.
+    """
+
+    def __init__(self, retry_after: int):
+        super().__init__(f"Too many transfers in progress, retry in {retry_after}s")
+        self.retry_after = retry_after
+
+
+class JobSubscription:
+    """
+    Event queue of one stream client, fed from the transfer's worker thread.
+
+    Events are handed over with call_soon_threadsafe, so the queue is only ever touched
+    from the event loop of the client that subscribed.
+    """
+
+    __slots__ = ("loop", "queue", "dropped")
+
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        self.loop = loop
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        self.dropped = 0
+
+    def deliver(self, event: str, data: str) -> None:
+        if self.queue.full():
+            if event != "done":
+                self.dropped += 1
+                return
+            # The final event always gets through, at the cost of the oldest pending one
+            self.queue.get_nowait()
+            self.dropped += 1
+        self.queue.put_nowait((event, data))
+
+
+class TransferJob:
+    """
+    One transfer submitted to the job manager.
+
+    Song results and the final status are pushed to the clients streaming the job's events
+    as they happen; nothing is replayed, so a job holds no per-song history for streaming.
+    """
+
+    __slots__ = (
+        "job_id", "status", "progress", "result", "error", "created_at", "started_at", "finished_at",
+        "_subscribers", "_subscribers_lock",
+    )
+
+    def __init__(self, job_id: str):
+        self.job_id = job_id
+        self.status = "queued"
+        self.progress = TransferProgress()
+        self.result: Optional[TransferRecord] = None
+        self.error: Optional[str] = None
+        self.created_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self._subscribers: List[JobSubscription] = []
+        self._subscribers_lock = threading.Lock()
+
+    def subscribe(self) -> JobSubscription:
+        """
+        Registers an event stream client (must be called from its running event loop).
+        """
+
+        subscription = JobSubscription(asyncio.get_running_loop())
+        with self._subscribers_lock:
+            self._subscribers.append(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: JobSubscription) -> None:
+        with self._subscribers_lock:
+            if subscription in self._subscribers:
+                self._subscribers.remove(subscription)
+
+    @property
+    def has_subscribers(self) -> bool:
+        return bool(self._subscribers)
+
+    def publish(self, event: str, data: str) -> None:
+        """
+        Sends an event (name, JSON data) to every subscribed client.
+        """
+
+        with self._subscribers_lock:
+            subscribers = list(self._subscribers)
+
+        for subscription in subscribers:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.deliver, event, data)
+            except RuntimeError:
+                # The client's loop is gone (server shutting down)
+                self.unsubscribe(subscription)
+
+    def publish_song(self, song: SongRecord) -> None:
+        if self._subscribers:
+            self.publish("song", song.to_result().model_dump_json())
+
+    def progress_event(self) -> str:
+        """
+        Returns the progress event data: the counters plus status, elapsed time and throughput.
+        """
+
+        elapsed = time.time() - self.started_at if self.started_at else 0.0
+        if self.finished_at and self.started_at:
+            elapsed = self.finished_at - self.started_at
+        return json.dumps({
+            "status": self.status,
+            **self.progress.model_dump(),
+            "elapsed": round(elapsed, 3),
+            "videos_per_second": round(self.progress.processed_videos / elapsed, 3) if elapsed else 0.0,
+        })
+
+    @property
+    def finished(self) -> bool:
+        return self.finished_at is not None
+
+    def to_response(self, include_songs: bool = True) -> TransferJobResponse:
+        return TransferJobResponse(
+            job_id=self.job_id,
+            status=self.status,
+            progress=self.progress.model_copy(),
+            # Without songs, the result is a summary; they are paged through GET /transfer/{job_id}/songs
+            result=self.result.to_response(include_songs) if self.result else None,
+            error=self.error,
+            created_at=_timestamp(self.created_at),
+            started_at=_timestamp(self.started_at),
+            finished_at=_timestamp(self.finished_at),
+        )
+
+
+class TransferJobManager:
+    """
+    Runs transfers in a bounded worker pool and keeps their status for polling.
+
+    At most `workers` transfers run at once and `queue_size` more may wait; beyond that
+    submissions are refused with a Retry-After estimated from recent transfer durations.
+    Finished jobs are dropped `ttl` seconds after they end.
+    """
+
+    def __init__(
+        self,
+        workers: int = DEFAULT_TRANSFER_WORKERS,
+        queue_size: int = DEFAULT_TRANSFER_QUEUE_SIZE,
+        ttl: float = DEFAULT_TRANSFER_JOB_TTL
+    ):
+        self.workers = workers
+        self.queue_size = queue_size
+        self.ttl = ttl
+
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="transfer")
+        self._jobs: Dict[str, TransferJob] = {}
+        self._active = 0
+        self._average_duration: Optional[float] = None
+
+    def submit(self, transfer: TransferFunction) -> TransferJob:
+        """
+        Queues a transfer.
+
+        Args:
+            transfer (TransferFunction): Runs the transfer, updating the progress and calling
+                the song listener it is given (e.g. a transfer_playlist_api partial).
+
+        Returns:
+            TransferJob: The queued job.
+
+        Raises:
+            TransferQueueFullError: If every worker is busy and the queue is full.
+        """
+
+        with self._lock:
+            self._evict_expired()
+            if self._active >= self.workers + self.queue_size:
+                raise TransferQueueFullError(self._retry_after())
+
+            job = TransferJob(uuid.uuid4().hex)
+            self._jobs[job.job_id] = job
+            self._active += 1
+
+        self._executor.submit(self._run, job, transfer)
+        return job
+
+    def _run(self, job: TransferJob, transfer: TransferFunction) -> None:
+        job.started_at = time.time()
+        job.status = "running"
+        try:
+            job.result = transfer(job.progress, job.publish_song)
+            job.status = "completed" if job.result.success else "failed"
+            if not job.result.success:
+                job.error = job.result.message
+        except Exception as e:
+            print(f"[red]Transfer job {job.job_id} failed: {e}[/red]")
+            job.status = "failed"
+            job.error = f"Transfer failed: {str(e)}"
+        finally:
+            job.progress.stage = "done"
+            job.finished_at = time.time()
+            with self._lock:
+                self._active -= 1
+                duration = job.finished_at - job.started_at
+                # Exponential moving average, so the estimate follows the current load
+                if self._average_duration is None:
+                    self._average_duration = duration
+                else:
+                    self._average_duration = 0.8 * self._average_duration + 0.2 * duration
+
+            # A summary only: the songs are paged through GET /transfer/{job_id}/songs
+            if job.has_subscribers:
+                job.publish("done", job.to_response(include_songs=False).model_dump_json())
+
+    def _retry_after(self) -> int:
+        """
+        Estimates when a worker frees up: the queued transfers drain `workers` at a time.
+        """
+
+        if self._average_duration is None:
+            return DEFAULT_RETRY_AFTER
+        waves = (self._active - self.workers + 1) / self.workers
+        return max(MIN_RETRY_AFTER, min(MAX_RETRY_AFTER, math.ceil(self._average_duration * waves)))
+
+    def _evict_expired(self) -> None:
+        now = time.time()
+        expired = [
+            job_id for job_id, job in self._jobs.items()
+            if job.finished and now - job.finished_at > self.ttl
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
+
+    def get(self, job_id: str) -> Optional[TransferJob]:
+        with self._lock:
+            self._evict_expired()
+            return self._jobs.get(job_id)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Returns the pool size and the number of jobs per status.
+        """
+
+        with self._lock:
+            self._evict_expired()
+            statuses: Dict[str, int] = {}
+            for job in self._jobs.values():
+                statuses[job.status] = statuses.get(job.status, 0) + 1
+
+        return {
+            "workers": self.workers,
+            "queue_size": self.queue_size,
+            "active": self._active,
+            "jobs": statuses,
+        }
+
+
+async def job_events(job: TransferJob, interval: float = PROGRESS_EVENT_INTERVAL) -> AsyncIterator[Tuple[str, str]]:
+    """
+    Streams a job's events as (event, JSON data) pairs until the job is done.
+
+    - "progress": stage, counters and throughput; sent first, then every `interval` seconds
+    - "song": a SongResult, as soon as a video is resolved
+    - "done": the final TransferJobResponse with the result summary (no songs, page them
+      with GET /transfer/{job_id}/songs)
+
+    Args:
+        job (TransferJob): The job to follow.
+        interval (float): Seconds between progress events.
+
+    Yields:
+        Tuple[str, str]: Event name and its JSON data.
+    """
+
+    subscription = job.subscribe()
+    try:
+        yield "progress", job.progress_event()
+        # Subscribed before checking, so a job finishing in between still sends "done"
+        if job.finished:
+            yield "done", job.to_response(include_songs=False).model_dump_json()
+            return
+
+        next_progress = time.monotonic() + interval
+        while True:
+            try:
+                timeout = max(0.0, next_progress - time.monotonic())
+                event, data = await asyncio.wait_for(subscription.queue.get(), timeout)
+            except asyncio.TimeoutError:
+                yield "progress", job.progress_event()
+                next_progress = time.monotonic() + interval
+                continue
+
+            yield event, data
+            if event == "done":
+                return
+    finally:
+        job.unsubscribe(subscription)
+
+
+_transfer_jobs: Optional[TransferJobManager] = None
+_transfer_jobs_lock = threading.Lock()
+
+
+def get_transfer_job_manager() -> TransferJobManager:
+    """
+    Returns the process-wide transfer job manager, creating it on first use.
+
+    Configured through TRANSFER_WORKERS, TRANSFER_QUEUE_SIZE and TRANSFER_JOB_TTL.
+    """
+
+    global _transfer_jobs
+
+    with _transfer_jobs_lock:
+        if _transfer_jobs is None:
+            _transfer_jobs = TransferJobManager(
+                workers=int(os.getenv("TRANSFER_WORKERS", DEFAULT_TRANSFER_WORKERS)),
+                queue_size=int(os.getenv("TRANSFER_QUEUE_SIZE", DEFAULT_TRANSFER_QUEUE_SIZE)),
+                ttl=float(os.getenv("TRANSFER_JOB_TTL", DEFAULT_TRANSFER_JOB_TTL)),
+            )
+        return _transfer_jobs
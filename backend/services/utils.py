@@ -0,0 +1,39 @@
+import os
+from pathlib import Path
+
+# Get the backend directory (root) path
+BACKEND_DIR = Path(__file__).parent.parent.resolve()
+
+
+def get_cache_dir(*parts: str) -> Path:
+    """
+    Returns (and creates) a directory under the application cache root.
+
+    The root defaults to backend/cache and can be moved with SYNCWAVE_CACHE_DIR, so
+    caches no longer depend on the directory the server was started from.
+
+    Args:
+        *parts (str): Optional sub directories below the cache root.
+
+    Returns:
+        Path: The absolute cache directory.
+    """
+
+    root = Path(os.getenv("SYNCWAVE_CACHE_DIR", BACKEND_DIR / "cache"))
+    if not root.is_absolute():
+        root = BACKEND_DIR / root
+
+    path = root.joinpath(*parts)
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def normalize_query(query: str) -> str:
+    """
+    Normalizes a search query so trivially different spellings share cache entries.
+
+    Spotify search is case-insensitive and ignores repeated whitespace, so
+    "Tasha Cobbs  You Still Love Me" and "tasha cobbs you still love me" are the same request.
+    """
+
+    return " ".join(query.lower().split())
@@ -1,41 +1,76 @@
 import os
+import re
 import json
+import hashlib
 import pickle
+import threading
+from datetime import timezone
 from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build, Resource
+from googleapiclient.discovery import build, build_from_document, Resource
+from googleapiclient.discovery_cache import get_static_doc
+from googleapiclient.errors import HttpError
+from googleapiclient.http import HttpRequest
 from google.auth.transport.requests import Request
 from dotenv import load_dotenv
 from pathlib import Path
 from urllib.parse import urlparse, parse_qs
-from typing import List
-from backend.models.transfer import YouTubeVideo
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, List, Optional
+from backend.models.records import YouTubeVideo
+from backend.services.client_pool import PooledClient, get_client_pool
+from backend.services.spotify_async import iterate_in_thread
+from backend.services.youtube_cache import get_youtube_page_cache
 
+# Get the backend directory (root) path
+backend_dir = Path(__file__).parent.parent
+load_dotenv(backend_dir / ".env")
 
-def get_authenticated_service(scopes: list[str] = None) -> Resource:
+_discovery_document: Optional[Dict[str, Any]] = None
+_discovery_document_lock = threading.Lock()
+_token_file_lock = threading.Lock()
+
+
+def _prime_resources(resource: Resource, description: Dict[str, Any]) -> None:
+    for name, child in description.get("resources", {}).items():
+        _prime_resources(getattr(resource, name)(), child)
+
+
+def _youtube_discovery_document(creds: Any) -> Optional[Dict[str, Any]]:
     """
-    Authenticates and returns a YouTube API service instance.
+    Returns the YouTube Data API discovery document, parsed once per process.
 
-    Args:
-        scopes (list[str]): A list of OAuth scopes required for the API access.
+    build() reads and parses the ~370 KB document every time, while building from the
+    parsed document takes well under a millisecond. googleapiclient adds the global query
+    parameters to a method's description the first time its resource is created, so every
+    resource is created once here: later builds leave the shared document unchanged.
 
-    Returns:
-        Resource: Authenticated YouTube API client resource.
+    Returns None when the installed client library does not ship the document.
     """
 
-    if scopes is None:
-        scopes = [os.getenv("YOUTUBE_SCOPE")]
+    global _discovery_document
+
+    with _discovery_document_lock:
+        if _discovery_document is None:
+            document = get_static_doc("youtube", "v3")
+            if document is None:
+                return None
+            document = json.loads(document)
+            _prime_resources(build_from_document(document, credentials=creds), document)
+            _discovery_document = document
+        return _discovery_document
+
+
+def _save_credentials(creds: Any, token_path: Path) -> None:
+    with _token_file_lock:
+        with open(token_path, "wb") as token_file:
+            pickle.dump(creds, token_file)
 
-    # Get the backend directory (root) path
-    backend_dir = Path(__file__).parent.parent
-    load_dotenv(backend_dir / ".env")
 
-    print(f"Using client secrets file: {scopes}, {os.getenv("YOUTUBE_PLAYLIST_URL")}, {os.getenv("YOUTUBE_CLIENT_JSON")}")
+def _build_youtube_credentials(scopes: list[str], token_path: Path) -> PooledClient:
+    print(f"Using client secrets file: {scopes}, {os.getenv('YOUTUBE_PLAYLIST_URL')}, {os.getenv('YOUTUBE_CLIENT_JSON')}")
 
     client_secrets_file = backend_dir / os.getenv("YOUTUBE_CLIENT_JSON")
-    token_path = backend_dir / "credentials/youtube_token.pickle"
     creds = None
 
-
     # Load existing credentials if available
     if os.path.exists(token_path):
         with open(token_path, "rb") as token_file:
@@ -50,33 +85,245 @@ def get_authenticated_service(scopes: list[str] = None) -> Resource:
             creds = flow.run_local_server(port=8080)
 
         # Save token for next time
-        with open(token_path, "wb") as token_file:
-            pickle.dump(creds, token_file)
+        _save_credentials(creds, token_path)
 
-    return build("youtube", "v3", credentials=creds)
+    def expires_at() -> Optional[float]:
+        # google-auth keeps the expiry as a naive UTC datetime
+        return creds.expiry.replace(tzinfo=timezone.utc).timestamp() if creds.expiry else None
 
+    def refresh() -> None:
+        creds.refresh(Request())
+        _save_credentials(creds, token_path)
 
-def get_video_details_from_playlist(
-    youtube: Resource,
-    playlist_id: str
-) -> List[YouTubeVideo]:
+    return PooledClient(creds, expires_at, refresh)
+
+
+def get_authenticated_service(scopes: list[str] = None) -> Resource:
     """
-    Fetches detailed video information from a YouTube playlist.
+    Returns a YouTube API service instance authenticated with the pooled credentials.
+
+    The credentials are loaded once per (token file, scopes) and refreshed in the
+    background before they expire (see client_pool). The backend acts as a single YouTube
+    account, the one whose token is in credentials/youtube_token.pickle, so every caller
+    shares its credentials; the routes carry no per-user tokens to key them by. A new service is built on every
+    call from the cached discovery document, which is nearly free and gives each caller
+    its own HTTP connection (httplib2 connections are not thread-safe).
+
+    Args:
+        scopes (list[str]): A list of OAuth scopes required for the API access.
+
+    Returns:
+        Resource: Authenticated YouTube API client resource.
+    """
+
+    if scopes is None:
+        scopes = [os.getenv("YOUTUBE_SCOPE")]
+
+    token_path = backend_dir / "credentials/youtube_token.pickle"
+    key = f"youtube:{token_path}:{' '.join(scopes)}"
+    creds = get_client_pool().get(key, lambda: _build_youtube_credentials(scopes, token_path))
+
+    document = _youtube_discovery_document(creds)
+    if document is None:
+        return build("youtube", "v3", credentials=creds)
+    return build_from_document(document, credentials=creds)
+
+
+def execute_cached(request: HttpRequest, cache_key: str) -> Dict[str, Any]:
+    """
+    Executes a YouTube API list request through the persistent page cache.
+
+    When the page is cached, its ETag is sent in If-None-Match: a 304 means the page is
+    unchanged and it is served from the cache instead of being downloaded again.
+
+    Args:
+        request (HttpRequest): The prepared API request.
+        cache_key (str): Key from YouTubePageCache.make_key.
+
+    Returns:
+        Dict[str, Any]: The decoded API response.
+    """
+
+    cache = get_youtube_page_cache()
+    cached = cache.get(cache_key)
+    if cached:
+        request.headers["If-None-Match"] = cached[0]
+
+    try:
+        response = request.execute()
+    except HttpError as e:
+        if cached and e.resp.status == 304:
+            cache.mark_revalidated(cache_key)
+            return cached[1]
+        raise
+
+    cache.set(cache_key, response)
+    return response
+
+
+def _video_from_item(item: Dict[str, Any]) -> YouTubeVideo:
+    """
+    Builds a YouTubeVideo from one playlistItems.list item.
+    """
+
+    snippet = item["snippet"]
+    
+    # Extract video ID from resourceId
+    video_id = snippet["resourceId"]["videoId"]
+    
+    # Get the best available thumbnail
+    thumbnails = snippet.get("thumbnails", {})
+    thumbnail_url = None
+    
+    # Prefer higher quality thumbnails
+    for quality in ["maxres", "standard", "high", "medium", "default"]:
+        if quality in thumbnails:
+            thumbnail_url = thumbnails[quality]["url"]
+            break
+
+    return YouTubeVideo(
+        video_id=video_id,
+        title=snippet["title"],
+        thumbnail_url=thumbnail_url,
+        video_owner_channel=snippet.get("videoOwnerChannelTitle"),
+        playlist_item_id=item.get("id")
+    )
+
+
+# ISO 8601 durations as returned in contentDetails.duration, e.g. "PT3M42S" or "P1DT2H"
+_ISO_DURATION = re.compile(r"P(?:(\d+)D)?(?:T(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?)?")
+
+# Keywords of music topic pages in topicDetails.topicCategories ("Music", "Pop_music", "Jazz"...)
+_MUSIC_TOPICS = ("music", "jazz", "reggae", "rhythm_and_blues", "blues")
+
+SKIP_NON_MUSIC_VIDEOS = os.getenv("SKIP_NON_MUSIC_VIDEOS", "true").lower() == "true"
+
+
+def parse_iso_duration(duration: Optional[str]) -> Optional[int]:
+    """
+    Converts an ISO 8601 video duration (e.g. "PT3M42S") to milliseconds.
+    """
+
+    match = _ISO_DURATION.fullmatch(duration or "")
+    if not match or not any(match.groups()):
+        return None
+
+    days, hours, minutes, seconds = (int(part or 0) for part in match.groups())
+    return (((days * 24 + hours) * 60 + minutes) * 60 + seconds) * 1000
+
+
+def _skip_reason(details: Optional[Dict[str, Any]]) -> Optional[str]:
+    """
+    Tells why a video should not be searched on Spotify, from its videos.list resource.
+    """
+
+    # Deleted and private videos are not returned by videos.list at all
+    if details is None:
+        return "Video is unavailable (deleted or private)"
+
+    status = details.get("status", {})
+    if status.get("privacyStatus") == "private" or status.get("uploadStatus") in ("deleted", "failed", "rejected"):
+        return "Video is unavailable (deleted or private)"
+
+    topics = details.get("topicDetails", {}).get("topicCategories")
+    # No topics means YouTube did not classify the video: search it rather than guess
+    if SKIP_NON_MUSIC_VIDEOS and topics and not any(keyword in topic.lower() for topic in topics for keyword in _MUSIC_TOPICS):
+        return "Not a music video"
+
+    return None
+
+
+def enrich_videos(youtube: Resource, youtube_videos: List[YouTubeVideo]) -> List[YouTubeVideo]:
+    """
+    Adds duration and availability to videos with one videos.list call per 50 videos.
+
+    Sets `duration_ms`, and `skip_reason` for unavailable or non-music videos (vlogs,
+    podcasts, deleted or private videos...), so they never cost Spotify searches.
+
+    Args:
+        youtube (Resource): Authenticated YouTube API service
+        youtube_videos (List[YouTubeVideo]): Videos to enrich.
+
+    Returns:
+        List[YouTubeVideo]: The same videos, enriched in place.
+    """
+
+    cache = get_youtube_page_cache()
+
+    for start in range(0, len(youtube_videos), 50):
+        batch = youtube_videos[start:start + 50]
+        video_ids = ",".join(dict.fromkeys(video.video_id for video in batch))
+
+        request = youtube.videos().list(part="contentDetails,status,topicDetails", id=video_ids, maxResults=50)
+        batch_key = hashlib.sha1(video_ids.encode("utf-8")).hexdigest()
+        response = execute_cached(request, cache.make_key("videos", batch_key, None))
+        details_by_id = {item["id"]: item for item in response.get("items", [])}
+
+        for video in batch:
+            details = details_by_id.get(video.video_id)
+            video.duration_ms = parse_iso_duration((details or {}).get("contentDetails", {}).get("duration"))
+            video.skip_reason = _skip_reason(details)
+
+    return youtube_videos
+
+
+def enrich_video_pages(youtube: Resource, video_pages: Iterable[List[YouTubeVideo]]) -> Iterator[List[YouTubeVideo]]:
+    """
+    Enriches a stream of playlist pages (see enrich_videos), one videos.list call per page.
+
+    Args:
+        youtube (Resource): Authenticated YouTube API service
+        video_pages (Iterable[List[YouTubeVideo]]): Playlist pages, in order.
+
+    Yields:
+        List[YouTubeVideo]: The enriched videos of each page
+    """
+
+    for page in video_pages:
+        yield enrich_videos(youtube, page)
+
+
+def get_playlist_etag(youtube: Resource, playlist_id: str) -> Optional[str]:
+    """
+    Returns the etag of a playlist resource (it changes when items are added or removed).
 
     Args:
         youtube (Resource): Authenticated YouTube API service
         playlist_id (str): The YouTube playlist ID
 
     Returns:
-        List[YouTubeVideo]: List of YouTube videos with full metadata
+        Optional[str]: The playlist etag, or None if the playlist was not found.
     """
 
-    cache_dir = Path("cache") / f"youtube_raw_{playlist_id}"
-    os.makedirs(cache_dir, exist_ok=True)
+    cache = get_youtube_page_cache()
+    request = youtube.playlists().list(part="contentDetails", id=playlist_id)
+    response = execute_cached(request, cache.make_key("playlists", playlist_id, None))
+
+    items = response.get("items") or []
+    return items[0].get("etag") if items else None
+
+
+def iter_playlist_video_pages(
+    youtube: Resource,
+    playlist_id: str
+) -> Iterator[List[YouTubeVideo]]:
+    """
+    Lazily pages through a YouTube playlist, yielding the videos of one API page (up to 50) at a time.
 
-    videos = []
+    The next page is only requested when the consumer asks for it, so callers can start
+    working on the first videos while the rest of the playlist is still being fetched.
+    Pages go through the ETag-revalidated page cache (see execute_cached).
+
+    Args:
+        youtube (Resource): Authenticated YouTube API service
+        playlist_id (str): The YouTube playlist ID
+
+    Yields:
+        List[YouTubeVideo]: The videos of each page, in playlist order
+    """
+
+    cache = get_youtube_page_cache()
     next_page_token = None
-    page = 1
 
     while True:
         request = youtube.playlistItems().list(
@@ -85,48 +332,56 @@ def get_video_details_from_playlist(
             maxResults=50,
             pageToken=next_page_token,
         )
-        response = request.execute()
+        # Unchanged pages are revalidated with their ETag and served from the page cache
+        response = execute_cached(request, cache.make_key("playlistItems", playlist_id, next_page_token))
 
-        # Save API response for current page in cache dir
-        cache_filename = cache_dir / f"page_{page}.json"
-        with open(cache_filename, "w", encoding="utf-8") as file:
-            json.dump(response, file, indent=4)
-
-        for item in response["items"]:
-            snippet = item["snippet"]
-            
-            # Extract video ID from resourceId
-            video_id = snippet["resourceId"]["videoId"]
-            
-            # Get the best available thumbnail
-            thumbnails = snippet.get("thumbnails", {})
-            thumbnail_url = None
-            
-            # Prefer higher quality thumbnails
-            for quality in ["maxres", "standard", "high", "medium", "default"]:
-                if quality in thumbnails:
-                    thumbnail_url = thumbnails[quality]["url"]
-                    break
-
-            # Create YouTubeVideo object
-            video = YouTubeVideo(
-                video_id=video_id,
-                title=snippet["title"],
-                youtube_url=f"https://www.youtube.com/watch?v={video_id}",
-                thumbnail_url=thumbnail_url,
-                channel_title=snippet.get("channelTitle"),
-                video_owner_channel=snippet.get("videoOwnerChannelTitle")
-            )
-            
-            videos.append(video)
+        yield [_video_from_item(item) for item in response["items"]]
 
         next_page_token = response.get("nextPageToken")
         if not next_page_token:
             break
 
-        page += 1
 
-    return videos
+def aiter_playlist_video_pages(
+    youtube: Resource,
+    playlist_id: str
+) -> AsyncIterator[List[YouTubeVideo]]:
+    """
+    Async-iterator version of iter_playlist_video_pages.
+
+    The blocking API calls run in a worker thread, one page at a time, so the event
+    loop keeps matching earlier pages while the next one is fetched.
+
+    Args:
+        youtube (Resource): Authenticated YouTube API service
+        playlist_id (str): The YouTube playlist ID
+
+    Returns:
+        AsyncIterator[List[YouTubeVideo]]: The videos of each page, in playlist order
+    """
+
+    return iterate_in_thread(iter_playlist_video_pages(youtube, playlist_id))
+
+
+def get_video_details_from_playlist(
+    youtube: Resource,
+    playlist_id: str
+) -> List[YouTubeVideo]:
+    """
+    Fetches detailed video information from a YouTube playlist.
+
+    Loads the whole playlist; use iter_playlist_video_pages (or aiter_playlist_video_pages)
+    to stream it page by page instead.
+
+    Args:
+        youtube (Resource): Authenticated YouTube API service
+        playlist_id (str): The YouTube playlist ID
+
+    Returns:
+        List[YouTubeVideo]: List of YouTube videos with full metadata
+    """
+
+    return [video for page in iter_playlist_video_pages(youtube, playlist_id) for video in page]
 
 
 def get_video_titles_from_playlist(
@@ -0,0 +1,158 @@
+import os
+import json
+import time
+import zlib
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+from backend.services.utils import get_cache_dir
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+class YouTubePageCache:
+    """
+    Persistent, size-bounded cache of YouTube API list pages, revalidated with ETags.
+
+    Pages are keyed by playlist id and page token and stored as compact, zlib-compressed
+    JSON together with the ETag the API returned. Callers send the stored ETag in
+    If-None-Match; on a 304 the stored page is served, so an unchanged page is never
+    downloaded again. Once the stored payloads exceed `max_bytes`, the least recently
+    used pages are evicted.
+    """
+
+    def __init__(self, path: Path, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.revalidated = 0
+        self.downloads = 0
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS youtube_pages (
+                key TEXT PRIMARY KEY,
+                etag TEXT NOT NULL,
+                payload BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_youtube_pages_accessed ON youtube_pages (accessed_at)")
+        self._total_bytes = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM youtube_pages").fetchone()[0]
+
+    @staticmethod
+    def make_key(resource: str, resource_id: str, page_token: Optional[str]) -> str:
+        return f"{resource}:{resource_id}:{page_token or ''}"
+
+    def get(self, key: str) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """
+        Returns the stored (etag, page) for a key, or None when the page was never cached.
+        """
+
+        with self._lock:
+            row = self._conn.execute("SELECT etag, payload FROM youtube_pages WHERE key = ?", (key,)).fetchone()
+
+        if row is None:
+            return None
+        return row[0], json.loads(zlib.decompress(row[1]))
+
+    def mark_revalidated(self, key: str) -> None:
+        """
+        Records a 304 for a stored page (refreshes its LRU position).
+        """
+
+        with self._lock:
+            self._conn.execute("UPDATE youtube_pages SET accessed_at = ? WHERE key = ?", (time.time(), key))
+            self.revalidated += 1
+
+    def set(self, key: str, response: Dict[str, Any]) -> None:
+        """
+        Stores a freshly downloaded page, evicting least recently used pages when over budget.
+
+        Args:
+            key (str): Cache key from make_key.
+            response (Dict[str, Any]): Decoded API response (its `etag` is used for revalidation).
+        """
+
+        etag = response.get("etag")
+        with self._lock:
+            self.downloads += 1
+            if not etag:
+                return
+
+            payload = zlib.compress(json.dumps(response, separators=(",", ":")).encode("utf-8"))
+            previous = self._conn.execute("SELECT size FROM youtube_pages WHERE key = ?", (key,)).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO youtube_pages (key, etag, payload, size, accessed_at) VALUES (?, ?, ?, ?, ?)",
+                (key, etag, payload, len(payload), time.time())
+            )
+            self._total_bytes += len(payload) - (previous[0] if previous else 0)
+
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+
+    def _evict(self) -> None:
+        """
+        Drops least recently used pages until the cache is back under 90% of its byte budget.
+        """
+
+        target = int(self.max_bytes * 0.9)
+        rows = self._conn.execute("SELECT key, size FROM youtube_pages ORDER BY accessed_at").fetchall()
+
+        evicted = []
+        for key, size in rows:
+            if self._total_bytes <= target:
+                break
+            evicted.append((key,))
+            self._total_bytes -= size
+
+        self._conn.executemany("DELETE FROM youtube_pages WHERE key = ?", evicted)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM youtube_pages")
+            self._total_bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Returns download/revalidation counters for this process along with the cache size.
+        """
+
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM youtube_pages").fetchone()[0]
+
+        return {
+            "downloads": self.downloads,
+            "revalidated": self.revalidated,
+            "entries": entries,
+            "bytes": self._total_bytes,
+            "max_bytes": self.max_bytes,
+        }
+
+
+_youtube_page_cache: Optional[YouTubePageCache] = None
+_youtube_page_cache_lock = threading.Lock()
+
+
+def get_youtube_page_cache() -> YouTubePageCache:
+    """
+    Returns the process-wide YouTube page cache, creating it on first use.
+
+    Stored in the cache directory (SYNCWAVE_CACHE_DIR) and bounded by YOUTUBE_PAGE_CACHE_MAX_BYTES.
+    """
+
+    global _youtube_page_cache
+
+    with _youtube_page_cache_lock:
+        if _youtube_page_cache is None:
+            _youtube_page_cache = YouTubePageCache(
+                get_cache_dir() / "youtube_pages.sqlite3",
+                max_bytes=int(os.getenv("YOUTUBE_PAGE_CACHE_MAX_BYTES", DEFAULT_MAX_BYTES)),
+            )
+        return _youtube_page_cache
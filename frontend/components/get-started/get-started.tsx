@@ -13,6 +13,7 @@ import TransferResults from "@/components/get-started/transferResults";
 import AnimatedBackground from "@/components/get-started/animatedBackground";
 import { transferAPI } from "@/utils/api_routes.ts/api";
 import {
+  TransferLiveProgressProps,
   TransferResultResponseProps,
   PlaylistTransferRequestProps,
 } from "@/types";
@@ -29,6 +30,8 @@ export default function GetStarted() {
     useState<TransferResultResponseProps | null>(null);
   const [error, setError] = useState<string | null>(null);
   const [isTransferring, setIsTransferring] = useState(false);
+  const [liveProgress, setLiveProgress] =
+    useState<TransferLiveProgressProps | null>(null);
   const [formKey, setFormKey] = useState(0);
   const router = useRouter();
   const logger = useLogger("components/get-started/GetStarted");
@@ -82,12 +85,13 @@ export default function GetStarted() {
     try {
       setError(null);
       setPlaylistData(data);
+      setLiveProgress(null);
       setIsTransferring(true);
       setCurrentStep("progress");
 
       logger.info("Starting transfer with data:", data);
 
-      const results = await transferAPI.directTransfer(data);
+      const results = await transferAPI.directTransfer(data, setLiveProgress);
 
       logger.success("✅ Transfer completed:", results);
 
@@ -125,6 +129,7 @@ export default function GetStarted() {
     setTransferResults(null);
     setError(null);
     setIsTransferring(false);
+    setLiveProgress(null);
     setFormKey((prev) => prev + 1);
 
     // Force scroll to top
@@ -215,6 +220,7 @@ export default function GetStarted() {
           {currentStep === "progress" && playlistData && (
             <TransferProgress
               isTransferring={isTransferring}
+              liveProgress={liveProgress}
               playlistData={playlistData}
             />
           )}
@@ -5,18 +5,69 @@ import { Card, CardBody, Progress, Chip } from "@heroui/react";
 import { Music, Search, CheckCircle, Download, Loader2 } from "lucide-react";
 import { gsap } from "gsap";
 
-import { ProgressStepProps, PlaylistTransferRequestProps } from "@/types";
+import {
+  ProgressStepProps,
+  PlaylistTransferRequestProps,
+  TransferLiveProgressProps,
+} from "@/types";
 import { stat } from "fs";
 import { useLogger } from "@/utils/useLogger";
 
 interface TransferProgressProps {
   playlistData: PlaylistTransferRequestProps;
   isTransferring: boolean;
+  liveProgress?: TransferLiveProgressProps | null;
 }
 
+// Progress step shown for each backend stage
+const STAGE_STEPS: Record<TransferLiveProgressProps["stage"], number> = {
+  queued: 0,
+  fetching: 0,
+  matching: 1,
+  adding: 2,
+  done: 3,
+};
+
+const getLivePercent = (live: TransferLiveProgressProps) => {
+  switch (live.stage) {
+    case "queued":
+      return 5;
+    case "fetching":
+      return 10;
+    case "matching":
+      return live.uniqueVideos
+        ? 15 + (70 * live.processedVideos) / live.uniqueVideos
+        : 15;
+    case "adding":
+      return 90;
+    default:
+      return 100;
+  }
+};
+
+const getLiveMessage = (live: TransferLiveProgressProps) => {
+  switch (live.stage) {
+    case "queued":
+      return "Waiting for a free transfer slot...";
+    case "fetching":
+      return "Fetching YouTube video details...";
+    case "matching":
+      if (!live.lastSong) return "Searching for songs on Spotify...";
+
+      return `${live.lastSong.status === "success" ? "Found" : "Not found"}: ${
+        live.lastSong.title
+      } by ${live.lastSong.artist} (${live.videosPerSecond.toFixed(1)} songs/s)`;
+    case "adding":
+      return "Adding songs to playlist...";
+    default:
+      return "Transfer completed successfully!";
+  }
+};
+
 export default function TransferProgress({
   playlistData,
   isTransferring,
+  liveProgress,
 }: TransferProgressProps) {
   const containerRef = useRef<HTMLDivElement>(null);
   const [currentStepIndex, setCurrentStepIndex] = useState(0);
@@ -26,6 +77,8 @@ export default function TransferProgress({
   const [currentMessage, setCurrentMessage] = useState("Starting transfer...");
   const progressTime = 1000;
   const logger = useLogger("components/get-started/TransferProgress");
+  // Once real events arrive they drive the display and the simulation stops
+  const liveRef = useRef(false);
 
   logger.info("🎵 TransferProgress rendered:", {
     playlistName: playlistData.name,
@@ -186,7 +239,7 @@ export default function TransferProgress({
     setTotalSongs(estimatedTotal);
 
     const progressInterval = setInterval(() => {
-      if (currentProgressIndex >= progressSteps.length) {
+      if (liveRef.current || currentProgressIndex >= progressSteps.length) {
         logger.success("Progress simulation completed");
         clearInterval(progressInterval);
 
@@ -238,6 +291,22 @@ export default function TransferProgress({
     };
   }, [isTransferring, progressTime]);
 
+  useEffect(() => {
+    if (!liveProgress) return;
+
+    liveRef.current = true;
+    setCurrentStepIndex(STAGE_STEPS[liveProgress.stage]);
+    setProgress(getLivePercent(liveProgress));
+    setCurrentMessage(getLiveMessage(liveProgress));
+    setTotalSongs(liveProgress.totalVideos);
+    setFoundSongs(liveProgress.matchedVideos);
+  }, [liveProgress]);
+
+  // Live counts only cover the songs searched so far
+  const notFoundSongs = liveProgress
+    ? liveProgress.processedVideos - liveProgress.matchedVideos
+    : totalSongs - foundSongs;
+
   const getStepStatus = (stepIndex: number) => {
     if (stepIndex < currentStepIndex) return "completed";
     if (stepIndex === currentStepIndex) return "active";
@@ -371,7 +440,7 @@ export default function TransferProgress({
         <Card className="bg-gray-800/30 border border-gray-700">
           <CardBody className="p-4 text-center">
             <div className="text-2xl font-bold text-yellow-400 mb-1">
-              {totalSongs - foundSongs}
+              {notFoundSongs}
             </div>
             <div className="text-gray-400 text-sm">Not Found</div>
           </CardBody>
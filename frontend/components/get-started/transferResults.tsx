@@ -15,6 +15,7 @@ import {
 import { gsap } from "gsap";
 
 import { TransferResultResponseProps } from "@/types";
+import { transferAPI } from "@/utils/api_routes.ts/api";
 import { useLogger } from "@/utils/useLogger";
 
 interface TransferResultsProps {
@@ -29,8 +30,17 @@ export default function TransferResults({
   const containerRef = useRef<HTMLDivElement>(null);
   const [showAllSongs, setShowAllSongs] = useState(false);
   const [copySuccess, setCopySuccess] = useState(false);
+  // Songs are paged in from the backend as the list is expanded
+  const [songs, setSongs] = useState(results.songs);
+  const [nextCursor, setNextCursor] = useState(results.nextCursor);
+  const [isLoadingSongs, setIsLoadingSongs] = useState(false);
   const logger = useLogger("components/get-started/TransferResults");
 
+  useEffect(() => {
+    setSongs(results.songs);
+    setNextCursor(results.nextCursor);
+  }, [results]);
+
   useEffect(() => {
     // Reset GSAP context and clear any existing animations
     const ctx = gsap.context(() => {
@@ -115,6 +125,22 @@ export default function TransferResults({
     }
   };
 
+  const handleLoadMoreSongs = async () => {
+    if (!nextCursor || isLoadingSongs) return;
+
+    setIsLoadingSongs(true);
+    try {
+      const page = await transferAPI.getSongsPage(results.jobId, nextCursor);
+
+      setSongs((loaded) => [...loaded, ...page.songs]);
+      setNextCursor(page.nextCursor);
+    } catch (error) {
+      logger.error("Failed to load more songs:", error);
+    } finally {
+      setIsLoadingSongs(false);
+    }
+  };
+
   const handleSharePlaylist = async () => {
     try {
       await navigator.clipboard.writeText(results.playlistUrl);
@@ -149,9 +175,7 @@ export default function TransferResults({
   const successRate = Math.round(
     (results.transferredSongs / results.totalSongs) * 100,
   );
-  const displayedSongs = showAllSongs
-    ? results.songs
-    : results.songs.slice(0, 5);
+  const displayedSongs = showAllSongs ? songs : songs.slice(0, 5);
 
   return (
     <div ref={containerRef} className="max-w-4xl mx-auto space-y-6 relative">
@@ -279,7 +303,7 @@ export default function TransferResults({
               <Music size={20} />
               Transferred Songs
             </h3>
-            {results.songs.length > 5 && (
+            {results.totalSongs > 5 && (
               <Button
                 size="sm"
                 variant="ghost"
@@ -287,7 +311,7 @@ export default function TransferResults({
               >
                 {showAllSongs
                   ? "Show Less"
-                  : `Show All (${results.songs.length})`}
+                  : `Show All (${results.totalSongs})`}
               </Button>
             )}
           </div>
@@ -412,6 +436,19 @@ export default function TransferResults({
             ))}
           </div>
 
+          {showAllSongs && nextCursor && (
+            <div className="flex justify-center mt-4">
+              <Button
+                isLoading={isLoadingSongs}
+                size="sm"
+                variant="ghost"
+                onPress={handleLoadMoreSongs}
+              >
+                Load More ({songs.length} of {results.totalSongs})
+              </Button>
+            </div>
+          )}
+
           {results.failedSongs > 0 && (
             <>
               <Divider className="my-6 bg-gray-500/60" />
@@ -57,7 +57,23 @@ export interface TransferProgressResponseProps {
   message?: string;
 }
 
+// Live state of a running transfer, built from its event stream
+export interface TransferLiveProgressProps {
+  stage: "queued" | "fetching" | "matching" | "adding" | "done";
+  totalVideos: number;
+  uniqueVideos: number;
+  processedVideos: number;
+  matchedVideos: number;
+  videosPerSecond: number;
+  lastSong?: {
+    title: string;
+    artist: string;
+    status: "success" | "failed";
+  };
+}
+
 export interface TransferResultResponseProps {
+  jobId: string;
   playlistId: string;
   playlistUrl: string;
   totalSongs: number;
@@ -74,6 +90,8 @@ export interface TransferResultResponseProps {
     youtubeUrl?: string;
     error?: string;
   }>;
+  // Cursor of the next page of songs, null once every song is loaded
+  nextCursor: string | null;
   transferDuration: number;
   createdAt: string;
 }
@@ -97,6 +115,7 @@ export interface TransferResultsProps {
 export interface TransferProgressProps {
   playlistData: PlaylistTransferRequestProps;
   isTransferring: boolean;
+  liveProgress?: TransferLiveProgressProps | null;
 }
 
 export interface ProgressStepProps {
@@ -4,6 +4,7 @@ import { config } from "../config";
 
 import {
   PlaylistTransferRequestProps,
+  TransferLiveProgressProps,
   TransferResultResponseProps,
 } from "@/types";
 
@@ -447,14 +448,143 @@ export const callbackHandlers = {
 
 
 
+// How often a running transfer job is polled (when its event stream is unavailable)
+const TRANSFER_POLL_INTERVAL_MS = 1500;
+// Song results per request when reading a finished transfer
+const TRANSFER_SONGS_PAGE_SIZE = 100;
+
+const sleep = (ms: number) =>
+  new Promise((resolve) => setTimeout(resolve, ms));
+
+const mapSong = (song: any): TransferResultResponseProps["songs"][number] => ({
+  id: song.id,
+  title: song.title,
+  artist: song.artist,
+  album: song.album,
+  thumbnail: song.thumbnail,
+  status: song.status,
+  spotifyUrl: song.spotify_url,
+  youtubeUrl: song.youtube_url,
+  error: song.error,
+});
+
+/**
+ * Reads one page of a finished transfer's song results (the first one without a cursor).
+ */
+const fetchTransferSongsPage = async (
+  jobId: string,
+  cursor?: string | null,
+): Promise<{
+  songs: TransferResultResponseProps["songs"];
+  nextCursor: string | null;
+}> => {
+  const params: Record<string, string | number> = {
+    limit: TRANSFER_SONGS_PAGE_SIZE,
+  };
+
+  if (cursor) {
+    params.cursor = cursor;
+  }
+
+  const page = (await api.get(`/transfer/${jobId}/songs`, { params })).data;
+
+  return { songs: page.songs.map(mapSong), nextCursor: page.next_cursor };
+};
+
+// The job's result is a summary (no songs): only the first page is read here, the
+// results view loads the next ones on demand
+const mapTransferResult = async (
+  jobId: string,
+  backendData: any,
+): Promise<TransferResultResponseProps> => {
+  const { songs, nextCursor } = await fetchTransferSongsPage(jobId);
+
+  return {
+    jobId,
+    playlistId: backendData.playlist_id,
+    playlistUrl: backendData.playlist_url,
+    totalSongs: backendData.total_songs,
+    transferredSongs: backendData.transferred_songs,
+    failedSongs: backendData.failed_songs,
+    songs,
+    nextCursor,
+    transferDuration: backendData.transfer_duration,
+    createdAt: backendData.created_at,
+  };
+};
+
+/**
+ * Follows a transfer job's Server-Sent Events until its "done" event.
+ * Resolves with the final job, or null if the stream failed before the end
+ * (the caller then falls back to polling).
+ */
+const followTransferEvents = (
+  jobId: string,
+  onProgress: (progress: TransferLiveProgressProps) => void,
+): Promise<any | null> =>
+  new Promise((resolve) => {
+    if (typeof EventSource === "undefined") {
+      resolve(null);
+
+      return;
+    }
+
+    const source = new EventSource(`${API_BASE_URL}/transfer/${jobId}/events`);
+    let live: TransferLiveProgressProps = {
+      stage: "queued",
+      totalVideos: 0,
+      uniqueVideos: 0,
+      processedVideos: 0,
+      matchedVideos: 0,
+      videosPerSecond: 0,
+    };
+
+    source.addEventListener("progress", (event) => {
+      const data = JSON.parse((event as MessageEvent).data);
+
+      live = {
+        ...live,
+        stage: data.stage,
+        totalVideos: data.total_videos,
+        uniqueVideos: data.unique_videos,
+        processedVideos: data.processed_videos,
+        matchedVideos: data.matched_videos,
+        videosPerSecond: data.videos_per_second,
+      };
+      onProgress(live);
+    });
+
+    source.addEventListener("song", (event) => {
+      const song = JSON.parse((event as MessageEvent).data);
+
+      live = {
+        ...live,
+        lastSong: { title: song.title, artist: song.artist, status: song.status },
+      };
+      onProgress(live);
+    });
+
+    source.addEventListener("done", (event) => {
+      source.close();
+      resolve(JSON.parse((event as MessageEvent).data));
+    });
+
+    source.onerror = () => {
+      console.warn("[transferAPI] - Event stream failed, polling instead");
+      source.close();
+      resolve(null);
+    };
+  });
+
 /**
  * Transfer API functions
  * These handle the actual playlist transfer logic and communicate with the backend.
  */
 export const transferAPI = {
-  // Direct transfer using POST with enhanced backend
+  // Starts a transfer job, then follows its events (or polls it) until the backend has the results
   directTransfer: async (
     data: PlaylistTransferRequestProps,
+    onProgress?: (progress: TransferLiveProgressProps) => void,
   ): Promise<TransferResultResponseProps> => {
     console.log("[transferAPI] - Sending transfer request:", data);
 
@@ -465,32 +595,34 @@ export const transferAPI = {
       description: data.description || "",
     });
 
-    console.log("[transferAPI] - Backend response:", response.data);
+    let job = response.data;
 
-    // Backend now returns the exact format we need!
-    const backendData = response.data;
+    console.log("[transferAPI] - Transfer job started:", job.job_id);
 
-    return {
-      playlistId: backendData.playlist_id,
-      playlistUrl: backendData.playlist_url,
-      totalSongs: backendData.total_songs,
-      transferredSongs: backendData.transferred_songs,
-      failedSongs: backendData.failed_songs,
-      songs: backendData.songs.map((song: any) => ({
-        id: song.id,
-        title: song.title,
-        artist: song.artist,
-        album: song.album,
-        thumbnail: song.thumbnail,
-        status: song.status,
-        spotifyUrl: song.spotify_url,
-        youtubeUrl: song.youtube_url,
-        error: song.error,
-      })),
-      transferDuration: backendData.transfer_duration,
-      createdAt: backendData.created_at,
-    };
+    if (onProgress) {
+      job = (await followTransferEvents(job.job_id, onProgress)) || job;
+    }
+
+    while (job.status === "queued" || job.status === "running") {
+      await sleep(TRANSFER_POLL_INTERVAL_MS);
+      job = (
+        await api.get(`/transfer/${job.job_id}`, {
+          params: { include_songs: false },
+        })
+      ).data;
+    }
+
+    console.log("[transferAPI] - Backend response:", job);
+
+    if (!job.result) {
+      throw new Error(job.error || "Transfer failed");
+    }
+
+    return mapTransferResult(job.job_id, job.result);
   },
+
+  // Loads the page of song results following `cursor` (see TransferResultResponseProps.nextCursor)
+  getSongsPage: fetchTransferSongsPage,
 };
 
 export default api;